@@ -0,0 +1,12 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmarks of Model hot paths: `load_protobuf`, `validate`, `to_protobuf` and
+`to_native`, measured for every message shape of the test protobuf file with
+raw protobuf parsing and serialization as the baseline.
+
+Run from the repository root::
+
+    python -m benchmarks run --size 100 --depth 8 --output before.json
+    python -m benchmarks run --size 100 --depth 8 --output after.json
+    python -m benchmarks compare before.json after.json
+"""
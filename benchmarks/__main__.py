@@ -0,0 +1,153 @@
+# -*- coding:utf-8 -*-
+"""
+Command line interface of the benchmarks, see `python -m benchmarks --help`.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.cases import get_cases
+from benchmarks.compare import compare, format_differences
+from benchmarks.memory import run_memory
+from benchmarks.runner import OPERATIONS, run
+from benchmarks.startup import run_startup
+
+
+def _report(result):
+    if 'error' in result:
+        status = result['error']
+    else:
+        status = f'{result["best"] * 1e6:10.2f}us  {result["ops_per_sec"]:12.0f} ops/s'
+
+    print(f'{result["case"]:<24} {result["operation"]:<22} {status}', file=sys.stderr)
+
+
+def _report_memory(result):
+    if 'error' in result:
+        status = result['error']
+    else:
+        status = f'{result["bytes_per_instance"]:10.0f} bytes'
+
+    print(f'{result["case"]:<24} {result["operation"]:<22} {status}', file=sys.stderr)
+
+
+def _dump(results, output):
+    if output:
+        with open(output, 'w') as fh:
+            json.dump(results, fh, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+def _run(args):
+    cases = get_cases(depth=args.depth, names=args.case)
+    results = run(
+        cases,
+        operations=args.operation,
+        size=args.size,
+        repeat=args.repeat,
+        number=args.number,
+        min_time=args.min_time,
+        report=_report,
+    )
+    results['parameters']['depth'] = args.depth
+    _dump(results, args.output)
+
+    return 0
+
+
+def _startup(args):
+    results = run_startup(
+        enum_sizes=args.enum_size or (10, 1000, 10000),
+        repeat=args.repeat,
+        number=args.number,
+        min_time=args.min_time,
+        report=_report,
+    )
+    _dump(results, args.output)
+
+    return 0
+
+
+def _memory(args):
+    results = run_memory(
+        get_cases(depth=args.depth, names=args.case),
+        size=args.size,
+        count=args.count,
+        report=_report_memory,
+    )
+    results['parameters']['depth'] = args.depth
+    _dump(results, args.output)
+
+    return 0
+
+
+def _compare(args):
+    with open(args.old) as fh:
+        old_run = json.load(fh)
+    with open(args.new) as fh:
+        new_run = json.load(fh)
+
+    differences = compare(old_run, new_run)
+    print(format_differences(differences, args.threshold))
+
+    regressions = [diff for diff in differences if diff.ratio and diff.ratio > 1 + args.threshold]
+
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks and output JSON results')
+    run_parser.add_argument('--case', action='append', help='case to run, may be repeated (default: all)')
+    run_parser.add_argument('--operation', action='append', choices=list(OPERATIONS),
+                            help='operation to run, may be repeated (default: all)')
+    run_parser.add_argument('--size', type=int, default=100, help='number of elements of repeated fields')
+    run_parser.add_argument('--depth', type=int, default=8, help='nesting depth of the depth_N case')
+    run_parser.add_argument('--repeat', type=int, default=5, help='number of timing repetitions')
+    run_parser.add_argument('--number', type=int, default=None,
+                            help='calls per repetition (default: estimated from --min-time)')
+    run_parser.add_argument('--min-time', type=float, default=0.05,
+                            help='minimal duration of a repetition in seconds, used to estimate --number')
+    run_parser.add_argument('--output', '-o', help='JSON output file (default: stdout)')
+    run_parser.set_defaults(func=_run)
+
+    startup_parser = subparsers.add_parser('startup', help='run class creation benchmarks and output JSON results')
+    startup_parser.add_argument('--enum-size', type=int, action='append',
+                                help='number of enum members, may be repeated (default: 10, 1000, 10000)')
+    startup_parser.add_argument('--repeat', type=int, default=5, help='number of timing repetitions')
+    startup_parser.add_argument('--number', type=int, default=None,
+                                help='calls per repetition (default: estimated from --min-time)')
+    startup_parser.add_argument('--min-time', type=float, default=0.05,
+                                help='minimal duration of a repetition in seconds, used to estimate --number')
+    startup_parser.add_argument('--output', '-o', help='JSON output file (default: stdout)')
+    startup_parser.set_defaults(func=_startup)
+
+    memory_parser = subparsers.add_parser('memory', help='measure bytes per loaded instance and output JSON results')
+    memory_parser.add_argument('--case', action='append', help='case to run, may be repeated (default: all)')
+    memory_parser.add_argument('--size', type=int, default=10, help='number of elements of repeated fields')
+    memory_parser.add_argument('--depth', type=int, default=8, help='nesting depth of the depth_N case')
+    memory_parser.add_argument('--count', type=int, default=1000, help='number of instances kept alive')
+    memory_parser.add_argument('--output', '-o', help='JSON output file (default: stdout)')
+    memory_parser.set_defaults(func=_memory)
+
+    compare_parser = subparsers.add_parser('compare', help='compare two JSON results')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='relative change reported as significant (default: 0.1)')
+    compare_parser.add_argument('--fail-on-regression', action='store_true',
+                                help='exit with status 1 if any operation got slower than threshold')
+    compare_parser.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+# -*- coding:utf-8 -*-
+"""
+Benchmark cases: pairs of Model classes and factories of populated protobuf
+messages, one for every message shape of the test protobuf file.
+"""
+import types as pytypes
+from functools import lru_cache
+from typing import Callable, NamedTuple, Type
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from schematics.types import BaseType, BooleanType, FloatType, IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+
+__all__ = ['Case', 'get_cases', 'make_depth_case']
+
+
+class Case(NamedTuple):
+    """
+    Single benchmarked message shape. `make_message` takes the size of
+    repeated fields and returns a populated message.
+    """
+    name: str
+    model_class: Type[Model]
+    make_message: Callable
+
+
+##########################################
+#  Models                                #
+##########################################
+
+class BenchEnum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+class NestedModel(Model, protobuf_message=pb2.Nested):
+    class InnerModel(Model, protobuf_message=pb2.Nested.Inner):
+        value = StringType()
+
+    inner = types.MessageType(InnerModel)
+    other = StringType()
+
+
+class TimestampModel(Model, protobuf_message=pb2.Timestamp):
+    value = types.TimestampType()
+
+
+class RepeatedTimestampModel(Model, protobuf_message=pb2.RepeatedTimestamp):
+    value = types.RepeatedType(types.TimestampType())
+
+
+class OneOfTimestampModel(Model, protobuf_message=pb2.OneOfTimestamp):
+    inner = types.OneOfType(variants_spec={
+        'value1': types.StringWrapperType(),
+        'value2': types.TimestampType(),
+    })
+
+
+class RepeatedPrimitiveModel(Model, protobuf_message=pb2.RepeatedPrimitive):
+    value = types.RepeatedType(StringType())
+
+
+class RepeatedNestedModel(Model, protobuf_message=pb2.RepeatedNested):
+    class InnerModel(Model, protobuf_message=pb2.RepeatedNested.Inner):
+        value = StringType()
+
+    inner = types.RepeatedType(types.MessageType(InnerModel))
+
+
+class RepeatedWrappedModel(Model, protobuf_message=pb2.RepeatedWrapped):
+    value = types.RepeatedType(types.IntWrapperType())
+
+
+class OneOfPrimitiveModel(Model, protobuf_message=pb2.OneOfPrimitive):
+    inner = types.OneOfType(variants_spec={
+        'value1': IntType(),
+        'value2': StringType(),
+    })
+
+
+class OneOfNestedModel(Model, protobuf_message=pb2.OneOfNested):
+    class InnerModel(Model, protobuf_message=pb2.OneOfNested.Inner):
+        value = StringType()
+
+    inner = types.OneOfType(variants_spec={
+        'value1': types.MessageType(InnerModel),
+        'value2': types.StringWrapperType(),
+    })
+
+
+class SimpleEnumModel(Model, protobuf_message=pb2.SimpleEnum):
+    value = types.EnumType(BenchEnum)
+
+
+class RepeatedEnumModel(Model, protobuf_message=pb2.RepeatedEnum):
+    value = types.RepeatedType(types.EnumType(BenchEnum))
+
+
+class OneOfEnumModel(Model, protobuf_message=pb2.OneOfEnum):
+    inner = types.OneOfType(variants_spec={
+        'value1': types.StringWrapperType(),
+        'value2': types.EnumType(BenchEnum),
+    })
+
+
+def _make_model(message_class, **fields):
+    return pytypes.new_class(
+        f'{message_class.__name__}Model',
+        (Model,),
+        {'protobuf_message': message_class},
+        lambda ns: ns.update(fields, __module__=__name__),
+    )
+
+
+##########################################
+#  Message factories                     #
+##########################################
+
+def _make_nested(_):
+    return pb2.Nested(inner=pb2.Nested.Inner(value='inner value'), other='other value')
+
+
+def _make_timestamp(_):
+    msg = pb2.Timestamp()
+    msg.value.seconds = 1585736645
+    msg.value.nanos = 123456789
+
+    return msg
+
+
+def _make_repeated_timestamp(size):
+    msg = pb2.RepeatedTimestamp()
+
+    for idx in range(size):
+        item = msg.value.add()
+        item.seconds = 1585736645 + idx
+        item.nanos = idx * 1000
+
+    return msg
+
+
+def _make_oneof_timestamp(_):
+    msg = pb2.OneOfTimestamp()
+    msg.value2.seconds = 1585736645
+
+    return msg
+
+
+def _make_repeated_primitive(size):
+    return pb2.RepeatedPrimitive(value=[f'value {idx}' for idx in range(size)])
+
+
+def _make_repeated_nested(size):
+    return pb2.RepeatedNested(inner=[pb2.RepeatedNested.Inner(value=f'value {idx}') for idx in range(size)])
+
+
+def _make_repeated_wrapped(size):
+    msg = pb2.RepeatedWrapped()
+
+    for idx in range(size):
+        msg.value.add().value = idx
+
+    return msg
+
+
+def _make_oneof_primitive(_):
+    return pb2.OneOfPrimitive(value2='value')
+
+
+def _make_oneof_nested(_):
+    return pb2.OneOfNested(value1=pb2.OneOfNested.Inner(value='value'))
+
+
+def _make_simple_enum(_):
+    return pb2.SimpleEnum(value=pb2.SECOND)
+
+
+def _make_repeated_enum(size):
+    return pb2.RepeatedEnum(value=[idx % 3 for idx in range(size)])
+
+
+def _make_oneof_enum(_):
+    return pb2.OneOfEnum(value2=pb2.FIRST)
+
+
+def _value_factory(message_class, value):
+    return lambda _: message_class(value=value)
+
+
+def _wrapped_factory(message_class, value):
+    def make_message(_):
+        msg = message_class()
+        msg.wrapped.value = value
+
+        return msg
+
+    return make_message
+
+
+##########################################
+#  Cases                                 #
+##########################################
+
+_PRIMITIVES = [
+    ('double', pb2.Double, FloatType, 3.14),
+    ('float', pb2.Float, FloatType, 2.5),
+    ('int64', pb2.Int64, IntType, -2 ** 40),
+    ('uint64', pb2.UInt64, IntType, 2 ** 40),
+    ('int32', pb2.Int32, IntType, -2 ** 20),
+    ('uint32', pb2.UInt32, IntType, 2 ** 20),
+    ('bool', pb2.Bool, BooleanType, True),
+    ('string', pb2.String, StringType, 'value'),
+    ('bytes', pb2.Bytes, BaseType, b'value'),
+]
+
+_WRAPPERS = [
+    ('double', pb2.WrappedDouble, types.FloatWrapperType, 3.14),
+    ('float', pb2.WrappedFloat, types.FloatWrapperType, 2.5),
+    ('int64', pb2.WrappedInt64, types.IntWrapperType, -2 ** 40),
+    ('uint64', pb2.WrappedUInt64, types.IntWrapperType, 2 ** 40),
+    ('int32', pb2.WrappedInt32, types.IntWrapperType, -2 ** 20),
+    ('uint32', pb2.WrappedUInt32, types.IntWrapperType, 2 ** 20),
+    ('bool', pb2.WrappedBool, types.BoolWrapperType, True),
+    ('string', pb2.WrappedString, types.StringWrapperType, 'value'),
+    ('bytes', pb2.WrappedBytes, types.BytesWrapperType, b'value'),
+]
+
+
+@lru_cache(maxsize=None)
+def _static_cases():
+    cases = [
+        Case('nested', NestedModel, _make_nested),
+        Case('timestamp', TimestampModel, _make_timestamp),
+        Case('repeated_timestamp', RepeatedTimestampModel, _make_repeated_timestamp),
+        Case('oneof_timestamp', OneOfTimestampModel, _make_oneof_timestamp),
+        Case('repeated_primitive', RepeatedPrimitiveModel, _make_repeated_primitive),
+        Case('repeated_nested', RepeatedNestedModel, _make_repeated_nested),
+        Case('repeated_wrapped', RepeatedWrappedModel, _make_repeated_wrapped),
+        Case('oneof_primitive', OneOfPrimitiveModel, _make_oneof_primitive),
+        Case('oneof_nested', OneOfNestedModel, _make_oneof_nested),
+        Case('simple_enum', SimpleEnumModel, _make_simple_enum),
+        Case('repeated_enum', RepeatedEnumModel, _make_repeated_enum),
+        Case('oneof_enum', OneOfEnumModel, _make_oneof_enum),
+    ]
+
+    for name, message_class, field_class, value in _PRIMITIVES:
+        cases.append(Case(
+            f'primitive_{name}',
+            _make_model(message_class, value=field_class()),
+            _value_factory(message_class, value),
+        ))
+
+    for name, message_class, field_class, value in _WRAPPERS:
+        cases.append(Case(
+            f'wrapped_{name}',
+            _make_model(message_class, wrapped=field_class()),
+            _wrapped_factory(message_class, value),
+        ))
+
+    return tuple(cases)
+
+
+@lru_cache(maxsize=None)
+def _depth_message_classes(depth):
+    """
+    Build message classes `Level0` ... `Level<depth>`, each level holding
+    a string and a message of the level below.
+    """
+    package = f'schematics_proto3.benchmarks.depth{depth}'
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f'schematics_proto3/benchmarks/depth{depth}.proto',
+        package=package,
+        syntax='proto3',
+    )
+
+    for level in range(depth + 1):
+        message_proto = file_proto.message_type.add(name=f'Level{level}')
+        message_proto.field.add(
+            name='value',
+            number=1,
+            type=descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+
+        if level:
+            message_proto.field.add(
+                name='child',
+                number=2,
+                type=descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE,
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+                type_name=f'.{package}.Level{level - 1}',
+            )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    if hasattr(message_factory, 'GetMessageClass'):
+        get_message_class = message_factory.GetMessageClass
+    else:
+        get_message_class = message_factory.MessageFactory(pool).GetPrototype
+
+    return [
+        get_message_class(pool.FindMessageTypeByName(f'{package}.Level{level}'))
+        for level in range(depth + 1)
+    ]
+
+
+@lru_cache(maxsize=None)
+def make_depth_case(depth):
+    """
+    Return case of messages nested `depth` levels deep.
+    """
+    message_classes = _depth_message_classes(depth)
+    model_class = None
+
+    for level, message_class in enumerate(message_classes):
+        attrs = {'value': StringType()}
+        if model_class is not None:
+            attrs['child'] = types.MessageType(model_class)
+
+        model_class = _make_model(message_class, **attrs)
+
+    def make_message(_):
+        msg = message_classes[-1]()
+        level_msg = msg
+
+        for level in range(depth, -1, -1):
+            level_msg.value = f'level {level}'
+            if level:
+                level_msg = level_msg.child
+
+        return msg
+
+    return Case(f'depth_{depth}', model_class, make_message)
+
+
+def get_cases(depth=None, names=None):
+    """
+    Return benchmark cases, optionally including the nested messages case of
+    given `depth` and filtered by case `names`.
+    """
+    cases = list(_static_cases())
+
+    if depth is not None:
+        cases.append(make_depth_case(depth))
+
+    if names:
+        cases = [case for case in cases if case.name in names]
+
+    return cases
@@ -0,0 +1,77 @@
+# -*- coding:utf-8 -*-
+"""
+Comparison of two benchmark runs.
+"""
+from typing import NamedTuple, Optional
+
+__all__ = ['Difference', 'compare', 'format_differences']
+
+
+class Difference(NamedTuple):
+    """
+    Timings of a single (case, operation) pair in two runs. `ratio` is new
+    time divided by old time, so values above 1 mean a slowdown.
+    """
+    case: str
+    operation: str
+    old: Optional[float]
+    new: Optional[float]
+    ratio: Optional[float]
+
+
+def _index(run):
+    return {
+        (result['case'], result['operation']): result.get('best')
+        for result in run['results']
+    }
+
+
+def compare(old_run, new_run):
+    """
+    Pair results of two runs, keeping order of the new run.
+    """
+    old = _index(old_run)
+    new = _index(new_run)
+    keys = list(new) + [key for key in old if key not in new]
+    differences = []
+
+    for key in keys:
+        old_time = old.get(key)
+        new_time = new.get(key)
+        ratio = new_time / old_time if old_time and new_time else None
+        differences.append(Difference(key[0], key[1], old_time, new_time, ratio))
+
+    return differences
+
+
+def _format_time(value):
+    if value is None:
+        return '-'
+
+    return f'{value * 1e6:.2f}us'
+
+
+def format_differences(differences, threshold):
+    """
+    Render differences as a text table, marking changes above `threshold`
+    (relative, e.g. 0.1 for 10%).
+    """
+    lines = [f'{"case":<24} {"operation":<22} {"old":>12} {"new":>12} {"change":>9}']
+
+    for diff in differences:
+        if diff.ratio is None:
+            change = 'n/a'
+        else:
+            change = f'{(diff.ratio - 1) * 100:+.1f}%'
+
+            if diff.ratio > 1 + threshold:
+                change += ' !'
+            elif diff.ratio < 1 - threshold:
+                change += ' *'
+
+        lines.append(
+            f'{diff.case:<24} {diff.operation:<22} '
+            f'{_format_time(diff.old):>12} {_format_time(diff.new):>12} {change:>9}'
+        )
+
+    return '\n'.join(lines)
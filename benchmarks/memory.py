@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+"""
+Memory benchmarks: bytes taken by a loaded instance, as a Model, as a compact
+record and, for reference, as a parsed protobuf message.
+"""
+import copy
+import gc
+import sys
+import tracemalloc
+import types as pytypes
+
+from benchmarks.runner import environment
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+
+__all__ = ['MEMORY_OPERATIONS', 'make_compact_model', 'measure_memory', 'run_memory']
+
+
+def make_compact_model(model_class, _cache=None):
+    """
+    Build a compact twin of `model_class`, with compact twins of Models of
+    nested message fields as well.
+    """
+    cache = {} if _cache is None else _cache
+
+    if model_class in cache:
+        return cache[model_class]
+
+    fields = {}
+
+    # pylint: disable=protected-access
+    for name, field in model_class._schema.fields.items():
+        if isinstance(field, types.MessageType):
+            field = types.MessageType(make_compact_model(field.model_class, cache))
+        elif isinstance(field, types.RepeatedType) and isinstance(field.field, types.MessageType):
+            field = types.RepeatedType(types.MessageType(make_compact_model(field.field.model_class, cache)))
+        else:
+            # Fields are bound to the Model they are declared in.
+            field = copy.copy(field)
+
+        fields[name] = field
+
+    compact_model = cache[model_class] = pytypes.new_class(
+        model_class.__name__,
+        (Model,),
+        {'protobuf_message': model_class.protobuf_options.message_class, 'compact': True},
+        lambda ns: ns.update(fields, __module__=__name__),
+    )
+
+    return compact_model
+
+
+def measure_memory(func, count):
+    """
+    Return average number of bytes allocated by a `func` call, for objects
+    still alive after `count` calls.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [func() for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(objects)
+    finally:
+        tracemalloc.stop()
+
+    del objects
+
+    return allocated / count
+
+
+def _op_message(model_class, compact_class, data):  # pylint: disable=unused-argument
+    from_string = model_class.protobuf_options.message_class.FromString
+
+    return lambda: from_string(data)
+
+
+def _op_model(model_class, compact_class, data):  # pylint: disable=unused-argument
+    msg = model_class.protobuf_options.message_class.FromString(data)
+
+    return lambda: model_class.load_protobuf(msg, trusted=True)
+
+
+def _op_compact(model_class, compact_class, data):  # pylint: disable=unused-argument
+    msg = model_class.protobuf_options.message_class.FromString(data)
+
+    return lambda: compact_class.load_compact(msg, trusted=True)
+
+
+# Operation name to factory of a no-argument callable which returns an
+# instance to be measured.
+MEMORY_OPERATIONS = {
+    'message': _op_message,
+    'model': _op_model,
+    'compact': _op_compact,
+}
+
+
+def run_memory(cases, size=10, count=1000, report=None):
+    """
+    Measure bytes per instance of every case, loaded as a Model and as a
+    compact record. Results have the layout of `benchmarks.runner.run` ones,
+    with `bytes_per_instance` instead of timings.
+    """
+    results = []
+
+    for case in cases:
+        data = case.make_message(size).SerializeToString()
+
+        for operation, factory in MEMORY_OPERATIONS.items():
+            result = {
+                'case': case.name,
+                'operation': operation,
+                'size': size,
+                'message_bytes': len(data),
+            }
+
+            try:
+                func = factory(case.model_class, make_compact_model(case.model_class), data)
+                func()
+                result['bytes_per_instance'] = measure_memory(func, count)
+            except Exception as ex:  # pylint: disable=broad-except
+                result['error'] = f'{type(ex).__name__}: {ex}'
+
+            results.append(result)
+
+            if report is not None:
+                report(result)
+
+    return {
+        'environment': environment(),
+        'parameters': {
+            'size': size,
+            'count': count,
+        },
+        'results': results,
+    }
@@ -0,0 +1,188 @@
+# -*- coding:utf-8 -*-
+"""
+Timing of benchmark operations and collection of results.
+"""
+import platform
+import statistics
+import timeit
+
+import google.protobuf
+import schematics
+from google.protobuf.internal import api_implementation
+
+__all__ = ['OPERATIONS', 'run']
+
+
+def _op_parse(case, msg, data):  # pylint: disable=unused-argument
+    message_class = type(msg)
+
+    def parse():
+        message_class().ParseFromString(data)
+
+    return parse
+
+
+def _op_serialize(case, msg, data):  # pylint: disable=unused-argument
+    return msg.SerializeToString
+
+
+def _op_load_protobuf(case, msg, data):  # pylint: disable=unused-argument
+    load_protobuf = case.model_class.load_protobuf
+
+    return lambda: load_protobuf(msg)
+
+
+def _op_load_protobuf_trusted(case, msg, data):  # pylint: disable=unused-argument
+    load_protobuf = case.model_class.load_protobuf
+
+    return lambda: load_protobuf(msg, trusted=True)
+
+
+def _op_from_bytes(case, msg, data):  # pylint: disable=unused-argument
+    from_bytes = case.model_class.from_bytes
+
+    return lambda: from_bytes(data)
+
+
+def _op_decode(case, msg, data):  # pylint: disable=unused-argument
+    decode = case.model_class.decode
+
+    return lambda: decode(data)
+
+
+def _op_validate(case, msg, data):  # pylint: disable=unused-argument
+    return case.model_class.load_protobuf(msg).validate
+
+
+def _op_to_protobuf(case, msg, data):  # pylint: disable=unused-argument
+    return case.model_class.load_protobuf(msg).to_protobuf
+
+
+def _op_to_bytes(case, msg, data):  # pylint: disable=unused-argument
+    return case.model_class.load_protobuf(msg).to_bytes
+
+
+def _op_to_bytes_reuse(case, msg, data):  # pylint: disable=unused-argument
+    to_bytes = case.model_class.load_protobuf(msg).to_bytes
+
+    return lambda: to_bytes(reuse_message=True)
+
+
+def _op_to_native(case, msg, data):  # pylint: disable=unused-argument
+    return case.model_class.load_protobuf(msg).to_native
+
+
+# Operation name to factory of a no-argument callable which is timed. Raw
+# protobuf operations are the baseline.
+OPERATIONS = {
+    'parse': _op_parse,
+    'serialize': _op_serialize,
+    'load_protobuf': _op_load_protobuf,
+    'load_protobuf_trusted': _op_load_protobuf_trusted,
+    'from_bytes': _op_from_bytes,
+    'decode': _op_decode,
+    'validate': _op_validate,
+    'to_protobuf': _op_to_protobuf,
+    'to_bytes': _op_to_bytes,
+    'to_bytes_reuse': _op_to_bytes_reuse,
+    'to_native': _op_to_native,
+}
+
+
+def _autorange(func, min_time):
+    """
+    Return number of calls of `func` which take at least `min_time` seconds.
+    """
+    number = 1
+
+    while True:
+        if timeit.timeit(func, number=number) >= min_time:
+            return number
+        number *= 2
+
+
+def measure(func, repeat=5, number=None, min_time=0.05):
+    """
+    Time `func` `repeat` times, `number` calls each (estimated from `min_time`
+    if not given) and return per-call statistics in seconds.
+    """
+    if number is None:
+        number = _autorange(func, min_time)
+
+    timings = [
+        elapsed / number
+        for elapsed in timeit.repeat(func, repeat=repeat, number=number)
+    ]
+    best = min(timings)
+
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best': best,
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'ops_per_sec': 1 / best if best else None,
+    }
+
+
+def environment():
+    """
+    Describe environment the benchmarks are run in.
+    """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'protobuf': google.protobuf.__version__,
+        'protobuf_implementation': api_implementation.Type(),
+        'schematics': schematics.__version__,
+    }
+
+
+def run(cases, operations=None, size=100, repeat=5, number=None, min_time=0.05, report=None):
+    """
+    Run `operations` (all by default) on every case and return results.
+
+    `size` is the number of elements of repeated fields. Operations failing
+    for a case are recorded with an error instead of timings. `report` is
+    called with every single result once it is available.
+    """
+    operations = operations or list(OPERATIONS)
+    results = []
+
+    for case in cases:
+        msg = case.make_message(size)
+        data = msg.SerializeToString()
+
+        for operation in operations:
+            result = {
+                'case': case.name,
+                'operation': operation,
+                'size': size,
+                'message_bytes': len(data),
+            }
+
+            try:
+                func = OPERATIONS[operation](case, msg, data)
+                # Warm up and make sure operation works for the case at all.
+                func()
+                result.update(measure(func, repeat=repeat, number=number, min_time=min_time))
+            except Exception as ex:  # pylint: disable=broad-except
+                result['error'] = f'{type(ex).__name__}: {ex}'
+
+            results.append(result)
+
+            if report is not None:
+                report(result)
+
+    return {
+        'environment': environment(),
+        'parameters': {
+            'size': size,
+            'repeat': repeat,
+            'number': number,
+            'min_time': min_time,
+        },
+        'results': results,
+    }
@@ -0,0 +1,75 @@
+# -*- coding:utf-8 -*-
+"""
+Startup benchmarks: creation of ProtobufEnum classes, which is paid at import
+time of modules declaring them.
+"""
+from google.protobuf import descriptor_pb2, descriptor_pool
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+
+from benchmarks.runner import environment, measure
+from schematics_proto3.enum import ProtobufEnum
+
+__all__ = ['make_protobuf_enum', 'run_startup']
+
+
+def make_protobuf_enum(size):
+    """
+    Build protobuf enum of `size` values.
+    """
+    package = f'schematics_proto3.benchmarks.enum{size}'
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f'schematics_proto3/benchmarks/enum{size}.proto',
+        package=package,
+        syntax='proto3',
+    )
+    enum_proto = file_proto.enum_type.add(name='Large')
+
+    for number in range(size):
+        enum_proto.value.add(name=f'VALUE_{number}', number=number)
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    return EnumTypeWrapper(pool.FindEnumTypeByName(f'{package}.Large'))
+
+
+def _create_enum(protobuf_enum):
+    def create():
+        class Enum(ProtobufEnum, protobuf_enum=protobuf_enum):  # pylint: disable=unused-variable
+            pass
+
+    return create
+
+
+def run_startup(enum_sizes=(10, 1000, 10000), repeat=5, number=None, min_time=0.05, report=None):
+    """
+    Time creation of ProtobufEnum classes of `enum_sizes` members. Results
+    have the same layout as those of `benchmarks.runner.run`.
+    """
+    results = []
+    jobs = [(f'enum_{size}', _create_enum(make_protobuf_enum(size))) for size in enum_sizes]
+
+    for name, func in jobs:
+        result = {'case': name, 'operation': 'create_class'}
+
+        try:
+            func()
+            result.update(measure(func, repeat=repeat, number=number, min_time=min_time))
+        except Exception as ex:  # pylint: disable=broad-except
+            result['error'] = f'{type(ex).__name__}: {ex}'
+
+        results.append(result)
+
+        if report is not None:
+            report(result)
+
+    return {
+        'environment': environment(),
+        'parameters': {
+            'enum_sizes': list(enum_sizes),
+            'repeat': repeat,
+            'number': number,
+            'min_time': min_time,
+        },
+        'results': results,
+    }
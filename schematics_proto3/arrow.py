@@ -0,0 +1,311 @@
+# -*- coding:utf-8 -*-
+"""
+Columnar export of Model instances to Apache Arrow (and pandas).
+
+Columns are built straight from Model values, field by field, without going
+through `to_native` of every instance. Arrow types are derived from Model
+fields and the protobuf message they are loaded from:
+
+ * scalars and wrappers map to columns of matching type, Unset and None map
+   to nulls,
+ * enums map to dictionary encoded columns of member names,
+ * nested messages map to struct columns,
+ * repeated fields map to list columns,
+ * timestamps and durations map to timestamp and duration columns,
+ * oneofs map to struct columns with the `variant` name and a column for
+   every variant.
+"""
+from google.protobuf.descriptor import FieldDescriptor
+from schematics.types import BaseType, BooleanType, FloatType, IntType, StringType
+
+from schematics_proto3.types import DurationType, EnumType, MessageType, OneOfType, RepeatedType, TimestampType
+from schematics_proto3.types.wrappers import BytesWrapperType
+from schematics_proto3.unset import Unset
+from schematics_proto3.utils import import_numpy
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+__all__ = ['arrow_schema', 'to_arrow', 'to_record_batch', 'to_pandas']
+
+
+_SCALAR_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: 'float64',
+    FieldDescriptor.TYPE_FLOAT: 'float32',
+    FieldDescriptor.TYPE_INT64: 'int64',
+    FieldDescriptor.TYPE_SINT64: 'int64',
+    FieldDescriptor.TYPE_SFIXED64: 'int64',
+    FieldDescriptor.TYPE_UINT64: 'uint64',
+    FieldDescriptor.TYPE_FIXED64: 'uint64',
+    FieldDescriptor.TYPE_INT32: 'int32',
+    FieldDescriptor.TYPE_SINT32: 'int32',
+    FieldDescriptor.TYPE_SFIXED32: 'int32',
+    FieldDescriptor.TYPE_UINT32: 'uint32',
+    FieldDescriptor.TYPE_FIXED32: 'uint32',
+    FieldDescriptor.TYPE_BOOL: 'bool_',
+    FieldDescriptor.TYPE_STRING: 'string',
+    FieldDescriptor.TYPE_BYTES: 'binary',
+}
+
+# Arrow types of fields not found in protobuf message, by field class.
+_FIELD_TYPES = (
+    (BooleanType, 'bool_'),
+    (IntType, 'int64'),
+    (FloatType, 'float64'),
+    (StringType, 'string'),
+    (BytesWrapperType, 'binary'),
+)
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise RuntimeError('Arrow export requires pyarrow to be installed.')
+
+
+def _scalar_type(field: BaseType, field_descriptor):
+    if field_descriptor is not None:
+        if field_descriptor.type == FieldDescriptor.TYPE_MESSAGE:
+            # Well known wrapper, type of its `value` field.
+            field_descriptor = field_descriptor.message_type.fields_by_name.get('value')
+
+        if field_descriptor is not None and field_descriptor.type in _SCALAR_TYPES:
+            return getattr(pyarrow, _SCALAR_TYPES[field_descriptor.type])()
+
+    for field_class, type_name in _FIELD_TYPES:
+        if isinstance(field, field_class):
+            return getattr(pyarrow, type_name)()
+
+    raise TypeError(f'Cannot derive Arrow type of {type(field).__name__}.')
+
+
+def _oneof_type(field: OneOfType, message_descriptor, pb_name):
+    variants_descriptors = {}
+    oneof_descriptor = message_descriptor.oneofs_by_name.get(pb_name) if message_descriptor else None
+
+    if oneof_descriptor is not None:
+        variants_descriptors = {descriptor.name: descriptor for descriptor in oneof_descriptor.fields}
+
+    arrow_fields = [pyarrow.field('variant', pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))]
+
+    for name, variant_field in field.variants_spec.items():
+        variant = field.get_variant(name)
+        arrow_fields.append(pyarrow.field(
+            name,
+            _arrow_type(variant_field, variants_descriptors.get(variant.protobuf_name)),
+        ))
+
+    return pyarrow.struct(arrow_fields)
+
+
+def _list_type(field: RepeatedType, field_descriptor, unit):
+    # pylint: disable=unused-argument
+    if field.as_array and isinstance(field.field, (TimestampType, DurationType)):
+        # Arrays keep nanoseconds.
+        return pyarrow.list_(_arrow_type(field.field, field_descriptor, unit='ns'))
+
+    return pyarrow.list_(_arrow_type(field.field, field_descriptor))
+
+
+def _enum_type(field: EnumType, field_descriptor, unit):
+    # pylint: disable=unused-argument
+    return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+
+def _struct_type(field: MessageType, field_descriptor, unit):
+    # pylint: disable=unused-argument
+    return pyarrow.struct(_schema_fields(field.model_class))
+
+
+def _timestamp_type(field: TimestampType, field_descriptor, unit):
+    # pylint: disable=unused-argument
+    return pyarrow.timestamp(unit or ('ns' if field.as_nanos else 'us'), tz='UTC')
+
+
+def _duration_type(field: DurationType, field_descriptor, unit):
+    # pylint: disable=unused-argument
+    return pyarrow.duration(unit or ('ns' if field.as_nanos else 'us'))
+
+
+# Builders of Arrow types of fields which are not scalars, by field class.
+_TYPE_BUILDERS = (
+    (RepeatedType, _list_type),
+    (EnumType, _enum_type),
+    (MessageType, _struct_type),
+    (TimestampType, _timestamp_type),
+    (DurationType, _duration_type),
+)
+
+
+def _arrow_type(field: BaseType, field_descriptor, unit=None):
+    for field_class, build in _TYPE_BUILDERS:
+        if isinstance(field, field_class):
+            return build(field, field_descriptor, unit)
+
+    return _scalar_type(field, field_descriptor)
+
+
+def _schema_fields(model_class):
+    # pylint: disable=protected-access
+    message_descriptor = model_class.protobuf_options.message_class.DESCRIPTOR
+    arrow_fields = []
+
+    for name, field in model_class._schema.fields.items():
+        pb_name = field.metadata.get('protobuf_field', name)
+
+        if isinstance(field, OneOfType):
+            arrow_type = _oneof_type(field, message_descriptor, pb_name)
+        else:
+            arrow_type = _arrow_type(field, message_descriptor.fields_by_name.get(pb_name))
+
+        arrow_fields.append(pyarrow.field(name, arrow_type))
+
+    return arrow_fields
+
+
+def arrow_schema(model_class):
+    """
+    Return `pyarrow.Schema` of columns of `model_class` instances.
+    """
+    _require_pyarrow()
+
+    return pyarrow.schema(_schema_fields(model_class))
+
+
+def _null(value):
+    return value is None or value is Unset
+
+
+def _enum_array(field: EnumType, values):
+    members = list(field.enum_class)
+    indices = {member: idx for idx, member in enumerate(members)}
+
+    return pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array([None if _null(value) else indices[value] for value in values], type=pyarrow.int32()),
+        pyarrow.array([member.name for member in members], type=pyarrow.string()),
+    )
+
+
+def _list_array(field: RepeatedType, values, arrow_type):
+    offsets = [0]
+    chunks = []
+    mask = []
+
+    for value in values:
+        is_null = _null(value)
+        mask.append(is_null)
+
+        if not is_null:
+            chunks.append(value)
+
+        offsets.append(offsets[-1] + (0 if is_null else len(value)))
+
+    if field.as_array:
+        # Items of NumPy arrays are converted in bulk.
+        numpy = import_numpy()
+        array = numpy.concatenate(chunks) if chunks else numpy.array([], dtype=field.array_dtype)
+        items = pyarrow.array(array).cast(arrow_type.value_type)
+    else:
+        items = _build_array(field.field, [item for chunk in chunks for item in chunk], arrow_type.value_type)
+
+    return pyarrow.ListArray.from_arrays(
+        pyarrow.array(offsets, type=pyarrow.int32()),
+        items,
+        mask=pyarrow.array(mask, type=pyarrow.bool_()),
+    )
+
+
+def _struct_array(model_class, values, arrow_type):
+    children = []
+
+    for arrow_field in arrow_type:
+        field = model_class._schema.fields[arrow_field.name]  # pylint: disable=protected-access
+        children.append(_build_array(
+            field,
+            [None if _null(value) else getattr(value, arrow_field.name) for value in values],
+            arrow_field.type,
+        ))
+
+    return pyarrow.StructArray.from_arrays(
+        children,
+        fields=list(arrow_type),
+        mask=pyarrow.array([_null(value) for value in values], type=pyarrow.bool_()),
+    )
+
+
+def _oneof_array(field: OneOfType, values, arrow_type):
+    variant_names = list(field.variants_spec)
+    indices = {name: idx for idx, name in enumerate(variant_names)}
+    children = [pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array([None if _null(value) else indices[value.variant] for value in values], type=pyarrow.int32()),
+        pyarrow.array(variant_names, type=pyarrow.string()),
+    )]
+
+    for arrow_field in list(arrow_type)[1:]:
+        name = arrow_field.name
+        children.append(_build_array(
+            field.variants_spec[name],
+            [value.value if not _null(value) and value.variant == name else None for value in values],
+            arrow_field.type,
+        ))
+
+    return pyarrow.StructArray.from_arrays(
+        children,
+        fields=list(arrow_type),
+        mask=pyarrow.array([_null(value) for value in values], type=pyarrow.bool_()),
+    )
+
+
+def _build_array(field, values, arrow_type):
+    if isinstance(field, RepeatedType):
+        return _list_array(field, values, arrow_type)
+
+    if isinstance(field, EnumType):
+        return _enum_array(field, values)
+
+    if isinstance(field, MessageType):
+        return _struct_array(field.model_class, values, arrow_type)
+
+    if isinstance(field, OneOfType):
+        return _oneof_array(field, values, arrow_type)
+
+    return pyarrow.array([None if _null(value) else value for value in values], type=arrow_type)
+
+
+def to_record_batch(models, model_class=None):
+    """
+    Build `pyarrow.RecordBatch` of `models`, all instances of `model_class`.
+    `model_class` defaults to the class of the first model.
+    """
+    _require_pyarrow()
+    models = list(models)
+
+    if model_class is None:
+        if not models:
+            raise ValueError('model_class has to be given for an empty list of models.')
+        model_class = type(models[0])
+
+    schema = arrow_schema(model_class)
+    fields = model_class._schema.fields  # pylint: disable=protected-access
+    columns = [
+        _build_array(fields[arrow_field.name], [getattr(model, arrow_field.name) for model in models], arrow_field.type)
+        for arrow_field in schema
+    ]
+
+    return pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def to_arrow(models, model_class=None):
+    """
+    Build `pyarrow.Table` of `models`, see `to_record_batch`.
+    """
+    return pyarrow.Table.from_batches([to_record_batch(models, model_class)])
+
+
+def to_pandas(models, model_class=None, **kwargs):
+    """
+    Build `pandas.DataFrame` of `models`, see `to_record_batch`. Keyword
+    arguments are passed to `pyarrow.Table.to_pandas`.
+    """
+    return to_arrow(models, model_class).to_pandas(**kwargs)
@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+"""
+Generation of specialised, straight-line loader functions for Model classes.
+
+Instead of iterating over a load plan, a generated loader reads every field
+of a protobuf message with a dedicated statement, checks presence with
+`HasField` where protobuf tracks it and inlines `Unset` handling for
+built-in field types.
+"""
+import keyword
+import linecache
+
+from schematics_proto3.plan import PRESENCE_MESSAGE, PRESENCE_REPEATED, PRESENCE_SCALAR
+from schematics_proto3.types import DurationType, EnumType, MessageType, TimestampType
+from schematics_proto3.types.wrappers import WrapperTypeMixin
+from schematics_proto3.unset import Unset
+from schematics_proto3.utils import get_value_fallback
+
+__all__ = ['compile_load_values']
+
+
+def _has_stock_converter(field, base_class):
+    """
+    Check if field uses `convert_protobuf` of `base_class` and can be inlined.
+    """
+    return (
+        isinstance(field, base_class)
+        and type(field).convert_protobuf is base_class.convert_protobuf
+    )
+
+
+def _attr(pb_name):
+    if keyword.iskeyword(pb_name):
+        return f'getattr(msg, {pb_name!r})'
+
+    return f'msg.{pb_name}'
+
+
+def _generate_step(idx, step, field, namespace):
+    """
+    Generate source lines loading a single field into `values` dict.
+    """
+    # pylint: disable=too-many-return-statements
+    name, pb_name, convert, presence = step
+    target = f'values[{name!r}]'
+    attr = _attr(pb_name)
+
+    if convert is get_value_fallback:
+        if presence == PRESENCE_SCALAR:
+            return [f'{target} = {attr}'], False
+        if presence == PRESENCE_MESSAGE:
+            return [f'{target} = {attr} if has_field({pb_name!r}) else Unset'], False
+        if presence == PRESENCE_REPEATED:
+            return [f'{target} = {attr} or Unset'], False
+
+    if presence == PRESENCE_MESSAGE:
+        if _has_stock_converter(field, WrapperTypeMixin):
+            return [f'{target} = {attr}.value if has_field({pb_name!r}) else Unset'], False
+
+        if _has_stock_converter(field, TimestampType) or _has_stock_converter(field, DurationType):
+            namespace[f'field_{idx}'] = field
+            return [
+                f'{target} = field_{idx}.convert_protobuf_value({attr}) '
+                f'if has_field({pb_name!r}) else Unset'
+            ], False
+
+        if _has_stock_converter(field, MessageType):
+            namespace[f'field_{idx}'] = field
+            return [
+                f'{target} = field_{idx}.model_class.load_protobuf({attr}, trusted=True) '
+                f'if has_field({pb_name!r}) else Unset'
+            ], False
+
+    if presence == PRESENCE_SCALAR and _has_stock_converter(field, EnumType):
+        # pylint: disable=protected-access
+        namespace[f'protobuf_values_{idx}'] = field._protobuf_values
+        namespace[f'convert_value_{idx}'] = field.convert_protobuf_value
+
+        return [
+            f'value = {attr}',
+            f'{target} = protobuf_values_{idx}[value] if value in protobuf_values_{idx} '
+            f'else convert_value_{idx}(value)',
+        ], False
+
+    # Generic case, call converter as the plan-based loader would.
+    namespace[f'convert_{idx}'] = convert
+    return [f'{target} = convert_{idx}(msg, {pb_name!r}, field_names)'], True
+
+
+def compile_load_values(model_cls):
+    """
+    Generate, compile and return a function which takes a protobuf message
+    and returns dict of values for `model_cls` fields.
+    """
+    # pylint: disable=protected-access
+    fields = model_cls._schema.fields
+    options = model_cls.protobuf_options
+    namespace = {
+        'Unset': Unset,
+        'message_descriptor': options.message_class.DESCRIPTOR,
+        # Generated code relies on the layout of declared message, any other
+        # message is handled by the generic loader.
+        'load_values_generic': options.load_values,
+    }
+    body = []
+    needs_field_names = False
+
+    for idx, step in enumerate(options.load_plan):
+        lines, uses_field_names = _generate_step(idx, step, fields[step.name], namespace)
+        needs_field_names = needs_field_names or uses_field_names
+        body.extend(lines)
+
+    header = [
+        'if msg.DESCRIPTOR is not message_descriptor:',
+        '    return load_values_generic(msg)',
+        'has_field = msg.HasField',
+    ]
+    if needs_field_names:
+        header.append('field_names = {descriptor.name for descriptor, _ in msg.ListFields()}')
+    header.append('values = {}')
+
+    source = '\n'.join(
+        ['def load_values(msg):']
+        + [f'    {line}' for line in header + body]
+        + ['    return values', '']
+    )
+
+    filename = f'<schematics_proto3 load_values {model_cls.__module__}.{model_cls.__qualname__}>'
+    exec(compile(source, filename, 'exec'), namespace)  # pylint: disable=exec-used
+
+    # Make generated source available to tracebacks and debuggers.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    load_values = namespace['load_values']
+    load_values.__qualname__ = f'{model_cls.__qualname__}.load_values'
+    load_values.source = source
+
+    return load_values
@@ -0,0 +1,190 @@
+# -*- coding:utf-8 -*-
+"""
+Compact, slotted storage of Model values.
+
+Models declared with `compact=True` get a record class generated, which
+keeps values of fields in `__slots__` instead of dicts a Model instance is
+made of. Records take a fraction of memory of Model instances and offer the
+same attributes, `to_native`, `to_primitive`, `to_protobuf` and `validate`.
+Anything else is available on a Model instance returned by `to_model`.
+
+Values of nested message fields are stored as records too, as long as their
+Models are compact as well.
+"""
+from schematics_proto3.plan import ClassCache
+from schematics_proto3.types import MessageType, RepeatedType
+from schematics_proto3.unset import Unset
+
+__all__ = ['CompactRecord', 'make_compact_class', 'get_compact_class']
+
+
+# Kinds of fields which values are converted between Models and records.
+_PLAIN = 0
+_MESSAGE = 1
+_REPEATED_MESSAGE = 2
+
+
+def _field_kind(field):
+    if isinstance(field, RepeatedType):
+        field = field.field
+        kind = _REPEATED_MESSAGE
+    else:
+        kind = _MESSAGE
+
+    if isinstance(field, MessageType) and field.model_class.protobuf_options.flags.compact:
+        return kind
+
+    return _PLAIN
+
+
+def _to_record(value):
+    # Models of nested message fields are compact, see `_field_kind`.
+    if value is Unset or value is None or isinstance(value, CompactRecord):
+        return value
+
+    return value.to_compact()
+
+
+def _to_model(value):
+    if isinstance(value, CompactRecord):
+        return value.to_model()
+
+    return value
+
+
+class CompactRecord:
+    """
+    Base class of generated record classes, see `make_compact_class`.
+    """
+    __slots__ = ()
+
+    model_class = None
+    _fields = ()
+    _kinds = ()
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build record of a mapping of Model values, missing fields are Unset.
+        """
+        record = cls.__new__(cls)
+        record._set_values(values)
+
+        return record
+
+    def _set_values(self, values):
+        get = values.get
+
+        for name, kind in zip(self._fields, self._kinds):
+            value = get(name, Unset)
+
+            if kind == _MESSAGE:
+                value = _to_record(value)
+            elif kind == _REPEATED_MESSAGE and value is not Unset and value is not None:
+                value = [_to_record(item) for item in value]
+
+            object.__setattr__(self, name, value)
+
+    def _get_values(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def to_model(self):
+        """
+        Return Model instance of the record values.
+        """
+        values = self._get_values()
+
+        for name, kind in zip(self._fields, self._kinds):
+            value = values[name]
+
+            if kind == _MESSAGE:
+                values[name] = _to_model(value)
+            elif kind == _REPEATED_MESSAGE and value is not Unset and value is not None:
+                values[name] = [_to_model(item) for item in value]
+
+        return self.model_class._from_data(values)  # pylint: disable=protected-access
+
+    def validate(self, **kwargs):
+        """
+        Validate values as `Model.validate` does, keeping converted values.
+        """
+        model = self.to_model()
+        model.validate(**kwargs)
+        self._set_values(model._data)  # pylint: disable=protected-access
+
+    def to_native(self, *args, **kwargs):
+        return self.to_model().to_native(*args, **kwargs)
+
+    def to_primitive(self, *args, **kwargs):
+        return self.to_model().to_primitive(*args, **kwargs)
+
+    def to_protobuf(self, into=None):
+        options = self.model_class.protobuf_options
+
+        if into is None:
+            msg = options.message_class()
+        else:
+            # Records are loaded eagerly, nothing is read from the message
+            # they were loaded from, so it can be `into` as well.
+            msg = into
+            msg.Clear()
+
+        for name, pb_name, export in options.export_plan:
+            export(msg, pb_name, getattr(self, name))
+
+        return msg
+
+    def to_bytes(self):
+        return self.to_protobuf().SerializeToString()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Generated classes cannot be found by name, Model classes can.
+        return _restore_record, (self.model_class, self._get_values())
+
+    def __repr__(self):
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self._fields)
+
+        return f'<{type(self).__name__}({values})>'
+
+
+def _restore_record(model_class, values):
+    return get_compact_class(model_class).from_values(values)
+
+
+def make_compact_class(model_class):
+    """
+    Generate record class storing values of `model_class` fields in slots.
+    """
+    # pylint: disable=protected-access
+    fields = tuple(model_class._schema.fields)
+
+    return type(f'{model_class.__name__}Compact', (CompactRecord,), {
+        '__slots__': fields,
+        '__module__': model_class.__module__,
+        '__qualname__': f'{model_class.__qualname__}Compact',
+        'model_class': model_class,
+        '_fields': fields,
+        '_kinds': tuple(_field_kind(field) for field in model_class._schema.fields.values()),
+    })
+
+
+_COMPACT_CLASSES = ClassCache()
+
+
+def get_compact_class(model_class):
+    """
+    Return record class of `model_class`, generated once. Raises
+    RuntimeError unless the Model is declared with `compact=True`.
+    """
+    if not model_class.protobuf_options.flags.compact:
+        raise RuntimeError(f'class {model_class.__name__} is not declared with compact=True')
+
+    return _COMPACT_CLASSES.get(model_class, None, make_compact_class)
@@ -0,0 +1,724 @@
+# -*- coding:utf-8 -*-
+"""
+Direct decoder of proto3 wire format into Model values.
+
+Serialized messages are decoded field by field, following the message
+descriptor, without building a protobuf Message first and reading it back
+with `ListFields` and `getattr`. Presence of wrappers, nested messages and
+oneofs follows from tags found on the wire. Values are the same as those
+loaded by `Model.load_protobuf`.
+
+Fields of types without a known wire mapping (e.g. custom `convert_protobuf`
+implementations) make the Model fall back to parsing a Message.
+"""
+import struct
+from typing import NamedTuple
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import DecodeError
+
+from schematics_proto3.oneof import OneOfVariant
+from schematics_proto3.plan import PRESENCE_ONEOF, ClassCache
+from schematics_proto3.types import (
+    DurationType, EnumType, MessageType, OneOfType, RepeatedType, TimestampType,
+)
+from schematics_proto3.types.wrappers import WrapperTypeMixin
+from schematics_proto3.utils import encode_varint, get_value_fallback, parse_message
+
+__all__ = ['decode_values']
+
+
+_MASK_32 = (1 << 32) - 1
+_MASK_64 = (1 << 64) - 1
+
+WIRETYPE_VARINT = 0
+WIRETYPE_FIXED64 = 1
+WIRETYPE_LENGTH_DELIMITED = 2
+WIRETYPE_START_GROUP = 3
+WIRETYPE_END_GROUP = 4
+WIRETYPE_FIXED32 = 5
+
+
+class _Wrapper(NamedTuple):
+    """
+    Decoded well known wrapper message.
+    """
+    value: object
+
+
+class _SecondsNanos(NamedTuple):
+    """
+    Decoded Timestamp or Duration message.
+    """
+    seconds: int
+    nanos: int
+
+
+class _FieldValues:
+    """
+    Stand-in for a message, exposing decoded values of fields to
+    `convert_protobuf` of protobuf aware types.
+    """
+    # pylint: disable=too-few-public-methods,invalid-name
+
+    def __init__(self, descriptor, values):
+        self.DESCRIPTOR = descriptor
+        self.__dict__.update(values)
+
+
+##########################################
+#  Wire primitives                       #
+##########################################
+
+def _read_varint(buf, pos):
+    # Truncated buffers raise IndexError, reported by `decode_values`.
+    byte = buf[pos]
+    pos += 1
+
+    if byte < 0x80:
+        return byte, pos
+
+    result = byte & 0x7f
+    shift = 7
+
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            return result, pos
+
+        shift += 7
+        if shift >= 64:
+            raise DecodeError('Too many bytes when decoding varint.')
+
+
+def _varint_decoder(convert=None):
+    if convert is None:
+        return _read_varint
+
+    def decode(buf, pos):
+        value, pos = _read_varint(buf, pos)
+
+        return convert(value), pos
+
+    return decode
+
+
+def _signed_32(value):
+    value &= _MASK_32
+
+    return value - (1 << 32) if value & (1 << 31) else value
+
+
+def _signed_64(value):
+    value &= _MASK_64
+
+    return value - (1 << 64) if value & (1 << 63) else value
+
+
+def _zigzag_32(value):
+    value &= _MASK_32
+
+    return (value >> 1) ^ -(value & 1)
+
+
+def _zigzag_64(value):
+    value &= _MASK_64
+
+    return (value >> 1) ^ -(value & 1)
+
+
+def _struct_decoder(fmt):
+    unpack_from = struct.Struct(fmt).unpack_from
+    size = struct.calcsize(fmt)
+
+    def decode(buf, pos):
+        if pos + size > len(buf):
+            raise IndexError(pos)
+
+        return unpack_from(buf, pos)[0], pos + size
+
+    # Packed fields of fixed size items are unpacked at once.
+    decode.format = fmt
+
+    return decode
+
+
+def _length(buf, pos):
+    size = buf[pos]
+
+    if size < 0x80:
+        pos += 1
+    else:
+        size, pos = _read_varint(buf, pos)
+
+    end = pos + size
+
+    if end > len(buf):
+        raise IndexError(pos)
+
+    return pos, end
+
+
+def _decode_string(buf, pos):
+    start, end = _length(buf, pos)
+
+    try:
+        return buf[start:end].decode('utf-8'), end
+    except UnicodeDecodeError as ex:
+        raise DecodeError(f'Invalid UTF-8 string: {ex}') from ex
+
+
+def _decode_bytes(buf, pos):
+    start, end = _length(buf, pos)
+
+    return buf[start:end], end
+
+
+def _decode_range(buf, pos):
+    start, end = _length(buf, pos)
+
+    return (start, end), end
+
+
+# Protobuf field type to (wire type, decoder of a single value).
+_SCALAR_DECODERS = {
+    FieldDescriptor.TYPE_INT32: (WIRETYPE_VARINT, _varint_decoder(_signed_32)),
+    FieldDescriptor.TYPE_INT64: (WIRETYPE_VARINT, _varint_decoder(_signed_64)),
+    FieldDescriptor.TYPE_UINT32: (WIRETYPE_VARINT, _varint_decoder(lambda value: value & _MASK_32)),
+    FieldDescriptor.TYPE_UINT64: (WIRETYPE_VARINT, _varint_decoder(lambda value: value & _MASK_64)),
+    FieldDescriptor.TYPE_SINT32: (WIRETYPE_VARINT, _varint_decoder(_zigzag_32)),
+    FieldDescriptor.TYPE_SINT64: (WIRETYPE_VARINT, _varint_decoder(_zigzag_64)),
+    FieldDescriptor.TYPE_BOOL: (WIRETYPE_VARINT, _varint_decoder(bool)),
+    FieldDescriptor.TYPE_ENUM: (WIRETYPE_VARINT, _varint_decoder(_signed_32)),
+    FieldDescriptor.TYPE_FIXED32: (WIRETYPE_FIXED32, _struct_decoder('<I')),
+    FieldDescriptor.TYPE_SFIXED32: (WIRETYPE_FIXED32, _struct_decoder('<i')),
+    FieldDescriptor.TYPE_FLOAT: (WIRETYPE_FIXED32, _struct_decoder('<f')),
+    FieldDescriptor.TYPE_FIXED64: (WIRETYPE_FIXED64, _struct_decoder('<Q')),
+    FieldDescriptor.TYPE_SFIXED64: (WIRETYPE_FIXED64, _struct_decoder('<q')),
+    FieldDescriptor.TYPE_DOUBLE: (WIRETYPE_FIXED64, _struct_decoder('<d')),
+    FieldDescriptor.TYPE_STRING: (WIRETYPE_LENGTH_DELIMITED, _decode_string),
+    FieldDescriptor.TYPE_BYTES: (WIRETYPE_LENGTH_DELIMITED, _decode_bytes),
+    FieldDescriptor.TYPE_MESSAGE: (WIRETYPE_LENGTH_DELIMITED, _decode_range),
+}
+
+
+def _skip(buf, pos, tag):
+    """
+    Skip value of an unknown field of `tag`. Return position past it.
+    """
+    wire_type = tag & 7
+
+    if not tag >> 3:
+        raise DecodeError('Field number 0 is illegal.')
+
+    if wire_type == WIRETYPE_VARINT:
+        return _read_varint(buf, pos)[1]
+
+    if wire_type == WIRETYPE_FIXED64:
+        pos += 8
+    elif wire_type == WIRETYPE_FIXED32:
+        pos += 4
+    elif wire_type == WIRETYPE_LENGTH_DELIMITED:
+        pos = _length(buf, pos)[1]
+    elif wire_type == WIRETYPE_START_GROUP:
+        while True:
+            inner_tag, pos = _read_varint(buf, pos)
+
+            if inner_tag & 7 == WIRETYPE_END_GROUP:
+                if inner_tag >> 3 != tag >> 3:
+                    raise DecodeError('Mismatched end-group tag.')
+                break
+
+            pos = _skip(buf, pos, inner_tag)
+    else:
+        raise DecodeError(f'Unexpected wire type {wire_type}.')
+
+    if pos > len(buf):
+        raise IndexError(pos)
+
+    return pos
+
+
+##########################################
+#  Message layouts                       #
+##########################################
+
+class _FieldLayout(NamedTuple):
+    number: int
+    wire_type: int
+    decode: object
+    repeated: bool
+    # Values are collected in a list: items of repeated fields and wire
+    # ranges of message fields, to be merged.
+    collected: bool
+    packable: bool
+    # Tag of the field as serialized, to spot consecutive items.
+    tag: bytes
+    # Other fields of the same oneof, cleared when this one is decoded.
+    oneof_siblings: tuple
+
+
+# Message descriptor to a dict of field number to _FieldLayout.
+_LAYOUTS = {}
+
+
+def _get_layout(descriptor):
+    try:
+        return _LAYOUTS[descriptor]
+    except KeyError:
+        pass
+
+    layout = {}
+
+    for field_descriptor in descriptor.fields:
+        # Groups are not a part of proto3, they are skipped as unknown fields.
+        if field_descriptor.type not in _SCALAR_DECODERS:
+            continue
+
+        wire_type, decode = _SCALAR_DECODERS[field_descriptor.type]
+        repeated = field_descriptor.label == FieldDescriptor.LABEL_REPEATED
+        oneof = field_descriptor.containing_oneof
+        layout[field_descriptor.number] = _FieldLayout(
+            number=field_descriptor.number,
+            wire_type=wire_type,
+            decode=decode,
+            repeated=repeated,
+            collected=repeated or decode is _decode_range,
+            packable=wire_type != WIRETYPE_LENGTH_DELIMITED,
+            tag=encode_varint(field_descriptor.number << 3 | wire_type),
+            oneof_siblings=tuple(
+                sibling.number for sibling in oneof.fields if sibling is not field_descriptor
+            ) if oneof is not None else (),
+        )
+
+    _LAYOUTS[descriptor] = layout
+
+    return layout
+
+
+def _decode_run(field, buf, pos, end, items):
+    """
+    Decode consecutive items of a repeated field, as serializers write
+    them, into `items`. Return position past the last one.
+    """
+    decode = field.decode
+    append = items.append
+    tag = field.tag
+    tag_size = len(tag)
+
+    while True:
+        value, pos = decode(buf, pos)
+        append(value)
+
+        if pos >= end or not buf.startswith(tag, pos):
+            return pos
+
+        pos += tag_size
+
+
+def _decode_field(field, raw, buf, pos, end):
+    """
+    Decode value of a field found on the wire into `raw`. Return position
+    past it.
+    """
+    if field.collected:
+        items = raw.get(field.number)
+        if items is None:
+            items = raw[field.number] = []
+
+        if field.repeated:
+            # Repeated fields are not a part of oneofs.
+            return _decode_run(field, buf, pos, end, items)
+
+        value, pos = field.decode(buf, pos)
+        items.append(value)
+    else:
+        raw[field.number], pos = field.decode(buf, pos)
+
+    for sibling in field.oneof_siblings:
+        raw.pop(sibling, None)
+
+    return pos
+
+
+def _decode_packed(field, raw, buf, pos):
+    """
+    Decode packed repeated field into `raw`. Return position past it.
+    """
+    pos, end = _length(buf, pos)
+    fmt = getattr(field.decode, 'format', None)
+
+    if fmt is not None:
+        count, remainder = divmod(end - pos, struct.calcsize(fmt))
+
+        if remainder:
+            raise DecodeError('Packed element was truncated.')
+
+        items = struct.unpack_from(f'<{count}{fmt[1:]}', buf, pos)
+    else:
+        items = []
+        decode = field.decode
+
+        while pos < end:
+            value, pos = decode(buf, pos)
+            items.append(value)
+
+        if pos != end:
+            raise DecodeError('Packed element was truncated.')
+
+    # Empty packed field does not make repeated field present.
+    if items:
+        raw.setdefault(field.number, []).extend(items)
+
+    return end
+
+
+def _decode_raw(layout, buf, pos, end):
+    """
+    Decode fields of a message found in `buf[pos:end]`. Return dict of field
+    number to its value, list of values for repeated fields. Message fields
+    are decoded to lists of (start, end) ranges of `buf`, to be merged.
+    """
+    raw = {}
+
+    while pos < end:
+        tag, pos = _read_varint(buf, pos)
+        wire_type = tag & 7
+        field = layout.get(tag >> 3)
+
+        if field is None:
+            pos = _skip(buf, pos, tag)
+        elif wire_type == field.wire_type:
+            pos = _decode_field(field, raw, buf, pos, end)
+        elif field.packable and field.repeated and wire_type == WIRETYPE_LENGTH_DELIMITED:
+            pos = _decode_packed(field, raw, buf, pos)
+        else:
+            # Protobuf treats values of unexpected wire type as unknown.
+            pos = _skip(buf, pos, tag)
+
+    if pos != end:
+        raise IndexError(pos)
+
+    return raw
+
+
+def _merged(buf, ranges):
+    """
+    Return (buf, start, end) of a message field given its wire ranges.
+    Repeated occurrences of a singular message are merged, just as
+    concatenated serialized messages are.
+    """
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        return buf, start, end
+
+    merged = b''.join(buf[start:end] for start, end in ranges)
+
+    return merged, 0, len(merged)
+
+
+##########################################
+#  Model decoders                        #
+##########################################
+
+def _has_stock_converter(field, base_class):
+    return isinstance(field, base_class) and type(field).convert_protobuf is base_class.convert_protobuf
+
+
+def _wrapper_value(field_descriptor):
+    value_descriptor = field_descriptor.message_type.fields_by_name['value']
+    layout = _get_layout(field_descriptor.message_type)
+    number = value_descriptor.number
+    default = value_descriptor.default_value
+
+    def decode(buf, value_range):
+        return _decode_raw(layout, buf, *value_range).get(number, default)
+
+    return decode
+
+
+def _seconds_nanos(field_descriptor):
+    message_descriptor = field_descriptor.message_type
+    layout = _get_layout(message_descriptor)
+    seconds = message_descriptor.fields_by_name['seconds'].number
+    nanos = message_descriptor.fields_by_name['nanos'].number
+
+    def decode(buf, value_range):
+        raw = _decode_raw(layout, buf, *value_range)
+
+        return _SecondsNanos(raw.get(seconds, 0), raw.get(nanos, 0))
+
+    return decode
+
+
+def _nested_models(model_class):
+    def decode(buf, value_ranges):
+        decoder = _get_decoder(model_class)
+        from_values = model_class._from_trusted_values  # pylint: disable=protected-access
+
+        return [from_values(decoder(buf, start, end)) for start, end in value_ranges]
+
+    return decode
+
+
+def _item_decoder(field, field_descriptor):
+    """
+    Return function decoding a message value of a (possibly repeated) field
+    from its range in buffer, None if values of `field` cannot be decoded.
+    """
+    if _has_stock_converter(field, WrapperTypeMixin):
+        value = _wrapper_value(field_descriptor)
+        return lambda buf, value_range: _Wrapper(value(buf, value_range))
+
+    if _has_stock_converter(field, TimestampType) or _has_stock_converter(field, DurationType):
+        return _seconds_nanos(field_descriptor)
+
+    return None
+
+
+def _merged_range(buf, ranges):
+    buf, start, end = _merged(buf, ranges)
+
+    return buf, (start, end)
+
+
+def _merged_ranges(buf, ranges):
+    buf, start, end = _merged(buf, ranges)
+
+    return buf, [(start, end)]
+
+
+def _enum_finisher(field, field_descriptor):
+    number = field_descriptor.number
+    convert_value = field.convert_protobuf_value
+
+    return lambda raw, buf: convert_value(raw[number])
+
+
+def _nested_model_finisher(field, field_descriptor):
+    number = field_descriptor.number
+    decode = _nested_models(field.model_class)
+
+    return lambda raw, buf: decode(*_merged_ranges(buf, raw[number]))[0]
+
+
+def _wrapper_finisher(field, field_descriptor):
+    # pylint: disable=unused-argument
+    number = field_descriptor.number
+    decode = _wrapper_value(field_descriptor)
+
+    return lambda raw, buf: decode(*_merged_range(buf, raw[number]))
+
+
+def _seconds_nanos_finisher(field, field_descriptor):
+    number = field_descriptor.number
+    decode = _seconds_nanos(field_descriptor)
+    convert_value = field.convert_protobuf_value
+
+    return lambda raw, buf: convert_value(decode(*_merged_range(buf, raw[number])))
+
+
+# Builders of finishers of singular fields, by `convert_protobuf` of stock
+# field types, for scalar and message protobuf fields.
+_SCALAR_FINISHERS = {
+    EnumType.convert_protobuf: _enum_finisher,
+}
+
+_MESSAGE_FINISHERS = {
+    MessageType.convert_protobuf: _nested_model_finisher,
+    WrapperTypeMixin.convert_protobuf: _wrapper_finisher,
+    TimestampType.convert_protobuf: _seconds_nanos_finisher,
+    DurationType.convert_protobuf: _seconds_nanos_finisher,
+}
+
+
+def _singular_finisher(field, convert, field_descriptor):
+    """
+    Return function building value of a singular `field` from decoded raw
+    fields and buffer, None if it cannot be built.
+    """
+    if field_descriptor.type != FieldDescriptor.TYPE_MESSAGE:
+        if convert is get_value_fallback:
+            number = field_descriptor.number
+            return lambda raw, buf: raw[number]
+
+        finishers = _SCALAR_FINISHERS
+    else:
+        finishers = _MESSAGE_FINISHERS
+
+    make_finisher = finishers.get(getattr(type(field), 'convert_protobuf', None))
+
+    if make_finisher is None:
+        return None
+
+    return make_finisher(field, field_descriptor)
+
+
+def _repeated_message_finisher(field, convert, field_descriptor, message_descriptor, pb_name):
+    number = field_descriptor.number
+
+    if _has_stock_converter(field.field, MessageType):
+        decode = _nested_models(field.field.model_class)
+        return lambda raw, buf: decode(buf, raw[number])
+
+    decode = _item_decoder(field.field, field_descriptor)
+
+    if decode is None:
+        return None
+
+    def finish(raw, buf):
+        items = [decode(buf, value_range) for value_range in raw[number]]
+
+        return convert(_FieldValues(message_descriptor, {pb_name: items}), pb_name, (pb_name,))
+
+    return finish
+
+
+def _repeated_finisher(field, convert, field_descriptor, message_descriptor, pb_name):
+    number = field_descriptor.number
+    is_message = field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
+
+    if convert is get_value_fallback and not is_message:
+        return lambda raw, buf: raw[number]
+
+    if not _has_stock_converter(field, RepeatedType):
+        return None
+
+    if is_message:
+        return _repeated_message_finisher(field, convert, field_descriptor, message_descriptor, pb_name)
+
+    return lambda raw, buf: convert(_FieldValues(message_descriptor, {pb_name: raw[number]}), pb_name, (pb_name,))
+
+
+def _oneof_finisher(field, message_descriptor, pb_name):
+    if not _has_stock_converter(field, OneOfType):
+        return None, ()
+
+    variants = []
+
+    for field_descriptor in message_descriptor.oneofs_by_name[pb_name].fields:
+        try:
+            variant = field.get_variant(field_descriptor.name)
+        except KeyError:
+            # Variants not declared in the Model are not loaded.
+            continue
+
+        finish = _singular_finisher(variant.field, variant.convert_protobuf, field_descriptor)
+
+        if finish is None:
+            return None, ()
+
+        variants.append((field_descriptor.number, variant.name, finish))
+
+    def finish_oneof(raw, buf):
+        for number, name, finish_variant in variants:
+            if number in raw:
+                return OneOfVariant(name, finish_variant(raw, buf))
+
+        return None
+
+    return finish_oneof, tuple(number for number, _, _ in variants)
+
+
+def _build_steps(model_class):
+    """
+    Return steps building values of `model_class` fields from decoded raw
+    fields, None if any of them cannot be built.
+    """
+    # pylint: disable=protected-access
+    options = model_class.protobuf_options
+    message_descriptor = options.message_class.DESCRIPTOR
+    fields = model_class._schema.fields
+    steps = []
+
+    for name, pb_name, convert, presence in options.load_plan:
+        field = fields[name]
+
+        if presence == PRESENCE_ONEOF:
+            finish, numbers = _oneof_finisher(field, message_descriptor, pb_name)
+        else:
+            field_descriptor = message_descriptor.fields_by_name.get(pb_name)
+
+            if field_descriptor is None:
+                # Not in the message, always default.
+                continue
+
+            numbers = (field_descriptor.number,)
+
+            if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+                finish = _repeated_finisher(field, convert, field_descriptor, message_descriptor, pb_name)
+            else:
+                finish = _singular_finisher(field, convert, field_descriptor)
+
+        if finish is None:
+            return None
+
+        steps.append((name, numbers, finish))
+
+    return tuple(steps)
+
+
+def _build_decoder(model_class):
+    """
+    Build decoder of wire format into values of `model_class`, a function
+    taking buffer, start and end of a message.
+    """
+    options = model_class.protobuf_options
+    steps = _build_steps(model_class)
+
+    if steps is None:
+        def decode_message(buf, pos, end):
+            msg = parse_message(options.message_class(), buf[pos:end])
+
+            return options.load_values(msg)
+
+        return decode_message
+
+    layout = _get_layout(options.message_class.DESCRIPTOR)
+    defaults = options.load_values(options.message_class())
+
+    def decode(buf, pos, end):
+        raw = _decode_raw(layout, buf, pos, end)
+        values = defaults.copy()
+
+        for name, numbers, finish in steps:
+            for number in numbers:
+                if number in raw:
+                    value = finish(raw, buf)
+
+                    # Oneof with unknown variants only.
+                    if value is not None:
+                        values[name] = value
+                    break
+
+        return values
+
+    return decode
+
+
+_DECODERS = ClassCache()
+
+
+def _get_decoder(model_class):
+    return _DECODERS.get(model_class, None, _build_decoder)
+
+
+def decode_values(model_class, buf, pos=0, end=None):
+    """
+    Decode serialized message (bytes-like `buf`, or its `pos:end` part) into
+    a dict of values of `model_class` fields, as loaded by `load_protobuf`
+    from a parsed message.
+    """
+    if not isinstance(buf, bytes):
+        buf = bytes(buf)
+
+    if end is None:
+        end = len(buf)
+
+    try:
+        return _get_decoder(model_class)(buf, pos, end)
+    except IndexError as ex:
+        raise DecodeError('Truncated message.') from ex
@@ -1,5 +1,7 @@
 # -*- coding:utf-8 -*-
 from enum import EnumMeta, IntEnum
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, NamedTuple, Tuple
 
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
@@ -15,6 +17,36 @@ class _Ignore:
     __slots__ = []
 
 
+class _ProtobufEnumSpec(NamedTuple):
+    """
+    Members of a protobuf enum, extracted and checked once per descriptor.
+    """
+    items: Tuple[Tuple[str, int], ...]
+    names: FrozenSet[str]
+
+
+# Enums with at least that many members get their members added directly,
+# bypassing per-member processing of EnumMeta.
+LARGE_ENUM_THRESHOLD = 128
+
+_SPECS: Dict[object, _ProtobufEnumSpec] = {}
+
+
+def _get_spec(protobuf_enum):
+    descriptor = protobuf_enum.DESCRIPTOR
+
+    try:
+        return _SPECS[descriptor]
+    except KeyError:
+        pass
+
+    items = tuple((value.name, value.number) for value in descriptor.values)
+    spec = _ProtobufEnumSpec(items, frozenset(name for name, _ in items))
+    _SPECS[descriptor] = spec
+
+    return spec
+
+
 class ProtobufEnumMeta(EnumMeta):
 
     @classmethod
@@ -32,31 +64,96 @@ class ProtobufEnumMeta(EnumMeta):
         if not isinstance(protobuf_enum, EnumTypeWrapper):
             raise RuntimeError('protobuf_enum must be a Protobuf enum')
 
-        for key, value in protobuf_enum.items():
-            attrs[key] = value
+        spec = _get_spec(protobuf_enum)
+        mcs._validate_attrs(spec, name, attrs)
 
-        cls = super().__new__(mcs, name, bases, attrs)
+        if len(spec.items) >= LARGE_ENUM_THRESHOLD:
+            cls = super().__new__(mcs, name, bases, attrs)
 
-        mcs._validate_cls(protobuf_enum, cls)
+            if mcs._add_members(cls, spec):
+                return mcs._finalize(cls)
+
+        for key, value in spec.items:
+            attrs[key] = value
 
-        return cls
+        return mcs._finalize(super().__new__(mcs, name, bases, attrs))
 
     @staticmethod
-    def _validate_cls(pb_enum_cls, cls):
-        pb_enum_variants = set(pb_enum_cls.keys())
-        cls_enum_variants = {v.name for v in cls}
+    def _finalize(enum_cls):
+        # pylint: disable=protected-access
+        # Lookup tables used instead of (slow) `cls(value)` and `cls[name]`.
+        enum_cls._members_by_number = dict(enum_cls._value2member_map_)
+        enum_cls._members_by_name = dict(enum_cls.__members__)
 
-        if pb_enum_variants != cls_enum_variants:
-            additional = cls_enum_variants - pb_enum_variants
+        return enum_cls
 
+    @staticmethod
+    def _validate_attrs(spec, name, attrs):
+        # Members other than these of protobuf enum could only come from the
+        # class body.
+        additional = [key for key in getattr(attrs, '_member_names', ()) if key not in spec.names]
+
+        if additional:
             raise RuntimeError(
                 f'ProtobufEnum subclass cannot contain members other than '
                 f'`protobuf_enum`. '
                 f'\n'
-                f'`{cls.__qualname__}` contains following '
+                f'`{name}` contains following '
                 f'excess members: {",".join(additional)}.'
             )
 
+    @staticmethod
+    def _add_members(enum_cls, spec):
+        """
+        Add members of `spec` to a freshly created, empty enum class the way
+        `EnumMeta` would. Returns False, leaving the class untouched, if any
+        member would shadow an existing attribute, in which case the class
+        has to be created the regular way.
+        """
+        # pylint: disable=protected-access
+        if enum_cls._member_names_:
+            return False
+
+        for base in enum_cls.__mro__:
+            if not spec.names.isdisjoint(vars(base)):
+                return False
+
+        member_names = enum_cls._member_names_
+        member_map = enum_cls._member_map_
+        value_map = enum_cls._value2member_map_
+
+        for name, number in spec.items:
+            member = value_map.get(number)
+
+            if member is None:
+                member = int.__new__(enum_cls, number)
+                member._name_ = name
+                member._value_ = number
+                member.__objclass__ = enum_cls
+                member._sort_order_ = len(member_names)
+                member_names.append(name)
+                value_map[number] = member
+
+            # Aliases point to the first member of a given number.
+            member_map[name] = member
+            type.__setattr__(enum_cls, name, member)
+
+        return True
+
+    @property
+    def members_by_number(cls) -> Mapping[int, IntEnum]:
+        """
+        Members of the enum by their protobuf numbers.
+        """
+        return MappingProxyType(cls._members_by_number)
+
+    @property
+    def members_by_name(cls) -> Mapping[str, IntEnum]:
+        """
+        Members of the enum, including aliases, by their names.
+        """
+        return MappingProxyType(cls._members_by_name)
+
 
 class ProtobufEnum(IntEnum, metaclass=ProtobufEnumMeta, protobuf_enum=_Ignore):
     pass
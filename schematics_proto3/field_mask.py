@@ -0,0 +1,188 @@
+# -*- coding:utf-8 -*-
+"""
+Partial export and update of Models, driven by `google.protobuf.FieldMask`.
+
+Paths of a mask are made of protobuf field names, dotted paths reach into
+fields of nested messages (`MessageType`). Fields of a oneof are named
+directly, or all at once by the name of the oneof. As in protobuf
+`FieldMask` merge semantics, the last field of a path may be repeated, it is
+replaced as a whole, and fields in the mask which are not set in the source
+message are cleared.
+"""
+from typing import Callable, FrozenSet, NamedTuple, Optional, Tuple
+
+from schematics.types import BaseType
+
+from schematics_proto3.oneof import OneOfVariant
+from schematics_proto3.plan import PRESENCE_ONEOF, ClassCache, LoadStep
+from schematics_proto3.projection import parse_fields
+from schematics_proto3.types import MessageType
+from schematics_proto3.unset import Unset
+
+__all__ = ['MaskStep', 'get_mask_plan', 'export_masked', 'apply_masked']
+
+
+class MaskStep(NamedTuple):
+    """
+    Single entry of a mask plan.
+    """
+    name: str
+    field: BaseType
+    load: LoadStep
+    export: Callable
+    # Paths of nested message fields, empty if the whole field is masked.
+    paths: FrozenSet[str]
+    # Protobuf names of masked variants of a oneof, None for other fields.
+    variants: Optional[FrozenSet[str]]
+
+
+def _get_paths(field_mask):
+    if isinstance(field_mask, str):
+        raise TypeError('field_mask must be a FieldMask or a collection of paths, not a string')
+
+    return frozenset(getattr(field_mask, 'paths', field_mask))
+
+
+def _masked_variants(descriptor, step, variant, masked):
+    """
+    Return protobuf names of masked variants of a oneof `step`, adding
+    `variant` (or all variants if the oneof itself is masked) to variants
+    already `masked` by other paths. Return None for other fields.
+    """
+    if step.presence != PRESENCE_ONEOF:
+        return None
+
+    variants = masked[1] if masked is not None else frozenset()
+
+    if variant is not None:
+        return variants | {variant}
+
+    return variants | frozenset(field.name for field in descriptor.oneofs_by_name[step.protobuf_name].fields)
+
+
+def build_mask_plan(model_class, paths) -> Tuple[MaskStep, ...]:
+    """
+    Compile mask plan of `model_class` for given FieldMask `paths`.
+    """
+    # pylint: disable=protected-access
+    options = model_class.protobuf_options
+    descriptor = options.message_class.DESCRIPTOR
+    schema_fields = model_class._schema.fields
+    exports = {name: export for name, _, export in options.export_plan}
+
+    # Protobuf field names to (load step, protobuf name of oneof variant).
+    steps_by_pb_name = {}
+
+    for step in options.load_plan:
+        steps_by_pb_name[step.protobuf_name] = (step, None)
+
+        if step.presence == PRESENCE_ONEOF:
+            for field_descriptor in descriptor.oneofs_by_name[step.protobuf_name].fields:
+                steps_by_pb_name[field_descriptor.name] = (step, field_descriptor.name)
+
+    masked = {}
+
+    for pb_name, nested_paths in parse_fields(paths).items():
+        try:
+            step, variant = steps_by_pb_name[pb_name]
+        except KeyError as exc:
+            raise ValueError(f'{model_class.__name__} has no field mapped to `{pb_name}`') from exc
+
+        field = schema_fields[step.name]
+
+        if nested_paths and not isinstance(field, MessageType):
+            raise ValueError(f'`{pb_name}` of {model_class.__name__} is not a singular message field, '
+                             f'nested fields of it cannot be masked')
+
+        masked[step.name] = (step, _masked_variants(descriptor, step, variant, masked.get(step.name)), nested_paths)
+
+    return tuple(
+        MaskStep(
+            name=step.name,
+            field=schema_fields[step.name],
+            load=step,
+            export=exports[step.name],
+            paths=nested_paths,
+            variants=variants,
+        )
+        for step, variants, nested_paths in masked.values()
+    )
+
+
+_MASK_PLANS = ClassCache()
+
+
+def get_mask_plan(model_class, field_mask) -> Tuple[MaskStep, ...]:
+    """
+    Return mask plan of `model_class` for `field_mask`, a FieldMask or a
+    collection of paths, compiled once per set of paths.
+    """
+    paths = _get_paths(field_mask)
+
+    return _MASK_PLANS.get(model_class, paths, build_mask_plan, paths)
+
+
+def _variant_name(field, value):
+    if not isinstance(value, OneOfVariant):
+        return None
+
+    return field.get_variant(value.variant).protobuf_name
+
+
+def export_masked(model, plan, msg=None):
+    """
+    Export `model` values of masked fields only, into `msg` or a new
+    message. Return the message.
+    """
+    if msg is None:
+        msg = model.protobuf_options.message_class()
+
+    data = model._data  # pylint: disable=protected-access
+
+    for name, field, load, export, paths, variants in plan:
+        value = data.get(name)
+
+        if variants is not None and _variant_name(field, value) not in variants:
+            continue
+
+        if not paths:
+            export(msg, load.protobuf_name, value)
+        elif value is not Unset and value is not None:
+            nested = getattr(msg, load.protobuf_name)
+            nested.SetInParent()
+            nested.MergeFrom(value.to_protobuf(field_mask=paths))
+
+    return msg
+
+
+def apply_masked(model, msg, plan):
+    """
+    Update `model` in place with values of masked fields of `msg`.
+    """
+    # pylint: disable=protected-access
+    field_names = {descriptor.name for descriptor, _ in msg.ListFields()}
+    converted = model._data.converted
+
+    for name, field, load, _, paths, variants in plan:
+        if paths:
+            nested = model._data.get(name)
+
+            if nested is Unset or nested is None:
+                model_class = field.model_class
+                nested_options = model_class.protobuf_options
+                nested = model_class._from_data(nested_options.load_values(nested_options.message_class()))
+
+            nested.apply_protobuf(getattr(msg, load.protobuf_name), paths)
+            converted[name] = nested
+            continue
+
+        value = load.convert(msg, load.protobuf_name, field_names)
+
+        if variants is not None and _variant_name(field, value) not in variants:
+            # Masked variants which are not set are cleared, others are kept.
+            if _variant_name(field, model._data.get(name)) not in variants:
+                continue
+
+            value = Unset
+
+        converted[name] = value
@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+"""
+Lazy loading of Model values from protobuf messages.
+"""
+from collections.abc import MutableMapping
+
+from schematics.transforms import get_import_context
+
+from schematics_proto3.plan import PRESENCE_ONEOF, PRESENCE_SCALAR
+from schematics_proto3.unset import Unset
+
+__all__ = ['LazyValues', 'build_lazy_steps']
+
+
+_IMPORT_CONTEXT = get_import_context()
+
+
+def build_lazy_steps(load_plan, trusted_checks):
+    """
+    Map field names to (protobuf name, converter, field to convert with,
+    presence) tuples. Field to convert with is None for fields which load
+    native values.
+    """
+    needs_convert = {check.name: check.field for check in trusted_checks if check.convert}
+
+    return {
+        step.name: (step.protobuf_name, step.convert, needs_convert.get(step.name), step.presence)
+        for step in load_plan
+    }
+
+
+class LazyValues(MutableMapping):
+    """
+    Mapping of Model values which are converted from the source protobuf
+    message the first time they are accessed, then cached.
+
+    The source message is referenced until all values are loaded, it must
+    not be modified in the meantime.
+    """
+
+    __slots__ = ('_msg', '_steps', '_pending', '_values', '_field_names')
+
+    def __init__(self, msg, steps):
+        self._msg = msg
+        self._steps = steps
+        self._pending = set(steps)
+        self._values = {}
+        self._field_names = None
+
+    @property
+    def pending(self):
+        """
+        Names of fields which have not been loaded yet.
+        """
+        return frozenset(self._pending)
+
+    def _get_field_names(self):
+        if self._field_names is None:
+            self._field_names = {descriptor.name for descriptor, _ in self._msg.ListFields()}
+
+        return self._field_names
+
+    def _store(self, key, value):
+        self._values[key] = value
+        self._pending.discard(key)
+
+        if not self._pending:
+            # Everything is loaded, source message is not needed anymore.
+            self._msg = None
+            self._field_names = None
+
+        return value
+
+    def _load(self, key):
+        pb_name, convert, field, _ = self._steps[key]
+
+        value = convert(self._msg, pb_name, self._get_field_names())
+
+        if field is not None and value is not Unset:
+            value = field.convert(value, _IMPORT_CONTEXT)
+
+        return self._store(key, value)
+
+    def load_pending(self):
+        """
+        Load all fields which have not been loaded yet, releasing the source
+        message.
+        """
+        for key in list(self._pending):
+            self._load(key)
+
+    def is_unset(self, key):
+        """
+        Check if value of `key` field is Unset, without converting fields
+        which have to be present in the message to be set.
+        """
+        if key not in self._pending:
+            return self[key] is Unset
+
+        pb_name, _, _, presence = self._steps[key]
+
+        if presence == PRESENCE_SCALAR:
+            return self._load(key) is Unset
+
+        if presence == PRESENCE_ONEOF:
+            is_set = self._msg.WhichOneof(pb_name) is not None
+        else:
+            is_set = pb_name in self._get_field_names()
+
+        if is_set:
+            return False
+
+        self._store(key, Unset)
+
+        return True
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key in self._pending:
+                return self._load(key)
+            raise
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        if key in self._pending:
+            self._pending.discard(key)
+            return
+
+        del self._values[key]
+
+    def __contains__(self, key):
+        return key in self._values or key in self._pending
+
+    def __iter__(self):
+        yield from self._values
+        yield from list(self._pending)
+
+    def __len__(self):
+        return len(self._values) + len(self._pending)
+
+    def __repr__(self):
+        return f'LazyValues({self._values!r}, pending={sorted(self._pending)!r})'
@@ -1,13 +1,53 @@
 # -*- coding:utf-8 -*-
-from dataclasses import dataclass
-from typing import Type
+import threading
+from dataclasses import dataclass, replace
+from itertools import chain, islice, repeat
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 import schematics
 from google.protobuf.message import Message
+from schematics.exceptions import CompoundError, DataError, FieldError
+from schematics.models import ModelDict
+from schematics.transforms import get_import_context
+from schematics.undefined import Undefined
 
-from schematics_proto3.types import OneOfType
-from schematics_proto3.types.wrappers import WrapperTypeMixin
-from schematics_proto3.utils import get_value_fallback
+from schematics_proto3.codegen import compile_load_values
+from schematics_proto3.compact import get_compact_class
+from schematics_proto3.decoder import decode_values
+from schematics_proto3.field_mask import apply_masked, export_masked, get_mask_plan
+from schematics_proto3.lazy import LazyValues, build_lazy_steps
+from schematics_proto3.plan import (
+    ExportStep, LoadStep, TrustedCheck, build_export_plan, build_load_plan, build_trusted_checks, make_load_values,
+    make_sparse_load_values,
+)
+from schematics_proto3.projection import get_projection
+from schematics_proto3.tracking import export_changes
+from schematics_proto3.unset import Unset
+from schematics_proto3.utils import parse_message
+
+
+_IMPORT_CONTEXT = get_import_context()
+
+# Per-thread scratch messages reused by Model.from_bytes and Model.to_bytes,
+# keyed by message class.
+_SCRATCH = threading.local()
+
+# Models with at least that many fields load sparse messages, unless told
+# otherwise. Work done by sparse loader is proportional to the number of
+# fields set in a message, rather than the number of declared fields.
+SPARSE_FIELDS_THRESHOLD = 32
+
+
+def _get_scratch_message(message_class):
+    scratch = getattr(_SCRATCH, 'messages', None)
+    if scratch is None:
+        scratch = _SCRATCH.messages = {}
+
+    msg = scratch.get(message_class)
+    if msg is None:
+        msg = scratch[message_class] = message_class()
+
+    return msg
 
 
 class _Ignore:
@@ -19,14 +59,33 @@ class _Ignore:
     __slots__ = []
 
 
+@dataclass(frozen=True)
+class ModelFlags:
+    """
+    Class keyword arguments a Model is declared with.
+    """
+    codegen: bool = False
+    sparse: Optional[bool] = None
+    compact: bool = False
+    track_changes: bool = False
+
+
 @dataclass(frozen=True)
 class ModelOptions:
     message_class: Type[Message]
+    load_plan: Tuple[LoadStep, ...]
+    load_values: Callable[[Message], Dict]
+    export_plan: Tuple[ExportStep, ...]
+    trusted_checks: Tuple[TrustedCheck, ...]
+    lazy_steps: Dict[str, Tuple]
+    flags: ModelFlags = ModelFlags()
 
 
 class ModelMeta(schematics.ModelMeta):
 
-    def __new__(mcs, name, bases, attrs, protobuf_message=None):
+    def __new__(mcs, name, bases, attrs, protobuf_message=None, *, codegen=False, sparse=None, compact=False,
+                track_changes=False):
+        # pylint: disable=too-many-arguments
         cls = super().__new__(mcs, name, bases, attrs)
 
         if protobuf_message is _Ignore:
@@ -39,11 +98,48 @@ class ModelMeta(schematics.ModelMeta):
             raise RuntimeError('protobuf_enum must be a subclass of Protobuf message')
 
         # TODO: Validate fields against protobuf message definition
+        if codegen and sparse:
+            raise RuntimeError(f'class {name} cannot use both generated and sparse loader')
+
+        flags = ModelFlags(codegen=codegen, sparse=sparse, compact=compact, track_changes=track_changes)
+        mcs.compile_options(cls, protobuf_message, flags=flags)
+
+        return cls
+
+    @staticmethod
+    def compile_options(cls, protobuf_message, *, flags=ModelFlags()):
+        # pylint: disable=bad-staticmethod-argument,protected-access
+        load_plan = build_load_plan(cls._schema.fields, protobuf_message)
+
+        if flags.sparse is None:
+            use_sparse = not flags.codegen and len(load_plan) >= SPARSE_FIELDS_THRESHOLD
+        else:
+            use_sparse = flags.sparse
+
+        if use_sparse:
+            load_values = make_sparse_load_values(load_plan, protobuf_message)
+        else:
+            load_values = make_load_values(load_plan)
+
+        trusted_checks = build_trusted_checks(cls._schema.fields, load_plan)
+
         cls.protobuf_options = ModelOptions(
             message_class=protobuf_message,
+            load_plan=load_plan,
+            load_values=load_values,
+            export_plan=build_export_plan(cls._schema.fields),
+            trusted_checks=trusted_checks,
+            lazy_steps=build_lazy_steps(load_plan, trusted_checks),
+            flags=flags,
         )
 
-        return cls
+        if flags.codegen:
+            # Generated loader reads the plan from protobuf_options, it has to
+            # be compiled after they are set.
+            cls.protobuf_options = replace(
+                cls.protobuf_options,
+                load_values=compile_load_values(cls),
+            )
 
 
 class Model(schematics.Model, metaclass=ModelMeta, protobuf_message=_Ignore):
@@ -54,45 +150,355 @@ class Model(schematics.Model, metaclass=ModelMeta, protobuf_message=_Ignore):
 
     protobuf_options: ModelOptions
 
+    # Fields left out of an instance loaded with `fields`.
+    _not_loaded = frozenset()
+    # Number of exports which changed the retained message, see
+    # `schematics_proto3.tracking`.
+    _revision = 0
+
+    @classmethod
+    def load_protobuf(cls, msg, trusted=False, lazy=False, fields=None):
+        """
+        Load model instance from protobuf message.
+
+        With `trusted` set, values read from the message are put into the
+        instance directly, skipping schematics conversion of every field.
+        Values are assumed to be of types matching model fields, only
+        required fields are checked and values of non-protobuf types which
+        need it are converted. `validate()` works just as for any other
+        instance.
+
+        With `lazy` set, instance keeps a reference to `msg` and converts
+        each field the first time it is accessed, only presence of required
+        fields is checked upfront. `validate()`, `to_native()` and
+        `to_protobuf()` load whatever fields they need. `msg` must not be
+        modified while the instance uses it.
+
+        With `fields` given, a collection of field names or dotted paths into
+        nested message fields (e.g. `['kind', 'header.tenant_id']`), only
+        these fields are loaded, see `schematics_proto3.projection`. Other
+        fields are not loaded: reading them raises `UndefinedValueError`,
+        they are neither exported nor validated, unless set in the meantime.
+        """
+        if fields is not None:
+            if lazy:
+                raise ValueError('lazy loaded models cannot be projected')
+
+            return cls._load_projection(msg, trusted, fields)
+
+        if lazy:
+            return cls._from_lazy_values(LazyValues(msg, cls.protobuf_options.lazy_steps))
+
+        values = cls.protobuf_options.load_values(msg)
+
+        if trusted:
+            return cls._from_trusted_values(values)
+
+        return cls(values)
+
+    @classmethod
+    def load_protobuf_many(cls, items: Iterable, trusted=False, executor=None, chunk_size=1024) -> List['Model']:
+        """
+        Load model instances from an iterable of protobuf messages or
+        serialized messages (bytes, bytearray or memoryview).
+
+        Serialized messages are parsed into a single, reused message
+        instance. For that reason fields must not keep references to
+        messages (i.e. use protobuf aware types for message fields).
+
+        With `executor` (e.g. `concurrent.futures.ThreadPoolExecutor`)
+        given, items are loaded in chunks of `chunk_size` submitted to it.
+        Order of items is preserved.
+        """
+        if executor is None:
+            return cls._load_protobuf_chunk(items, trusted)
+
+        items = iter(items)
+        chunks = iter(lambda: list(islice(items, chunk_size)), [])
+        results = executor.map(cls._load_protobuf_chunk, chunks, repeat(trusted))
+
+        return list(chain.from_iterable(results))
+
     @classmethod
-    def load_protobuf(cls, msg):
-        field_names = {descriptor.name for descriptor, _ in msg.ListFields()}
-        values = {}
+    def from_bytes(cls, buf, trusted=False, lazy=False, reuse_message=False, fields=None):
+        """
+        Load model instance from serialized protobuf message, given as
+        bytes, bytearray or memoryview. `trusted`, `lazy` and `fields` work
+        as for `load_protobuf`.
+
+        With `reuse_message` set, message is parsed into a per-thread scratch
+        instance instead of a new one. Fields must not keep references to
+        messages then, and it cannot be combined with `lazy` loading.
+        """
+        message_class = cls.protobuf_options.message_class
+
+        if reuse_message:
+            if lazy:
+                raise ValueError('lazy loaded models cannot reuse messages')
 
-        for name, field in cls.fields.items():
-            pb_field_name = field.metadata.get('protobuf_field', name)
-            value_getter_func = getattr(field, 'convert_protobuf', get_value_fallback)
+            msg = _get_scratch_message(message_class)
+        else:
+            msg = message_class()
 
-            values[name] = value_getter_func(msg, pb_field_name, field_names)
+        parse_message(msg, buf)
+
+        return cls.load_protobuf(msg, trusted=trusted, lazy=lazy, fields=fields)
+
+    @classmethod
+    def decode(cls, buf, trusted=False):
+        """
+        Load model instance from serialized protobuf message, given as
+        bytes, bytearray or memoryview, decoding the wire format directly
+        into values of fields. No message instance is created for types the
+        decoder knows, see `schematics_proto3.decoder`. `trusted` works as
+        for `load_protobuf`.
+        """
+        values = decode_values(cls, buf)
+
+        if trusted:
+            return cls._from_trusted_values(values)
 
         return cls(values)
 
-    def to_protobuf(self: 'Model') -> Message:
+    @classmethod
+    def _load_protobuf_chunk(cls, items, trusted):
+        options = cls.protobuf_options
+        load_values = options.load_values
+        construct = cls._from_trusted_values if trusted else cls
+        # Scratch message is local to a chunk, so chunks can be loaded
+        # concurrently.
+        scratch = None
+        models = []
+
+        for item in items:
+            if not isinstance(item, Message):
+                if scratch is None:
+                    scratch = options.message_class()
+
+                item = parse_message(scratch, item)
+
+            models.append(construct(load_values(item)))
+
+        return models
+
+    @classmethod
+    def load_compact(cls, msg, trusted=False):
+        """
+        Load compact record of protobuf message, see
+        `schematics_proto3.compact`. The Model has to be declared with
+        `compact=True`. `trusted` works as for `load_protobuf`.
+        """
+        values = cls.protobuf_options.load_values(msg)
+
+        if trusted:
+            return get_compact_class(cls).from_values(cls._check_trusted_values(values))
+
+        return cls(values).to_compact()
+
+    @classmethod
+    def _load_projection(cls, msg, trusted, fields):
+        projection = get_projection(cls, fields)
+        values = projection.load_values(msg)
+
+        if trusted:
+            instance = cls._from_data(cls._check_trusted_values(values, projection.trusted_checks))
+        else:
+            # Fields which are not loaded are left out, not set to None.
+            instance = cls(values, init=False)
+
+        instance._not_loaded = projection.not_loaded
+
+        return instance
+
+    @classmethod
+    def _from_trusted_values(cls, values):
+        return cls._from_data(cls._check_trusted_values(values))
+
+    @classmethod
+    def _check_trusted_values(cls, values, trusted_checks=None):
+        errors = {}
+
+        if trusted_checks is None:
+            trusted_checks = cls.protobuf_options.trusted_checks
+
+        for name, field, convert in trusted_checks:
+            value = values[name]
+
+            try:
+                field.check_required(value, _IMPORT_CONTEXT)
+
+                if convert and value is not Unset:
+                    values[name] = field.convert(value, _IMPORT_CONTEXT)
+            except (FieldError, CompoundError) as exc:
+                errors[field.serialized_name or name] = exc
+
+        if errors:
+            raise DataError(errors, values)
+
+        return values
+
+    @classmethod
+    def _from_lazy_values(cls, values):
+        errors = {}
+
+        for name, field, _ in cls.protobuf_options.trusted_checks:
+            if field.required and values.is_unset(name):
+                try:
+                    field.check_required(Unset, _IMPORT_CONTEXT)
+                except (FieldError, CompoundError) as exc:
+                    errors[field.serialized_name or name] = exc
+
+        if errors:
+            raise DataError(errors, {})
+
+        return cls._from_data(values)
+
+    @classmethod
+    def _from_data(cls, values):
+        # Equivalent of what Model.__init__ does, sans conversion.
+        instance = cls.__new__(cls)
+        instance._data = ModelDict(converted=values)  # pylint: disable=protected-access
+
+        return instance
+
+    @classmethod
+    def _append_field(cls, field_name, field_type):
+        super()._append_field(field_name, field_type)
+
+        # Keep compiled plans in sync with the schema.
+        if hasattr(cls, 'protobuf_options'):
+            options = cls.protobuf_options
+            ModelMeta.compile_options(cls, options.message_class, flags=options.flags)
+
+    def validate(self, *args, **kwargs):
+        # pylint: disable=arguments-differ
+        if not self._not_loaded or kwargs.get('trusted_data'):
+            return super().validate(*args, **kwargs)
+
+        # Fields which were not loaded are skipped, unless set since.
+        converted = self._data.converted
+        kwargs['trusted_data'] = {name: Undefined for name in self._not_loaded if name not in converted}
+
+        try:
+            return super().validate(*args, **kwargs)
+        finally:
+            valid = self._data.valid
+            self._data.valid = {name: value for name, value in valid.items() if value is not Undefined}
+
+    def to_protobuf(self: 'Model', field_mask=None, into: Message = None) -> Message:
+        """
+        Export model to protobuf message.
+
+        Models declared with `track_changes=True` export only fields changed
+        since the previous call, into the message it returned, see
+        `schematics_proto3.tracking`.
+
+        With `field_mask` given, a `google.protobuf.FieldMask` or a collection
+        of its paths, only masked fields are exported, see
+        `schematics_proto3.field_mask`.
+
+        With `into` given, a message of the Model message type, it is cleared
+        and filled instead of a new message, and returned. Nested messages
+        are filled in place as well. Changes are not tracked then.
+        """
         assert isinstance(self, schematics.Model)
 
-        msg = self.protobuf_options.message_class()
-
-        for name, field in self.fields.items():
-            pb_name = field.metadata.get('protobuf_field', name)
-
-            if isinstance(field, WrapperTypeMixin):
-                # This is a wrapped value, assign it iff not Unset.
-                val = getattr(self, name)
-                field.export_protobuf(msg, pb_name, val)
-            elif isinstance(field, Model):
-                # Compound, nested field, delegate serialisation to model
-                # instance.
-                setattr(msg, pb_name, field.to_protobuf())
-            elif isinstance(field, OneOfType):
-                val = getattr(self, name)
-                field.export_protobuf(msg, pb_name, val)
-            else:
-                # Primitive value, just assign it.
-                val = getattr(self, name)
-                if val is not None:
-                    setattr(msg, pb_name, val)
+        options = self.protobuf_options
+
+        if into is None:
+            if field_mask is None and options.flags.track_changes:
+                return export_changes(self)
+
+            msg = options.message_class()
+        else:
+            if into.DESCRIPTOR is not options.message_class.DESCRIPTOR:
+                raise TypeError(f'{type(self).__name__} cannot be exported into {into.DESCRIPTOR.full_name}')
+
+            converted = self._data.converted
+
+            if isinstance(converted, LazyValues):
+                # Values which are not loaded yet are read from the source
+                # message, which may be the one about to be cleared.
+                converted.load_pending()
+
+            msg = into
+            msg.Clear()
+
+        if field_mask is not None:
+            return export_masked(self, get_mask_plan(type(self), field_mask), msg)
+
+        data = self._data
+
+        for name, pb_name, export in options.export_plan:
+            export(msg, pb_name, data.get(name))
 
         return msg
 
+    def apply_protobuf(self, msg, field_mask):
+        """
+        Update model in place with values of fields of `msg` masked by
+        `field_mask`, a `google.protobuf.FieldMask` or a collection of its
+        paths. Masked fields which are not set in `msg` are cleared. Updated
+        values are converted and validated by `validate()`, as values set by
+        assignment are.
+        """
+        plan = get_mask_plan(type(self), field_mask)
+        apply_masked(self, msg, plan)
+        self._mark_changed(step.name for step in plan)
+
+    def import_data(self, raw_data, recursive=False, **kwargs):
+        super().import_data(raw_data, recursive=recursive, **kwargs)
+        self._mark_changed(name for name in raw_data if name in self._schema.fields)
+
+        return self
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        # Flag is checked first, most Models do not track changes.
+        if self.protobuf_options.flags.track_changes and name in self._schema.fields:
+            self._mark_changed((name,))
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+
+        if self.protobuf_options.flags.track_changes and name in self._schema.fields:
+            self._mark_changed((name,))
+
+    def _mark_changed(self, names):
+        if self.protobuf_options.flags.track_changes:
+            self.__dict__.setdefault('_changed', set()).update(names)
+
+    def to_compact(self):
+        """
+        Return compact record of the instance values, see
+        `schematics_proto3.compact`.
+        """
+        return get_compact_class(type(self)).from_values(self._data)
+
+    def to_bytes(self, out: bytearray = None, reuse_message=False):
+        """
+        Serialize model to protobuf wire format.
+
+        Returns bytes, or if `out` bytearray is given, appends serialized
+        message to it and returns it.
+
+        With `reuse_message` set, model is exported into a per-thread scratch
+        message, the one `from_bytes` reuses, instead of a new one.
+        """
+        if reuse_message:
+            msg = self.to_protobuf(into=_get_scratch_message(self.protobuf_options.message_class))
+        else:
+            msg = self.to_protobuf()
+
+        data = msg.SerializeToString()
+
+        if out is None:
+            return data
+
+        out += data
+
+        return out
+
     def __hash__(self):
         return hash(tuple(field for field in self.fields))
@@ -0,0 +1,269 @@
+# -*- coding:utf-8 -*-
+"""
+Per-class plans describing how Model fields map onto protobuf message fields.
+
+Plans are compiled once, when a Model class is created, so that loading
+does not have to inspect field metadata or look up converters on every call.
+Plans built on demand (projections, mask plans, decoders, record classes)
+are kept in a `ClassCache`.
+"""
+import weakref
+from typing import Callable, NamedTuple, Tuple
+
+from google.protobuf.descriptor import FieldDescriptor
+from schematics.types import BaseType, BooleanType, NumberType, StringType
+
+from schematics_proto3.types.base import ProtobufTypeMixin
+from schematics_proto3.types.repeated import RepeatedType
+from schematics_proto3.utils import get_value_fallback, set_value_fallback
+
+__all__ = ['ClassCache', 'LoadStep', 'ExportStep', 'TrustedCheck', 'build_load_plan', 'build_export_plan',
+           'build_trusted_checks', 'make_load_values', 'make_sparse_load_values', 'PRESENCE_SCALAR',
+           'PRESENCE_MESSAGE', 'PRESENCE_REPEATED', 'PRESENCE_ONEOF']
+
+
+# Field is always present, unset fields read as protobuf default value.
+PRESENCE_SCALAR = 'scalar'
+# Singular message field (wrappers, Timestamp, nested messages), present
+# only if explicitly set.
+PRESENCE_MESSAGE = 'message'
+# Repeated field, present only if non-empty.
+PRESENCE_REPEATED = 'repeated'
+# Oneof group, present if any of its variants is set.
+PRESENCE_ONEOF = 'oneof'
+
+# Implementations of `to_native` which return protobuf scalar values as they
+# are, given that field type matches protobuf field type.
+_IDENTITY_TO_NATIVE = frozenset([
+    BaseType.to_native,
+    StringType.to_native,
+    NumberType.to_native,
+    BooleanType.to_native,
+])
+_IDENTITY_CONVERT = frozenset([
+    BaseType.convert,
+    ProtobufTypeMixin.convert,
+])
+
+
+class LoadStep(NamedTuple):
+    """
+    Single entry of a load plan.
+    """
+    name: str
+    protobuf_name: str
+    convert: Callable
+    presence: str
+
+
+class ExportStep(NamedTuple):
+    """
+    Single entry of an export plan.
+    """
+    name: str
+    protobuf_name: str
+    export: Callable
+
+
+class TrustedCheck(NamedTuple):
+    """
+    Field which has to be checked, or converted, when a Model is constructed
+    from trusted values.
+    """
+    name: str
+    field: BaseType
+    convert: bool
+
+
+class ClassCache:
+    """
+    Values built from Model classes, by class and key. Values are derived
+    from `protobuf_options` of a class, they are built again once options
+    are recompiled (e.g. when a field is appended) and dropped together
+    with the class.
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__ = ('_entries',)
+
+    def __init__(self):
+        # Model class to (options values were built for, dict of key to
+        # value).
+        self._entries = weakref.WeakKeyDictionary()
+
+    def get(self, model_class, key, build, *args):
+        """
+        Return value of `model_class` for `key`, `build(model_class, *args)`
+        the first time.
+        """
+        options = model_class.protobuf_options
+        entry = self._entries.get(model_class)
+
+        if entry is None or entry[0] is not options:
+            entry = self._entries[model_class] = (options, {})
+
+        value = entry[1].get(key)
+
+        if value is None:
+            value = entry[1][key] = build(model_class, *args)
+
+        return value
+
+
+def get_presence(descriptor, pb_name):
+    """
+    Determine presence kind of `pb_name` field (or oneof) of a message
+    described by `descriptor`. Raises RuntimeError if there is no such
+    field.
+    """
+    if pb_name in descriptor.oneofs_by_name:
+        return PRESENCE_ONEOF
+
+    field = descriptor.fields_by_name.get(pb_name)
+
+    if field is None:
+        raise RuntimeError(f'{descriptor.full_name} has no field or oneof `{pb_name}`')
+
+    if field.label == FieldDescriptor.LABEL_REPEATED:
+        return PRESENCE_REPEATED
+
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        return PRESENCE_MESSAGE
+
+    return PRESENCE_SCALAR
+
+
+def build_load_plan(fields, message_class) -> Tuple[LoadStep, ...]:
+    """
+    Compile load plan for given Model fields and protobuf message class.
+    """
+    descriptor = message_class.DESCRIPTOR
+    plan = []
+
+    for name, field in fields.items():
+        pb_name = field.metadata.get('protobuf_field', name)
+
+        plan.append(LoadStep(
+            name=name,
+            protobuf_name=pb_name,
+            convert=getattr(field, 'convert_protobuf', get_value_fallback),
+            presence=get_presence(descriptor, pb_name),
+        ))
+
+    return tuple(plan)
+
+
+def build_export_plan(fields) -> Tuple[ExportStep, ...]:
+    """
+    Compile export plan for given Model fields.
+    """
+    return tuple(
+        ExportStep(
+            name=name,
+            protobuf_name=field.metadata.get('protobuf_field', name),
+            export=getattr(field, 'export_protobuf', set_value_fallback),
+        )
+        for name, field in fields.items()
+    )
+
+
+def _converts_as_is(field):
+    field_cls = type(field)
+
+    return (
+        not field.is_compound
+        and field_cls.convert in _IDENTITY_CONVERT
+        and field_cls.to_native in _IDENTITY_TO_NATIVE
+    )
+
+
+def loads_native(field, convert):
+    """
+    Check if `convert` loads values of `field` which are already converted to
+    its native type.
+    """
+    if isinstance(field, RepeatedType) and not hasattr(field.field, 'convert_protobuf_value'):
+        return _converts_as_is(field.field)
+
+    # Protobuf aware types convert values on load.
+    if convert is not get_value_fallback:
+        return True
+
+    return _converts_as_is(field)
+
+
+def build_trusted_checks(fields, load_plan) -> Tuple[TrustedCheck, ...]:
+    """
+    Collect fields which still need attention when loaded values are trusted:
+    required ones and those which values are not of a native type yet.
+    """
+    checks = []
+
+    for step in load_plan:
+        field = fields[step.name]
+        convert = not loads_native(field, step.convert)
+
+        if field.required or convert:
+            checks.append(TrustedCheck(step.name, field, convert))
+
+    return tuple(checks)
+
+
+def make_load_values(plan):
+    """
+    Return a function which loads values for fields of `plan` from a message.
+    """
+    def load_values(msg):
+        field_names = {descriptor.name for descriptor, _ in msg.ListFields()}
+
+        return {
+            name: convert(msg, pb_name, field_names)
+            for name, pb_name, convert, _ in plan
+        }
+
+    return load_values
+
+
+def make_sparse_load_values(plan, message_class):
+    """
+    Return a function which loads values for fields of `plan` from a message,
+    visiting only fields which are set in it.
+
+    Values of unset fields are resolved once, from an empty message on the
+    first call, and copied in bulk on every call.
+    """
+    descriptor = message_class.DESCRIPTOR
+    load_values_dense = make_load_values(plan)
+    # Resolved on first use, so declaring a Model does not run converters.
+    defaults = None
+    steps_by_pb_name = {}
+
+    for step in plan:
+        if step.presence == PRESENCE_ONEOF:
+            pb_names = [field.name for field in descriptor.oneofs_by_name[step.protobuf_name].fields]
+        else:
+            pb_names = [step.protobuf_name]
+
+        for pb_name in pb_names:
+            steps_by_pb_name[pb_name] = steps_by_pb_name.get(pb_name, ()) + (step,)
+
+    def load_values(msg):
+        nonlocal defaults
+
+        # Fields of other messages are not known upfront.
+        if msg.DESCRIPTOR is not descriptor:
+            return load_values_dense(msg)
+
+        if defaults is None:
+            defaults = load_values_dense(message_class())
+
+        values = defaults.copy()
+        set_fields = msg.ListFields()
+        field_names = {field_descriptor.name for field_descriptor, _ in set_fields}
+
+        for field_descriptor, _ in set_fields:
+            for name, pb_name, convert, _ in steps_by_pb_name.get(field_descriptor.name, ()):
+                values[name] = convert(msg, pb_name, field_names)
+
+        return values
+
+    return load_values
@@ -0,0 +1,129 @@
+# -*- coding:utf-8 -*-
+"""
+Projection loading: loading a named subset of Model fields from protobuf
+messages.
+
+Fields are given by name, or by dotted paths into fields of nested message
+types (`MessageType`, or `RepeatedType` of `MessageType`), e.g.
+`['kind', 'header.tenant_id']`. Only fields on these paths are converted,
+anything else is not loaded at all.
+"""
+from typing import Callable, Dict, FrozenSet, NamedTuple, Tuple
+
+from schematics_proto3.plan import ClassCache, LoadStep, TrustedCheck, build_trusted_checks, make_load_values
+from schematics_proto3.types import MessageType, RepeatedType
+from schematics_proto3.unset import Unset
+
+__all__ = ['Projection', 'get_projection', 'parse_fields']
+
+
+class Projection(NamedTuple):
+    """
+    Plan of loading a subset of Model fields.
+    """
+    load_plan: Tuple[LoadStep, ...]
+    load_values: Callable
+    trusted_checks: Tuple[TrustedCheck, ...]
+    # Names of fields which are not loaded.
+    not_loaded: FrozenSet[str]
+
+
+def parse_fields(fields) -> Dict[str, FrozenSet[str]]:
+    """
+    Group field paths by their first component. Fields given by name alone
+    are mapped to an empty set, meaning the whole value is loaded.
+    """
+    parsed = {}
+
+    for path in fields:
+        name, _, rest = path.partition('.')
+
+        if not rest:
+            parsed[name] = None
+        elif parsed.get(name, ()) is not None:
+            parsed.setdefault(name, set()).add(rest)
+
+    return {name: frozenset(paths or ()) for name, paths in parsed.items()}
+
+
+def _load_nested(model_class, fields):
+
+    def convert(msg, field_name, field_names):
+        if field_name not in field_names:
+            return Unset
+
+        return model_class.load_protobuf(getattr(msg, field_name), trusted=True, fields=fields)
+
+    return convert
+
+
+def _load_nested_repeated(model_class, fields):
+    load_protobuf = model_class.load_protobuf
+
+    def convert(msg, field_name, field_names):
+        if field_name not in field_names:
+            return Unset
+
+        return [load_protobuf(item, trusted=True, fields=fields) for item in getattr(msg, field_name)]
+
+    return convert
+
+
+def _nested_convert(model_class, name, field, paths):
+    if isinstance(field, MessageType):
+        return _load_nested(field.model_class, paths)
+
+    if isinstance(field, RepeatedType) and isinstance(field.field, MessageType):
+        return _load_nested_repeated(field.field.model_class, paths)
+
+    raise ValueError(f'field `{name}` of {model_class.__name__} is not a message field, '
+                     f'nested fields of it cannot be loaded')
+
+
+def build_projection(model_class, fields) -> Projection:
+    """
+    Compile projection of `model_class` loading `fields` only.
+    """
+    # pylint: disable=protected-access
+    schema_fields = model_class._schema.fields
+    parsed = parse_fields(fields)
+
+    unknown = set(parsed) - set(schema_fields)
+    if unknown:
+        raise ValueError(f'{model_class.__name__} has no fields: {", ".join(sorted(unknown))}')
+
+    plan = []
+
+    for step in model_class.protobuf_options.load_plan:
+        paths = parsed.get(step.name)
+
+        if paths is None:
+            continue
+
+        if paths:
+            step = step._replace(convert=_nested_convert(model_class, step.name, schema_fields[step.name], paths))
+
+        plan.append(step)
+
+    plan = tuple(plan)
+
+    return Projection(
+        load_plan=plan,
+        load_values=make_load_values(plan),
+        trusted_checks=build_trusted_checks(schema_fields, plan),
+        not_loaded=frozenset(schema_fields) - {step.name for step in plan},
+    )
+
+
+_PROJECTIONS = ClassCache()
+
+
+def get_projection(model_class, fields) -> Projection:
+    """
+    Return projection of `model_class` loading `fields` only, compiled once
+    per set of fields.
+    """
+    if isinstance(fields, str):
+        raise TypeError('fields must be a collection of field names, not a string')
+
+    return _PROJECTIONS.get(model_class, frozenset(fields), build_projection, fields)
@@ -0,0 +1,192 @@
+# -*- coding:utf-8 -*-
+"""
+Reading and writing streams of varint length-delimited protobuf messages,
+the format of Java's `writeDelimitedTo` / `parseDelimitedFrom`.
+
+Messages are read with bounded memory: file objects are consumed in chunks,
+buffers (bytes, memoryview, mmap) are sliced without copying and messages
+larger than `max_message_size` are rejected.
+"""
+import mmap
+
+from google.protobuf.message import DecodeError, Message
+
+from schematics_proto3.utils import encode_varint, parse_message
+
+__all__ = ['iter_delimited', 'read_delimited', 'write_delimited']
+
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Protobuf default limit of a message size.
+DEFAULT_MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+class _Incomplete(Exception):
+    """
+    Raised when buffer ends in the middle of a varint.
+    """
+
+
+def _decode_varint(buf, pos):
+    result = 0
+    shift = 0
+    end = len(buf)
+
+    while True:
+        if pos >= end:
+            raise _Incomplete()
+
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+
+        if not byte & 0x80:
+            return result, pos
+
+        shift += 7
+        if shift >= 64:
+            raise DecodeError('Too many bytes when decoding varint.')
+
+
+def _check_size(size, max_message_size):
+    if size > max_message_size:
+        raise DecodeError(f'Message of {size} bytes exceeds limit of {max_message_size} bytes.')
+
+
+def _read(fileobj, size):
+    chunk = fileobj.read(size)
+
+    if chunk is None:
+        # Non-blocking file object without data available.
+        raise ValueError('Reading delimited messages requires a blocking file object.')
+
+    return chunk
+
+
+def _iter_buffer(buf, max_message_size):
+    view = memoryview(buf)
+    pos = 0
+    end = len(view)
+
+    while pos < end:
+        try:
+            size, pos = _decode_varint(view, pos)
+        except _Incomplete as exc:
+            raise DecodeError('Truncated message stream.') from exc
+
+        _check_size(size, max_message_size)
+
+        if pos + size > end:
+            raise DecodeError('Truncated message stream.')
+
+        yield view[pos:pos + size]
+        pos += size
+
+
+def _iter_file(fileobj, chunk_size, max_message_size):
+    buf = bytearray()
+    pos = 0
+
+    while True:
+        try:
+            size, start = _decode_varint(buf, pos)
+        except _Incomplete as exc:
+            chunk = _read(fileobj, chunk_size)
+
+            if not chunk:
+                if pos < len(buf):
+                    raise DecodeError('Truncated message stream.') from exc
+                return
+
+            del buf[:pos]
+            pos = 0
+            buf += chunk
+            continue
+
+        _check_size(size, max_message_size)
+        end = start + size
+
+        if end > len(buf):
+            # Drop consumed part and read the rest of the message at once.
+            del buf[:pos]
+            end -= pos
+            start -= pos
+            pos = 0
+
+            chunk = _read(fileobj, max(end - len(buf), chunk_size))
+
+            while chunk:
+                buf += chunk
+
+                if len(buf) >= end:
+                    break
+
+                # Short reads are allowed for raw files.
+                chunk = _read(fileobj, end - len(buf))
+
+            if len(buf) < end:
+                raise DecodeError('Truncated message stream.')
+
+        yield bytes(buf[start:end])
+        pos = end
+
+
+def iter_delimited(source, chunk_size=DEFAULT_CHUNK_SIZE, max_message_size=DEFAULT_MAX_MESSAGE_SIZE):
+    """
+    Iterate over serialized messages of a length-delimited stream.
+
+    `source` is either a binary file object or a buffer (bytes, bytearray,
+    memoryview, mmap). Messages of buffers are yielded as memoryview slices
+    of it, file objects are read in chunks of `chunk_size` bytes and must be
+    blocking. Messages larger than `max_message_size` bytes raise
+    `DecodeError`.
+    """
+    if isinstance(source, BUFFER_TYPES):
+        return _iter_buffer(source, max_message_size)
+
+    return _iter_file(source, chunk_size, max_message_size)
+
+
+def read_delimited(model_class, source, trusted=False, lazy=False, chunk_size=DEFAULT_CHUNK_SIZE, *,
+                   max_message_size=DEFAULT_MAX_MESSAGE_SIZE):
+    """
+    Iterate over Model instances loaded from a length-delimited stream of
+    `model_class` messages. See `iter_delimited` for `source`, `chunk_size`
+    and `max_message_size` description.
+
+    Unless `lazy` is set, all messages are parsed into a single, reused
+    message instance. For that reason fields must not keep references to
+    messages (i.e. use protobuf aware types for message fields).
+    """
+    # pylint: disable=too-many-arguments
+    message_class = model_class.protobuf_options.message_class
+    msg = None
+
+    for data in iter_delimited(source, chunk_size, max_message_size):
+        if lazy or msg is None:
+            msg = message_class()
+
+        parse_message(msg, data)
+
+        yield model_class.load_protobuf(msg, trusted=trusted, lazy=lazy)
+
+
+def write_delimited(fileobj, items):
+    """
+    Write Model instances (or protobuf messages) to a binary file object as
+    a length-delimited stream. Returns number of written messages.
+    """
+    count = 0
+
+    for item in items:
+        if isinstance(item, Message):
+            data = item.SerializeToString()
+        else:
+            data = item.to_bytes()
+
+        fileobj.write(encode_varint(len(data)))
+        fileobj.write(data)
+        count += 1
+
+    return count
@@ -0,0 +1,167 @@
+# -*- coding:utf-8 -*-
+"""
+Change tracking and incremental export of Models.
+
+Models declared with `track_changes=True` keep the message built by the last
+`to_protobuf()` call and record which fields changed since. The next call
+exports only these fields into the same message and returns it, anything
+else, sub-messages of unchanged nested models included, is left as it is.
+
+Fields change when assigned (as attributes or items), updated by
+`apply_protobuf` or `import_data`. Values which can change in place are
+compared with snapshots taken on export: lists by their items, oneof
+variants by variant and value, arrays by contents, and nested Models by
+their own changes. Nested Models of classes which do not track changes are
+exported every time.
+
+The returned message is owned by the model: it is updated by later
+`to_protobuf()` calls and must not be modified.
+"""
+from schematics_proto3.oneof import OneOfVariant
+from schematics_proto3.utils import get_loaded_numpy
+
+__all__ = ['take_snapshot', 'is_changed', 'has_changes', 'export_changes']
+
+
+# Kind of snapshots of NumPy arrays.
+_ARRAY = 'array'
+
+
+def _is_array(value):
+    numpy = get_loaded_numpy()
+
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _is_tracked_model(value):
+    options = getattr(value, 'protobuf_options', None)
+
+    return options is not None and options.flags.track_changes
+
+
+def take_snapshot(value):
+    """
+    Return snapshot of `value`, to tell later if it changed in place. Values
+    which cannot change in place have no snapshot, None is returned.
+    """
+    # pylint: disable=protected-access
+    if isinstance(value, list):
+        # Validation copies lists, items are compared rather than lists.
+        return list, list(value), [take_snapshot(item) for item in value]
+
+    if isinstance(value, OneOfVariant):
+        return OneOfVariant, value.variant, value.value, take_snapshot(value.value)
+
+    if _is_array(value):
+        return _ARRAY, value.copy()
+
+    if hasattr(value, 'protobuf_options'):
+        # Revision tells if the Model was exported elsewhere in the meantime.
+        return value, value._revision
+
+    return None
+
+
+def is_changed(value, snapshot):
+    """
+    Check if `value` changed since `snapshot` of it was taken.
+    """
+    # pylint: disable=protected-access
+    if snapshot is None:
+        return take_snapshot(value) is not None
+
+    kind = snapshot[0]
+
+    if kind is list:
+        _, items, snapshots = snapshot
+
+        return (
+            not isinstance(value, list)
+            or len(value) != len(items)
+            or any(item is not old for item, old in zip(value, items))
+            or any(is_changed(item, item_snapshot) for item, item_snapshot in zip(value, snapshots))
+        )
+
+    if kind is OneOfVariant:
+        _, variant, variant_value, value_snapshot = snapshot
+
+        return (
+            not isinstance(value, OneOfVariant)
+            or value.variant != variant
+            or value.value is not variant_value
+            or is_changed(value.value, value_snapshot)
+        )
+
+    if kind is _ARRAY:
+        old = snapshot[1]
+
+        # Snapshot of an array means numpy is imported.
+        return not _is_array(value) or value.dtype != old.dtype or not get_loaded_numpy().array_equal(value, old)
+
+    if value is not kind or not _is_tracked_model(value):
+        return True
+
+    return value._revision != snapshot[1] or has_changes(value)
+
+
+def has_changes(model):
+    """
+    Check if `model` changed since it was exported last time, or has not
+    been exported at all.
+    """
+    state = model.__dict__
+
+    if not state.get('_revision'):
+        return True
+
+    data = model._data  # pylint: disable=protected-access
+
+    return bool(state['_changed']) or any(
+        is_changed(data.get(name), snapshot) for name, snapshot in state['_snapshots'].items()
+    )
+
+
+def export_changes(model):
+    """
+    Export fields of `model` changed since the previous call into the
+    message it returned, or all fields into a new message on the first call.
+    """
+    options = model.protobuf_options
+    state = model.__dict__
+    data = model._data  # pylint: disable=protected-access
+    full = not state.get('_revision')
+
+    if full:
+        msg = state['_retained'] = options.message_class()
+        changed = ()
+        snapshots = {}
+    else:
+        msg = state['_retained']
+        changed = state['_changed']
+        snapshots = state['_snapshots']
+
+    exported = full
+    new_snapshots = {}
+
+    for name, pb_name, export in options.export_plan:
+        value = data.get(name)
+
+        if not full and (name in changed or is_changed(value, snapshots.get(name))):
+            # Oneof groups are cleared by name too.
+            msg.ClearField(pb_name)
+            export(msg, pb_name, value)
+            exported = True
+        elif full:
+            export(msg, pb_name, value)
+
+        snapshot = take_snapshot(value)
+        if snapshot is not None:
+            new_snapshots[name] = snapshot
+
+    state['_changed'] = set()
+    state['_snapshots'] = new_snapshots
+
+    if exported:
+        state['_revision'] = state.get('_revision', 0) + 1
+
+    return msg
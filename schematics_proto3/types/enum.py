@@ -21,22 +21,37 @@ class EnumType(ProtobufTypeMixin, BaseType):
         self.enum_class: Type[ProtobufEnum] = enum_class
         self.unset_variant = unset_variant
 
+        self._unset_values = frozenset([Unset, unset_variant])
+        self._members_by_name = dict(enum_class.members_by_name)
+        self._members_by_number = dict(enum_class.members_by_number)
+        # Protobuf numbers to loaded values, `unset_variant` loads as Unset.
+        self._protobuf_values = dict(self._members_by_number)
+        if unset_variant is not Unset:
+            self._protobuf_values[unset_variant] = Unset
+
     def check_required(self: BaseType, value, context):
         # Treat Unset as required rule violation.
-        if self.required and value in {Unset, self.unset_variant}:
+        if self.required and value in self._unset_values:
             raise ConversionError(self.messages['required'])
 
         super().check_required(value, context)
 
     def convert(self, value, context):
-        if value in {Unset, self.unset_variant}:
+        if value in self._unset_values:
             return Unset
 
         if isinstance(value, str):
-            return self.enum_class[value]
+            try:
+                return self._members_by_name[value]
+            except KeyError:
+                return self.enum_class[value]
 
         if isinstance(value, int):
-            return self.enum_class(value)
+            try:
+                return self._members_by_number[value]
+            except KeyError:
+                # Let the enum class raise its usual error.
+                return self.enum_class(value)
 
         raise AttributeError(f'Expected int or str, got {type(value)}')
 
@@ -56,15 +71,30 @@ class EnumType(ProtobufTypeMixin, BaseType):
         # TODO: Catch AttributeError and raise proper exception.
         value = getattr(msg, field_name)
 
-        if value in {Unset, self.unset_variant}:
-            return Unset
+        return self.convert_protobuf_value(value)
 
-        return value
+    def convert_protobuf_value(self, value):
+        try:
+            return self._protobuf_values[value]
+        except KeyError:
+            if value is Unset:
+                return Unset
+            return self.enum_class(value)
+
+    def convert_protobuf_values(self, values):
+        """
+        Convert all values of a repeated protobuf field at once.
+        """
+        try:
+            return list(map(self._protobuf_values.__getitem__, values))
+        except KeyError:
+            # Unknown number somewhere, fail the usual way.
+            return [self.convert_protobuf_value(value) for value in values]
 
     def export_protobuf(self, msg, field_name, value):
         # pylint: disable=no-self-use
         # TODO: Check that model_class is an instance of Model
-        if field_name is Unset:
+        if value is Unset or value is None:
             return
 
         setattr(
@@ -72,3 +102,7 @@ class EnumType(ProtobufTypeMixin, BaseType):
             field_name,
             value.value,
         )
+
+    def append_protobuf(self, container, value):
+        # pylint: disable=no-self-use
+        container.append(value.value)
@@ -18,6 +18,19 @@ class MessageType(ProtobufTypeMixin, ModelType):
 
         return super().convert(value, context)
 
+    def _convert(self, value, context):
+        # pylint: disable=protected-access
+        if isinstance(value, self.model_class) and (value._not_loaded or value.protobuf_options.flags.track_changes):
+            # Instances loaded with `fields` skip fields which are not loaded,
+            # those which track changes keep their exported message,
+            # rebuilding them would lose track of these.
+            if getattr(context, 'validate', False):
+                value.validate(partial=context.partial)
+
+            return value
+
+        return super()._convert(value, context)
+
     def convert_protobuf(self, msg, field_name, field_names):
         # TODO: Check that model_class is an instance of Model
         if field_name not in field_names:
@@ -26,16 +39,35 @@ class MessageType(ProtobufTypeMixin, ModelType):
         # TODO: Catch AttributeError and raise proper exception.
         value = getattr(msg, field_name)
 
-        return self.model_class.load_protobuf(value)
+        # Nested models are always built from trusted values, the owner model
+        # converts them again unless it is loaded in trusted mode itself.
+        return self.model_class.load_protobuf(value, trusted=True)
+
+    def convert_protobuf_value(self, value):
+        return self.model_class.load_protobuf(value, trusted=True)
 
     def export_protobuf(self, msg, field_name, value):
         # pylint: disable=no-self-use
         # TODO: Check that model_class is an instance of Model
-        if field_name is Unset:
+        if value is Unset or value is None:
             return
 
-        setattr(
-            msg,
-            field_name,
-            value.to_protobuf(),
-        )
+        target = getattr(msg, field_name)
+        target.SetInParent()
+        _export_into(target, value)
+
+    def append_protobuf(self, container, value):
+        # pylint: disable=no-self-use
+        _export_into(container.add(), value)
+
+
+def _export_into(target, value):
+    options = getattr(value, 'protobuf_options', None)
+
+    if options is not None and options.flags.track_changes:
+        # Tracked models export changes into their own message, which keeps
+        # their tracking state in sync.
+        target.CopyFrom(value.to_protobuf())
+    else:
+        # Composite fields cannot be assigned, fill them in place.
+        value.to_protobuf(into=target)
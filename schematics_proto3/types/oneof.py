@@ -1,4 +1,6 @@
 # -*- coding:utf-8 -*-
+from typing import Callable, NamedTuple
+
 from schematics.common import NOT_NONE
 from schematics.exceptions import ValidationError, DataError, CompoundError, StopValidationError
 from schematics.types import CompoundType, BaseType
@@ -9,7 +11,18 @@ from schematics_proto3.types.base import ProtobufTypeMixin
 from schematics_proto3.unset import Unset
 from schematics_proto3.utils import get_value_fallback, set_value_fallback
 
-__all__ = ['OneOfType']
+__all__ = ['OneOfType', 'OneOfVariantSpec']
+
+
+class OneOfVariantSpec(NamedTuple):
+    """
+    Resolved variant of a oneof field.
+    """
+    name: str
+    protobuf_name: str
+    field: BaseType
+    convert_protobuf: Callable
+    export_protobuf: Callable
 
 
 class OneOfType(ProtobufTypeMixin, CompoundType):
@@ -22,64 +35,66 @@ class OneOfType(ProtobufTypeMixin, CompoundType):
         super().__init__(*args, **kwargs)
 
         self.variants_spec = variants_spec
-        self._variant = None
-        self._variant_type = None
-        self._protobuf_renames = {}
         self._default = Unset
+        # Variants are resolved by both Model and protobuf names, nothing about
+        # the current variant is stored on the (shared) field instance.
+        self._variants = {}
 
         for name, spec in variants_spec.items():
             pb_name = spec.metadata.get('protobuf_field', None)
 
-            if pb_name is not None:
-                if pb_name in variants_spec:
-                    raise RuntimeError(f'Duplicated variant name `{pb_name}`')
+            if pb_name is not None and pb_name in variants_spec:
+                raise RuntimeError(f'Duplicated variant name `{pb_name}`')
 
-                self._protobuf_renames[pb_name] = name
+            if pb_name is not None and pb_name in self._variants:
+                raise RuntimeError(f'Duplicated variant protobuf name `{pb_name}`')
 
-    @property
-    def variant(self):
-        return self._variant
+            variant = OneOfVariantSpec(
+                name=name,
+                protobuf_name=pb_name or name,
+                field=spec,
+                convert_protobuf=getattr(spec, 'convert_protobuf', get_value_fallback),
+                export_protobuf=getattr(spec, 'export_protobuf', set_value_fallback),
+            )
 
-    @variant.setter
-    def variant(self, name):
-        if name in self.variants_spec:
-            self._variant = name
-            self._variant_type = self.variants_spec[name]
-        elif name in self._protobuf_renames:
-            self._variant = self._protobuf_renames[name]
-            self._variant_type = self.variants_spec[self._variant]
-        else:
-            raise KeyError(name)
+            self._variants[name] = variant
+            self._variants[variant.protobuf_name] = variant
 
-    @property
-    def variant_type(self):
-        return self._variant_type
+    def get_variant(self, name) -> OneOfVariantSpec:
+        """
+        Return spec of a variant given its Model or protobuf name.
+        """
+        return self._variants[name]
 
-    def pre_setattr(self, value):
+    @staticmethod
+    def _to_variant(value):
         # TODO: Raise proper exceptions
-        variant = None
-
         if isinstance(value, OneOfVariant):
-            variant = value
+            return value
 
         if isinstance(value, tuple):
             if len(value) != 2:
                 raise RuntimeError(
                     f'OneOfVariant tuple must have 2 items, got {len(value)}'
                 )
-            variant = OneOfVariant(value[0], value[1])
+            return OneOfVariant(value[0], value[1])
 
         if isinstance(value, dict):
             if 'variant' not in value or 'value' not in value:
                 raise RuntimeError(
                     'OneOfVariant dict must have `variant` and `value` keys.'
                 )
-            variant = OneOfVariant(value['variant'], value['value'])
+            return OneOfVariant(value['variant'], value['value'])
 
-        if variant is None:
-            raise RuntimeError('Unknown value')
+        raise RuntimeError('Unknown value')
 
-        self.variant = variant.variant
+    def pre_setattr(self, value):
+        variant = self._to_variant(value)
+        # Fails early on unknown variants.
+        name = self.get_variant(variant.variant).name
+
+        if name != variant.variant:
+            variant = OneOfVariant(name, variant.value)
 
         return variant
 
@@ -88,23 +103,23 @@ class OneOfType(ProtobufTypeMixin, CompoundType):
         if value is Unset:
             return Unset
 
-        if self.variant is None:
-            raise RuntimeError('Variant is unset')
+        value = self._to_variant(value)
+        variant = self.get_variant(value.variant)
 
-        val = self.variant_type.convert(value, context)
-
-        return OneOfVariant(self.variant, val)
+        return OneOfVariant(variant.name, variant.field.convert(value.value, context))
 
     def validate(self: BaseType, value, context=None):
         if value is Unset:
             return Unset
 
+        variant = self.get_variant(value.variant)
+
         # Run validation of inner variant field.
         try:
-            self.variant_type.validate(value.value, context)
+            variant.field.validate(value.value, context)
         except (ValidationError, DataError) as ex:
             raise CompoundError({
-                self.variant: ex,
+                variant.name: ex,
             })
 
         # Run validation for this field itself.
@@ -133,7 +148,7 @@ class OneOfType(ProtobufTypeMixin, CompoundType):
 
         return {
             'variant': value.variant,
-            'value': self.variant_type.export(value.value, format, context),
+            'value': self.get_variant(value.variant).field.export(value.value, format, context),
         }
 
     # Those methods are abstract in CompoundType class, override them to
@@ -154,16 +169,14 @@ class OneOfType(ProtobufTypeMixin, CompoundType):
         if variant_name is None:
             return Unset
 
-        self.variant = variant_name
-        convert_func = getattr(self.variant_type, 'convert_protobuf', get_value_fallback)
+        variant = self._variants[variant_name]
 
-        return convert_func(msg, variant_name, field_names)
+        return OneOfVariant(variant.name, variant.convert_protobuf(msg, variant_name, field_names))
 
     def export_protobuf(self, msg, field_name, value):  # pylint: disable=unused-argument
         # TODO: Check that model_class is an instance of Model
         if value in {Unset, None}:
             return
 
-        # self.variant = field_name
-        set_value = getattr(self.variant_type, 'export_protobuf', set_value_fallback)
-        set_value(msg, self.variant, value.value)
+        variant = self.get_variant(value.variant)
+        variant.export_protobuf(msg, variant.protobuf_name, value.value)
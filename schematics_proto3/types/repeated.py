@@ -1,19 +1,310 @@
 # -*- coding:utf-8 -*-
-from schematics.types import ListType
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from google.protobuf.descriptor import FieldDescriptor
+from schematics.common import NATIVE
+from schematics.exceptions import ConversionError
+from schematics.transforms import import_converter, validation_converter
+from schematics.types import BaseType, BooleanType, ListType, NumberType, StringType
 
 from schematics_proto3.types.base import ProtobufTypeMixin
+from schematics_proto3.types.wrappers import WrapperTypeMixin
 from schematics_proto3.unset import Unset
+from schematics_proto3.utils import import_numpy
 
 __all__ = ['RepeatedType']
 
 
+# Array dtypes of numeric protobuf fields.
+_PROTOBUF_DTYPES = {
+    FieldDescriptor.TYPE_DOUBLE: 'float64',
+    FieldDescriptor.TYPE_FLOAT: 'float32',
+    FieldDescriptor.TYPE_INT64: 'int64',
+    FieldDescriptor.TYPE_SINT64: 'int64',
+    FieldDescriptor.TYPE_SFIXED64: 'int64',
+    FieldDescriptor.TYPE_UINT64: 'uint64',
+    FieldDescriptor.TYPE_FIXED64: 'uint64',
+    FieldDescriptor.TYPE_INT32: 'int32',
+    FieldDescriptor.TYPE_SINT32: 'int32',
+    FieldDescriptor.TYPE_SFIXED32: 'int32',
+    FieldDescriptor.TYPE_UINT32: 'uint32',
+    FieldDescriptor.TYPE_FIXED32: 'uint32',
+    FieldDescriptor.TYPE_BOOL: 'bool',
+}
+
+# Array dtypes of values not coming from protobuf, by native type of items.
+_NATIVE_DTYPES = {
+    int: 'int64',
+    float: 'float64',
+    bool: 'bool',
+}
+
+
+# Implementations of `convert` which defer to `to_native` for native values.
+_NATIVE_CONVERTERS = frozenset([
+    BaseType.convert,
+    ProtobufTypeMixin.convert,
+    WrapperTypeMixin.convert,
+])
+
+# Validators which do nothing unless any of listed attributes is set.
+_OPTIONAL_VALIDATORS = {
+    BaseType.validate_choices: ('choices',),
+    StringType.validate_length: ('min_length', 'max_length'),
+    StringType.validate_regex: ('regex',),
+    NumberType.validate_range: ('min_value', 'max_value'),
+}
+
+
+def _get_native_types(field):
+    """
+    Return types of values which `field` converts by returning them as they
+    are, None if it is not known.
+    """
+    field_cls = type(field)
+
+    if field.is_compound or field_cls.convert not in _NATIVE_CONVERTERS:
+        return None
+
+    if field_cls.to_native is StringType.to_native:
+        return frozenset([str])
+
+    if field_cls.to_native is NumberType.to_native:
+        return frozenset([field.native_type])
+
+    if field_cls.to_native is BooleanType.to_native:
+        return frozenset([bool])
+
+    return None
+
+
+def _has_optional_validators_only(field):
+    for validator in field.validators:
+        attrs = _OPTIONAL_VALIDATORS.get(getattr(validator, '__func__', None))
+
+        if attrs is None or any(getattr(field, attr) is not None for attr in attrs):
+            return False
+
+    return True
+
+
+class _ArrayConversions(NamedTuple):
+    """
+    Array conversions of a RepeatedType with `as_array` set. Callables left
+    None are done by NumPy, with `dtype`.
+    """
+    numpy: Any
+    dtype: str
+    # Protobuf dtypes of fields, by message descriptor and field name.
+    dtypes: Dict
+    convert_protobuf_array: Optional[Callable]
+    to_array: Optional[Callable]
+    array_to_list: Callable
+    extend_protobuf_array: Optional[Callable]
+
+
 class RepeatedType(ProtobufTypeMixin, ListType):
+    """
+    Repeated protobuf field.
+
+    With `as_array` set, numeric (and bool) items are stored in a NumPy
+    array of dtype matching protobuf field type, instead of a list. Item
+    types with `array_dtype` (e.g. `TimestampType`) provide arrays on their
+    own.
+    """
+
+    def __init__(self, field, *, as_array=False, **kwargs):
+        super().__init__(field, **kwargs)
+
+        self.as_array = as_array
+
+        # Item types storing values in protobuf messages (nested messages,
+        # wrappers, etc.) know how to convert and append them, anything else
+        # is taken as it is.
+        self._convert_protobuf_value = getattr(self.field, 'convert_protobuf_value', None)
+        self._convert_protobuf_values = getattr(self.field, 'convert_protobuf_values', None)
+        self._append_protobuf = getattr(self.field, 'append_protobuf', None)
+
+        # Lists of scalars, as loaded from protobuf, can be converted (and
+        # validated) in bulk as long as items are of the native type already.
+        self._native_types = _get_native_types(self.field)
+        self._bulk_converters = frozenset()
+
+        if self._native_types is not None:
+            self._bulk_converters = frozenset(
+                [import_converter, validation_converter]
+                if _has_optional_validators_only(self.field) else
+                [import_converter]
+            )
+
+        self._array = None
+
+        if as_array:
+            numpy = import_numpy()
+
+            if getattr(self.field, 'array_dtype', None) is None:
+                self._array = self._get_numeric_array_conversions(numpy)
+            else:
+                self._array = self._get_field_array_conversions(numpy)
+
+    @property
+    def array_dtype(self):
+        """
+        NumPy dtype of items of fields with `as_array` set, None otherwise.
+        """
+        if self._array is None:
+            return None
+
+        return self._array.dtype
+
+    def _get_numeric_array_conversions(self, numpy):
+        native_types = self._native_types or frozenset()
+        dtype = None
+
+        if len(native_types) == 1 and self._convert_protobuf_value is None:
+            dtype = _NATIVE_DTYPES.get(next(iter(native_types)))
+
+        if dtype is None:
+            raise RuntimeError('RepeatedType with `as_array` requires a numeric or boolean item type.')
+
+        return _ArrayConversions(
+            numpy=numpy,
+            dtype=dtype,
+            dtypes={},
+            convert_protobuf_array=None,
+            to_array=None,
+            array_to_list=numpy.ndarray.tolist,
+            extend_protobuf_array=None,
+        )
+
+    def _get_field_array_conversions(self, numpy):
+        if _has_optional_validators_only(self.field):
+            self._bulk_converters = frozenset([import_converter, validation_converter])
+
+        return _ArrayConversions(
+            numpy=numpy,
+            dtype=self.field.array_dtype,
+            dtypes={},
+            convert_protobuf_array=self.field.convert_protobuf_array,
+            to_array=self.field.convert_array,
+            array_to_list=self.field.array_to_list,
+            extend_protobuf_array=self.field.extend_protobuf_array,
+        )
+
+    def _get_dtype(self, msg, field_name):
+        descriptor = msg.DESCRIPTOR
+        dtypes = self._array.dtypes
+
+        try:
+            return dtypes[descriptor, field_name]
+        except KeyError:
+            pass
+
+        field_descriptor = descriptor.fields_by_name[field_name]
+        dtype = _PROTOBUF_DTYPES.get(field_descriptor.type, self._array.dtype)
+        dtypes[descriptor, field_name] = dtype
+
+        return dtype
+
+    def _convert_array(self, value, context):
+        array = self._array
+
+        if not isinstance(value, array.numpy.ndarray):
+            try:
+                if array.to_array is None:
+                    value = array.numpy.array(self._coerce(value), dtype=array.dtype)
+                else:
+                    value = array.to_array(self._coerce(value))
+            except (TypeError, ValueError, OverflowError, AttributeError) as exc:
+                raise ConversionError(f'Could not interpret the value as an array of {array.dtype}') from exc
+
+        if (
+            context.field_converter is validation_converter
+            and validation_converter not in self._bulk_converters
+        ):
+            # Run validators of items, on Python values.
+            super()._convert(array.array_to_list(value), context)
+
+        return value
+
+    def _convert(self, value, context):
+        if self._array is not None:
+            return self._convert_array(value, context)
+
+        if (
+            context.field_converter in self._bulk_converters
+            and isinstance(value, (list, tuple))
+            and set(map(type, value)) <= self._native_types
+        ):
+            return list(value)
+
+        return super()._convert(value, context)
+
+    def _is_array(self, value):
+        return self._array is not None and isinstance(value, self._array.numpy.ndarray)
+
+    def check_length(self, value, context):
+        if self._is_array(value):
+            # Truth value of arrays is ambiguous, check a stand-in of the
+            # same length.
+            value = range(len(value))
+
+        super().check_length(value, context)
+
+    def _export(self, list_instance, format, context):  # pylint:disable=redefined-builtin
+        if self._is_array(list_instance):
+            if format == NATIVE:
+                return list_instance
+
+            return self._array.array_to_list(list_instance)
+
+        return super()._export(list_instance, format, context)
+
+    def convert_protobuf(self, msg, field_name, field_names):
+        if field_name not in field_names:
+            return Unset
+
+        # TODO: Catch AttributeError and raise proper exception.
+        # Slicing copies items of a protobuf container to a list at C level,
+        # iterating over the container may go through Python code.
+        value = getattr(msg, field_name)[:]
+
+        array = self._array
+
+        if array is not None:
+            if array.convert_protobuf_array is not None:
+                return array.convert_protobuf_array(value)
+
+            return array.numpy.array(value, dtype=self._get_dtype(msg, field_name))
+
+        if self._convert_protobuf_values is not None:
+            return self._convert_protobuf_values(value)
+
+        convert = self._convert_protobuf_value
+
+        if convert is None:
+            return value
+
+        return [convert(item) for item in value]
 
     def export_protobuf(self, msg, field_name, value):
-        # pylint: disable=no-self-use
         # TODO: Check that model_class is an instance of Model
-        if field_name is Unset:
+        if value is Unset or value is None:
             return
 
         field = getattr(msg, field_name)
-        field.extend(value)
+        append = self._append_protobuf
+
+        if self._is_array(value):
+            if self._array.extend_protobuf_array is None:
+                field.extend(value.tolist())
+            else:
+                self._array.extend_protobuf_array(field, value)
+            return
+
+        if append is None:
+            field.extend(value)
+            return
+
+        for item in value:
+            append(field, item)
@@ -4,14 +4,15 @@ import random
 from datetime import datetime, timedelta, timezone
 
 from google.protobuf import wrappers_pb2
-from schematics.exceptions import ValidationError
+from schematics.exceptions import ConversionError, ValidationError
 from schematics.types import IntType, FloatType, BooleanType, StringType, BaseType
 
 from schematics_proto3.types.base import ProtobufTypeMixin
 from schematics_proto3.unset import Unset
+from schematics_proto3.utils import get_loaded_numpy, import_numpy
 
 __all__ = ['IntWrapperType', 'FloatWrapperType', 'BoolWrapperType',
-           'StringWrapperType', 'BytesWrapperType', 'TimestampType']
+           'StringWrapperType', 'BytesWrapperType', 'TimestampType', 'DurationType']
 
 
 WRAPPER_TYPES = (
@@ -26,6 +27,10 @@ WRAPPER_TYPES = (
     wrappers_pb2.DoubleValue,
 )
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_NANOS_PER_SECOND = 1000000000
+
 
 class WrapperTypeMixin(ProtobufTypeMixin):
 
@@ -48,6 +53,10 @@ class WrapperTypeMixin(ProtobufTypeMixin):
 
         return value.value
 
+    def convert_protobuf_value(self, value):
+        # pylint: disable=no-self-use
+        return value.value
+
     def export_protobuf(self, msg, field_name, value):
         # pylint: disable=no-self-use
         # TODO: Check that model_class is an instance of Model
@@ -57,6 +66,10 @@ class WrapperTypeMixin(ProtobufTypeMixin):
         field = getattr(msg, field_name)
         field.value = value
 
+    def append_protobuf(self, container, value):
+        # pylint: disable=no-self-use
+        container.add().value = value
+
 
 class IntWrapperType(WrapperTypeMixin, IntType):
     pass
@@ -105,25 +118,284 @@ class BytesWrapperType(WrapperTypeMixin, BaseType):
 
 
 class TimestampType(ProtobufTypeMixin, BaseType):
+    """
+    `google.protobuf.Timestamp` field, loaded as timezone aware datetime. With
+    `as_nanos` set, timestamps are int numbers of nanoseconds since the epoch
+    instead, which keeps nanosecond precision lost by datetimes and does not
+    create any datetimes.
+
+    In `RepeatedType(TimestampType(), as_array=True)` items are stored in a
+    NumPy `datetime64[ns]` array (`int64` with `as_nanos`), which covers
+    years 1678 - 2261.
+    """
+
+    def __init__(self, *, as_nanos=False, **kwargs):
+        super().__init__(**kwargs)
+
+        self.as_nanos = as_nanos
+        self.array_dtype = 'int64' if as_nanos else 'datetime64[ns]'
 
     def convert_protobuf(self, msg, field_name, field_names):
-        # pylint: disable=no-self-use
         if field_name not in field_names:
             return Unset
 
-        value = getattr(msg, field_name)
+        return self.convert_protobuf_value(getattr(msg, field_name))
+
+    def convert_protobuf_value(self, value):
+        if self.as_nanos:
+            return value.seconds * _NANOS_PER_SECOND + value.nanos
+
+        try:
+            return _EPOCH + timedelta(0, value.seconds, value.nanos // 1000)
+        except (ValueError, TypeError):
+            # TODO: Informative error or Unset?
+            return None
+
+    def convert_protobuf_values(self, values):
+        if self.as_nanos:
+            return [value.seconds * _NANOS_PER_SECOND + value.nanos for value in values]
+
+        try:
+            return [_EPOCH + timedelta(0, value.seconds, value.nanos // 1000) for value in values]
+        except (ValueError, TypeError, OverflowError):
+            # Let the per item conversion deal with invalid values.
+            return [self.convert_protobuf_value(value) for value in values]
+
+    def convert_protobuf_array(self, values):
+        return import_numpy().array(
+            [value.seconds * _NANOS_PER_SECOND + value.nanos for value in values],
+            dtype='int64',
+        ).view(self.array_dtype)
+
+    def convert_array(self, values):
+        return import_numpy().array([_to_nanos(value) for value in values], dtype='int64').view(self.array_dtype)
+
+    def array_to_list(self, array):
+        nanos = array.astype(self.array_dtype).view('int64').tolist()
+
+        if self.as_nanos:
+            return nanos
+
+        return [_EPOCH + timedelta(microseconds=item // 1000) for item in nanos]
+
+    def to_native(self, value, context=None):
+        if self.as_nanos:
+            if isinstance(value, int):
+                return value
+        elif isinstance(value, datetime):
+            return value
+
+        try:
+            if self.as_nanos:
+                return _to_nanos(value)
+
+            return self.convert_protobuf_value(value)
+        except AttributeError as exc:
+            raise ConversionError('Could not interpret the value as a timestamp.') from exc
+
+    def export_protobuf(self, msg, field_name, value):
+        if value is Unset or value is None:
+            return
+
+        seconds, nanos = _to_seconds_nanos(value)
+        field = getattr(msg, field_name)
+        field.seconds = seconds
+        field.nanos = nanos
+
+    def append_protobuf(self, container, value):
+        # pylint: disable=no-self-use
+        seconds, nanos = _to_seconds_nanos(value)
+        container.add(seconds=seconds, nanos=nanos)
+
+    def extend_protobuf_array(self, container, array):
+        seconds, nanos = import_numpy().divmod(array.astype(self.array_dtype).view('int64'), _NANOS_PER_SECOND)
+        add = container.add
+
+        for item_seconds, item_nanos in zip(seconds.tolist(), nanos.tolist()):
+            add(seconds=item_seconds, nanos=item_nanos)
+
+
+def _to_seconds_nanos(value):
+    """
+    Split timestamp (datetime, int nanoseconds, etc.) to seconds since the
+    epoch and non-negative nanoseconds, as stored in protobuf.
+    """
+    if isinstance(value, datetime):
+        delta = value - (_EPOCH if value.tzinfo is not None else _EPOCH_NAIVE)
+
+        return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+    return divmod(_to_nanos(value), _NANOS_PER_SECOND)
+
 
+def _to_nanos(value):
+    """
+    Return timestamp (datetime, int nanoseconds, etc.) as nanoseconds since
+    the epoch. Naive datetimes are taken as UTC.
+    """
+    if isinstance(value, int):
         return value
 
+    if isinstance(value, datetime):
+        seconds, nanos = _to_seconds_nanos(value)
+
+        return seconds * _NANOS_PER_SECOND + nanos
+
+    numpy = get_loaded_numpy()
+
+    if numpy is not None:
+        if isinstance(value, numpy.datetime64):
+            return int(value.astype('datetime64[ns]').view('int64'))
+
+        if isinstance(value, numpy.integer):
+            return int(value)
+
+    return value.seconds * _NANOS_PER_SECOND + value.nanos
+
+
+class DurationType(ProtobufTypeMixin, BaseType):
+    """
+    `google.protobuf.Duration` field, loaded as timedelta. With `as_nanos`
+    set, durations are int numbers of nanoseconds instead, which keeps
+    nanosecond precision lost by timedeltas and does not create any objects
+    but ints.
+
+    In `RepeatedType(DurationType(), as_array=True)` items are stored in a
+    NumPy `timedelta64[ns]` array (`int64` with `as_nanos`), which covers
+    durations up to about 292 years.
+    """
+
+    def __init__(self, *, as_nanos=False, **kwargs):
+        super().__init__(**kwargs)
+
+        self.as_nanos = as_nanos
+        self.array_dtype = 'int64' if as_nanos else 'timedelta64[ns]'
+
+    def convert_protobuf(self, msg, field_name, field_names):
+        if field_name not in field_names:
+            return Unset
+
+        return self.convert_protobuf_value(getattr(msg, field_name))
+
+    def convert_protobuf_value(self, value):
+        if self.as_nanos:
+            return value.seconds * _NANOS_PER_SECOND + value.nanos
+
+        return timedelta(0, value.seconds, _nanos_to_micros(value.nanos))
+
+    def convert_protobuf_values(self, values):
+        if self.as_nanos:
+            return [value.seconds * _NANOS_PER_SECOND + value.nanos for value in values]
+
+        return [self.convert_protobuf_value(value) for value in values]
+
+    def convert_protobuf_array(self, values):
+        return import_numpy().array(
+            [value.seconds * _NANOS_PER_SECOND + value.nanos for value in values],
+            dtype='int64',
+        ).view(self.array_dtype)
+
+    def convert_array(self, values):
+        nanos = [_duration_to_nanos(value) for value in values]
+
+        return import_numpy().array(nanos, dtype='int64').view(self.array_dtype)
+
+    def array_to_list(self, array):
+        nanos = array.astype(self.array_dtype).view('int64').tolist()
+
+        if self.as_nanos:
+            return nanos
+
+        return [timedelta(microseconds=_nanos_to_micros(item)) for item in nanos]
+
     def to_native(self, value, context=None):
-        if isinstance(value, datetime):
+        if self.as_nanos:
+            if isinstance(value, int):
+                return value
+        elif isinstance(value, timedelta):
             return value
 
         try:
-            return (
-                datetime(1970, 1, 1, tzinfo=timezone.utc)
-                + timedelta(seconds=value.seconds, microseconds=value.nanos // 1000)
-            )
-        except (ValueError, TypeError):
-            # TODO: Informative error or Unset?
-            return None
+            if self.as_nanos:
+                return _duration_to_nanos(value)
+
+            return self.convert_protobuf_value(value)
+        except AttributeError as exc:
+            raise ConversionError('Could not interpret the value as a duration.') from exc
+
+    def export_protobuf(self, msg, field_name, value):
+        if value is Unset or value is None:
+            return
+
+        seconds, nanos = _duration_to_seconds_nanos(value)
+        field = getattr(msg, field_name)
+        field.seconds = seconds
+        field.nanos = nanos
+
+    def append_protobuf(self, container, value):
+        # pylint: disable=no-self-use
+        seconds, nanos = _duration_to_seconds_nanos(value)
+        container.add(seconds=seconds, nanos=nanos)
+
+    def extend_protobuf_array(self, container, array):
+        numpy = import_numpy()
+        total = array.astype(self.array_dtype).view('int64')
+        # Truncating division keeps the sign of nanos equal to the sign of
+        # seconds, as protobuf requires.
+        seconds = (numpy.abs(total) // _NANOS_PER_SECOND) * numpy.sign(total)
+        nanos = total - seconds * _NANOS_PER_SECOND
+        add = container.add
+
+        for item_seconds, item_nanos in zip(seconds.tolist(), nanos.tolist()):
+            add(seconds=item_seconds, nanos=item_nanos)
+
+
+def _nanos_to_micros(nanos):
+    """
+    Round nanoseconds toward zero to microseconds, so that seconds and nanos
+    of the same sign do not add up to a longer duration.
+    """
+    if nanos >= 0:
+        return nanos // 1000
+
+    return -(-nanos // 1000)
+
+
+def _duration_to_seconds_nanos(value):
+    """
+    Split duration (timedelta, int nanoseconds, etc.) to seconds and nanos
+    of the same sign, as stored in protobuf.
+    """
+    if isinstance(value, timedelta):
+        seconds = value.days * 86400 + value.seconds
+        nanos = value.microseconds * 1000
+    else:
+        seconds, nanos = divmod(_duration_to_nanos(value), _NANOS_PER_SECOND)
+
+    if seconds < 0 < nanos:
+        seconds += 1
+        nanos -= _NANOS_PER_SECOND
+
+    return seconds, nanos
+
+
+def _duration_to_nanos(value):
+    """
+    Return duration (timedelta, int nanoseconds, etc.) as nanoseconds.
+    """
+    if isinstance(value, int):
+        return value
+
+    if isinstance(value, timedelta):
+        return ((value.days * 86400 + value.seconds) * 1000000 + value.microseconds) * 1000
+
+    numpy = get_loaded_numpy()
+
+    if numpy is not None:
+        if isinstance(value, numpy.timedelta64):
+            return int(value.astype('timedelta64[ns]').view('int64'))
+
+        if isinstance(value, numpy.integer):
+            return int(value)
+
+    return value.seconds * _NANOS_PER_SECOND + value.nanos
@@ -1,4 +1,6 @@
 # -*- coding:utf-8 -*-
+import sys
+
 from schematics_proto3.unset import Unset
 
 PRIMITIVE_TYPES = (str, int, float, bool, bytes)
@@ -20,7 +22,59 @@ def get_value_fallback(msg, field_name, field_names):
 
 
 def set_value_fallback(msg, field_name, value):
-    if value is Unset:
+    if value is Unset or value is None:
         return
 
     setattr(msg, field_name, value)
+
+
+def parse_message(msg, buf):
+    """
+    Parse serialized message from a bytes-like `buf` into `msg`, replacing
+    its contents.
+    """
+    if not isinstance(buf, bytes):
+        # Not every protobuf implementation accepts bytearray, all of them
+        # accept memoryview which is a zero-copy view.
+        buf = memoryview(buf)
+
+    msg.ParseFromString(buf)
+
+    return msg
+
+
+def encode_varint(value):
+    """
+    Encode non-negative int as a protobuf varint.
+    """
+    out = bytearray()
+
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+    return bytes(out)
+
+
+def import_numpy():
+    """
+    Return numpy module, imported on first use rather than with the package,
+    so that only users of NumPy arrays pay for importing it.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError('NumPy arrays require numpy to be installed.') from exc
+
+    return numpy
+
+
+def get_loaded_numpy():
+    """
+    Return numpy module if it is imported already, None otherwise. Values of
+    NumPy types cannot exist before numpy is imported, so checking for them
+    does not need to import it.
+    """
+    return sys.modules.get('numpy')
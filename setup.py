@@ -31,7 +31,7 @@ setup(
     ],
     install_requires=[
         'schematics~=2.1',
-        'protobuf~=3.9',
+        'protobuf~=3.20',
     ],
     tests_require=[
         'pytest~=5.0',
@@ -39,6 +39,16 @@ setup(
         'pytest-html~=1.20',
     ],
     extras_require={
+        'numpy': [
+            'numpy>=1.16',
+        ],
+        'arrow': [
+            'pyarrow',
+        ],
+        'pandas': [
+            'pyarrow',
+            'pandas',
+        ],
         'develop': [
             'pylint~=2.3',
             'pytest~=5.0',
@@ -48,7 +58,7 @@ setup(
             'sphinx-rtd-theme==0.4.3',
         ],
     },
-    packages=find_packages(exclude=['tests*', 'examples*']),
+    packages=find_packages(exclude=['tests*', 'examples*', 'benchmarks*']),
     include_package_data=True,
     platforms='any',
     zip_safe=False,
@@ -0,0 +1,62 @@
+# -*- coding:utf-8 -*-
+import weakref
+
+import pytest
+from google.protobuf.message import Message
+
+from schematics_proto3.codegen import compile_load_values
+from schematics_proto3.models import Model
+
+
+def _is_plain_load(cls, msg, lazy, fields):
+    return (
+        not lazy
+        and fields is None
+        and isinstance(msg, Message)
+        and type(msg) is cls.protobuf_options.message_class
+    )
+
+
+@pytest.fixture(autouse=True, params=['message', 'wire', 'codegen'])
+def loader(request, monkeypatch):
+    """
+    Run every loading test three times: loading parsed messages with the
+    loader the Model is declared with, decoding their wire format directly,
+    with `Model.decode`, and loading them with a generated loader.
+    """
+    load_protobuf = Model.load_protobuf.__func__
+
+    if request.param == 'wire':
+        def decode_protobuf(cls, msg, trusted=False, lazy=False, fields=None):
+            if not _is_plain_load(cls, msg, lazy, fields):
+                return load_protobuf(cls, msg, trusted=trusted, lazy=lazy, fields=fields)
+
+            return cls.decode(msg.SerializeToString(), trusted=trusted)
+
+        monkeypatch.setattr(Model, 'load_protobuf', classmethod(decode_protobuf))
+
+    if request.param == 'codegen':
+        # Model class to (options the loader was compiled for, loader).
+        generated = weakref.WeakKeyDictionary()
+
+        def load_protobuf_generated(cls, msg, trusted=False, lazy=False, fields=None):
+            # pylint: disable=protected-access
+            if not _is_plain_load(cls, msg, lazy, fields):
+                return load_protobuf(cls, msg, trusted=trusted, lazy=lazy, fields=fields)
+
+            options = cls.protobuf_options
+            cached = generated.get(cls)
+
+            if cached is None or cached[0] is not options:
+                cached = generated[cls] = (options, compile_load_values(cls))
+
+            values = cached[1](msg)
+
+            if trusted:
+                return cls._from_trusted_values(values)
+
+            return cls(values)
+
+        monkeypatch.setattr(Model, 'load_protobuf', classmethod(load_protobuf_generated))
+
+    return request.param
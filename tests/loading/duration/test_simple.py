@@ -0,0 +1,156 @@
+# -*- coding:utf-8 -*-
+from datetime import timedelta
+
+import pytest
+from schematics.exceptions import DataError
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.Duration()
+    msg.value.seconds = -90061
+    msg.value.nanos = -1999
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+@pytest.fixture
+def msg_unsets():
+    return mimic_protobuf_wire_transfer(pb2.Duration())
+
+
+@pytest.fixture
+def msg_repeated():
+    msg = pb2.RepeatedDuration()
+    msg.value.add(seconds=1, nanos=500)
+    msg.value.add(seconds=-1, nanos=-500)
+    msg.value.add()
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.Duration):
+        value = types.DurationType()
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_nanos():
+
+    class ModelNanos(Model, protobuf_message=pb2.Duration):
+        value = types.DurationType(as_nanos=True)
+
+    return ModelNanos
+
+
+@pytest.fixture
+def model_class_required():
+
+    class ModelRequired(Model, protobuf_message=pb2.Duration):
+        value = types.DurationType(required=True)
+
+    return ModelRequired
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional, msg_all_set):
+    model = model_class_optional.load_protobuf(msg_all_set)
+    model.validate()
+
+    # Nanos are rounded toward zero.
+    assert model.value == -timedelta(days=1, hours=1, minutes=1, seconds=1, microseconds=1)
+
+
+def test_optional_unsets(model_class_optional, msg_unsets):
+    model = model_class_optional.load_protobuf(msg_unsets)
+    model.validate()
+
+    assert model.value is Unset
+
+
+def test_required_unsets(model_class_required, msg_unsets):
+    with pytest.raises(DataError) as ex:
+        model_class_required.load_protobuf(msg_unsets)
+
+    errors = ex.value.to_primitive()
+    assert 'required' in errors['value'][0]
+
+
+def test_nanos(model_class_nanos, msg_all_set):
+    model = model_class_nanos.load_protobuf(msg_all_set)
+    model.validate()
+
+    assert model.value == -90061000001999
+
+
+def test_nanos_convert(model_class_nanos):
+    model = model_class_nanos({'value': timedelta(seconds=-1, microseconds=1)})
+    model.validate()
+
+    assert model.value == -999999000
+
+
+def test_convert_invalid(model_class_optional):
+    model = model_class_optional()
+    model.value = 'not a duration'
+
+    with pytest.raises(DataError):
+        model.validate()
+
+
+def test_codegen(msg_all_set):
+
+    class ModelCodegen(Model, protobuf_message=pb2.Duration, codegen=True):
+        value = types.DurationType(as_nanos=True)
+
+    assert ModelCodegen.load_protobuf(msg_all_set).value == -90061000001999
+
+
+@pytest.mark.parametrize('as_nanos, expected', [
+    (False, [timedelta(seconds=1), timedelta(seconds=-1), timedelta()]),
+    (True, [1000000500, -1000000500, 0]),
+])
+def test_repeated(msg_repeated, as_nanos, expected):
+
+    class ModelRepeated(Model, protobuf_message=pb2.RepeatedDuration):
+        value = types.RepeatedType(types.DurationType(as_nanos=as_nanos))
+
+    model = ModelRepeated.load_protobuf(msg_repeated)
+    model.validate()
+
+    assert model.value == expected
+
+
+def test_repeated_array(msg_repeated):
+    numpy = pytest.importorskip('numpy')
+
+    class ModelArray(Model, protobuf_message=pb2.RepeatedDuration):
+        value = types.RepeatedType(types.DurationType(), as_array=True)
+
+    model = ModelArray.load_protobuf(msg_repeated)
+    model.validate()
+
+    assert model.value.dtype == numpy.dtype('timedelta64[ns]')
+    assert model.value.view('int64').tolist() == [1000000500, -1000000500, 0]
+    assert model.to_primitive()['value'] == [timedelta(seconds=1), timedelta(seconds=-1), timedelta()]
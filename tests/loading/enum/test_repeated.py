@@ -384,3 +384,22 @@ def test_validated_validation_error_renamed__inner(model_class_validated_renamed
     assert len(errors['custom_value']) == 2
     assert 'Please speak up!' in errors['custom_value'][0]
     assert 'Please speak up!' in errors['custom_value'][1]
+
+
+def test_bulk_conversion():
+    field = types.EnumType(TestEnum, unset_variant=TestEnum.UNKNOWN)
+
+    assert field.convert_protobuf_values([2, 0, 1]) == [TestEnum.SECOND, Unset, TestEnum.FIRST]
+
+    with pytest.raises(ValueError):
+        field.convert_protobuf_values([1, 7])
+
+
+def test_unknown_number():
+    class ModelOptional(Model, protobuf_message=pb2.RepeatedEnum):
+        value = types.RepeatedType(types.EnumType(TestEnum))
+
+    msg = mimic_protobuf_wire_transfer(pb2.RepeatedEnum(value=[1, 7]))
+
+    with pytest.raises(ValueError):
+        ModelOptional.load_protobuf(msg)
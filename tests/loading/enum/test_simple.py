@@ -320,3 +320,26 @@ def test_validated_validation_error_renamed(model_class_validated_renamed_factor
 
     assert 'custom_value' in errors
     assert 'Please speak up!' in errors['custom_value'][0], f"`Please speak up!` in `{errors['custom_value'][0]}`"
+
+
+def test_lookup_tables():
+    assert TestEnum.members_by_number == {0: TestEnum.UNKNOWN, 1: TestEnum.FIRST, 2: TestEnum.SECOND}
+    assert TestEnum.members_by_name['SECOND'] is TestEnum.SECOND
+
+    with pytest.raises(TypeError):
+        TestEnum.members_by_number[3] = TestEnum.FIRST
+
+
+def test_convert():
+    field = types.EnumType(TestEnum, unset_variant=TestEnum.UNKNOWN)
+
+    assert field.convert('FIRST', None) is TestEnum.FIRST
+    assert field.convert(2, None) is TestEnum.SECOND
+    assert field.convert(0, None) is Unset
+    assert field.convert_protobuf_value(0) is Unset
+
+    with pytest.raises(KeyError):
+        field.convert('THIRD', None)
+
+    with pytest.raises(ValueError):
+        field.convert(7, None)
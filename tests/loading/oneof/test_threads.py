@@ -0,0 +1,37 @@
+# -*- coding:utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.oneof import OneOfVariant
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+class ModelOneOf(Model, protobuf_message=pb2.OneOfPrimitive):
+    inner = types.OneOfType(variants_spec={
+        'value1': IntType(),
+        'custom_value2': StringType(metadata=dict(protobuf_field='value2')),
+    })
+
+
+def roundtrip(idx):
+    if idx % 2:
+        msg = pb2.OneOfPrimitive(value1=idx)
+        expected = OneOfVariant('value1', idx)
+    else:
+        msg = pb2.OneOfPrimitive(value2=str(idx))
+        expected = OneOfVariant('custom_value2', str(idx))
+
+    model = ModelOneOf.load_protobuf(msg)
+    model.validate()
+
+    return model.inner == expected and model.to_protobuf() == msg
+
+
+def test_concurrent_load_and_export():
+    # Field instance is shared by all models, variants of concurrently
+    # loaded messages must not leak between them.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(roundtrip, range(2000)))
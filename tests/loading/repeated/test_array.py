@@ -0,0 +1,187 @@
+# -*- coding:utf-8 -*-
+import subprocess
+import sys
+
+import pytest
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from schematics.exceptions import DataError
+from schematics.types import BooleanType, FloatType, IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+numpy = pytest.importorskip('numpy')
+
+
+FIELDS = [
+    ('int32s', descriptor_pb2.FieldDescriptorProto.TYPE_INT32),
+    ('int64s', descriptor_pb2.FieldDescriptorProto.TYPE_INT64),
+    ('uint64s', descriptor_pb2.FieldDescriptorProto.TYPE_UINT64),
+    ('floats', descriptor_pb2.FieldDescriptorProto.TYPE_FLOAT),
+    ('doubles', descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE),
+    ('bools', descriptor_pb2.FieldDescriptorProto.TYPE_BOOL),
+]
+
+
+def make_message_class():
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name='tests/repeated_numeric.proto',
+        package='schematics_proto3.tests.numeric',
+        syntax='proto3',
+    )
+    message_proto = file_proto.message_type.add(name='RepeatedNumeric')
+
+    for number, (name, field_type) in enumerate(FIELDS, start=1):
+        message_proto.field.add(
+            name=name,
+            number=number,
+            type=field_type,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED,
+        )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName('schematics_proto3.tests.numeric.RepeatedNumeric')
+
+    if hasattr(message_factory, 'GetMessageClass'):
+        return message_factory.GetMessageClass(descriptor)
+
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+
+RepeatedNumeric = make_message_class()
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = RepeatedNumeric(
+        int32s=[-1, 2, 2 ** 31 - 1],
+        int64s=[-2 ** 40, 0],
+        uint64s=[2 ** 64 - 1],
+        floats=[0.5, 1.5],
+        doubles=[3.25],
+        bools=[True, False],
+    )
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class():
+
+    class ModelArray(Model, protobuf_message=RepeatedNumeric):
+        int32s = types.RepeatedType(IntType(), as_array=True)
+        int64s = types.RepeatedType(IntType(), as_array=True)
+        uint64s = types.RepeatedType(IntType(), as_array=True)
+        floats = types.RepeatedType(FloatType(), as_array=True)
+        doubles = types.RepeatedType(FloatType(), as_array=True)
+        bools = types.RepeatedType(BooleanType(), as_array=True, max_size=1)
+
+    return ModelArray
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_load(model_class, msg_all_set, trusted):
+    model = model_class.load_protobuf(msg_all_set, trusted=trusted)
+
+    assert {name: getattr(model, name).dtype.name for name, _ in FIELDS} == {
+        'int32s': 'int32',
+        'int64s': 'int64',
+        'uint64s': 'uint64',
+        'floats': 'float32',
+        'doubles': 'float64',
+        'bools': 'bool',
+    }
+    assert model.int32s.tolist() == [-1, 2, 2 ** 31 - 1]
+    assert model.uint64s.tolist() == [2 ** 64 - 1]
+    assert model.floats.tolist() == [0.5, 1.5]
+
+
+def test_unsets(model_class):
+    model = model_class.load_protobuf(mimic_protobuf_wire_transfer(RepeatedNumeric()))
+
+    assert model.int32s is Unset
+    assert model.to_protobuf() == RepeatedNumeric()
+
+
+def test_validate(model_class, msg_all_set):
+    model = model_class.load_protobuf(msg_all_set)
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    assert list(ex.value.to_primitive()) == ['bools']
+
+    model.bools = [True]
+    model.validate()
+
+    assert isinstance(model.bools, numpy.ndarray)
+
+
+def test_item_validators():
+    class ModelValidated(Model, protobuf_message=RepeatedNumeric):
+        int64s = types.RepeatedType(IntType(max_value=10), as_array=True)
+
+    model = ModelValidated.load_protobuf(RepeatedNumeric(int64s=[1, 20]))
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    assert 1 in ex.value.to_primitive()['int64s']
+
+
+def test_export(model_class, msg_all_set):
+    model = model_class.load_protobuf(msg_all_set)
+
+    assert isinstance(model.to_native()['doubles'], numpy.ndarray)
+    assert model.to_primitive()['int64s'] == [-2 ** 40, 0]
+    assert model.to_protobuf() == msg_all_set
+
+
+def test_convert(model_class):
+    model = model_class({'int64s': ['1', 2]})
+
+    assert model.int64s.dtype.name == 'int64'
+    assert model.int64s.tolist() == [1, 2]
+
+    with pytest.raises(DataError):
+        model_class({'int64s': ['foo']})
+
+
+def test_not_numeric():
+    with pytest.raises(RuntimeError):
+        types.RepeatedType(StringType(), as_array=True)
+
+
+def test_array_dtype():
+    assert types.RepeatedType(IntType(), as_array=True).array_dtype == 'int64'
+    assert types.RepeatedType(types.TimestampType(), as_array=True).array_dtype == 'datetime64[ns]'
+    assert types.RepeatedType(IntType()).array_dtype is None
+
+
+def test_numpy_imported_on_use():
+    code = (
+        'import sys\n'
+        'import schematics_proto3.models\n'
+        'assert "numpy" not in sys.modules\n'
+        'from schematics_proto3 import types\n'
+        'from schematics.types import IntType\n'
+        'types.RepeatedType(IntType(), as_array=True)\n'
+        'assert "numpy" in sys.modules\n'
+    )
+
+    subprocess.run([sys.executable, '-c', code], check=True)
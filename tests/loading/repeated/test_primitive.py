@@ -2,8 +2,9 @@
 from unittest.mock import Mock
 
 import pytest
-from schematics.exceptions import DataError, ValidationError
-from schematics.types import StringType
+from schematics.exceptions import CompoundError, DataError, ValidationError
+from schematics.transforms import get_import_context
+from schematics.types import IntType, StringType
 
 from schematics_proto3 import types
 from schematics_proto3.models import Model
@@ -352,3 +353,30 @@ def test_validated_validation_error_renamed__inner(model_class_validated_renamed
     assert 'Please speak up!' in errors['custom_value'][0]
     assert 'Please speak up!' in errors['custom_value'][1]
     assert 'Please speak up!' in errors['custom_value'][2]
+
+
+def test_bulk_conversion():
+    field = types.RepeatedType(StringType(required=True))
+    value = ['a', 'b']
+    converted = field.convert(value, get_import_context())
+
+    assert converted == value
+    assert converted is not value
+
+    # Values not of native type are converted one by one.
+    assert types.RepeatedType(IntType()).convert(['1', 2, True], get_import_context()) == [1, 2, 1]
+
+    with pytest.raises(CompoundError):
+        field.convert(['a', None, 1], get_import_context())
+
+
+def test_bulk_validation():
+    class ModelValidated(Model, protobuf_message=pb2.RepeatedPrimitive):
+        value = types.RepeatedType(StringType(max_length=3))
+
+    model = ModelValidated.load_protobuf(mimic_protobuf_wire_transfer(pb2.RepeatedPrimitive(value=['a', 'long'])))
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    assert 1 in ex.value.to_primitive()['value']
@@ -0,0 +1,97 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.exceptions import DataError
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+class TestEnum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+def model_pair(protobuf_message, **fields):
+    """
+    Create the same model twice, with and without generated loader.
+    """
+    generic = type('ModelGeneric', (Model,), dict(fields), protobuf_message=protobuf_message)
+    generated = type('ModelGenerated', (Model,), dict(fields), protobuf_message=protobuf_message, codegen=True)
+
+    return generic, generated
+
+
+def nested_msg():
+    msg = pb2.Nested()
+    msg.inner.value = 'foo'
+    msg.other = 'bar'
+
+    return msg
+
+
+class InnerModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+@pytest.mark.parametrize('protobuf_message,fields,msg', [
+    (
+        pb2.Nested,
+        dict(inner=types.MessageType(InnerModel), custom=StringType(metadata=dict(protobuf_field='other'))),
+        nested_msg(),
+    ),
+    (pb2.Nested, dict(inner=types.MessageType(InnerModel), other=StringType()), pb2.Nested()),
+    (pb2.WrappedInt32, dict(wrapped=types.IntWrapperType()), pb2.WrappedInt32()),
+    (pb2.WrappedInt32, dict(wrapped=types.IntWrapperType()), pb2.WrappedInt32(wrapped=dict(value=0))),
+    (pb2.Timestamp, dict(value=types.TimestampType()), pb2.Timestamp(value=dict(seconds=12, nanos=5000))),
+    (pb2.Timestamp, dict(value=types.TimestampType()), pb2.Timestamp()),
+    (pb2.RepeatedPrimitive, dict(value=types.RepeatedType(StringType())), pb2.RepeatedPrimitive(value=['a', 'b'])),
+    (pb2.RepeatedPrimitive, dict(value=types.RepeatedType(StringType())), pb2.RepeatedPrimitive()),
+    (pb2.SimpleEnum, dict(value=types.EnumType(TestEnum)), pb2.SimpleEnum()),
+    (pb2.SimpleEnum, dict(value=types.EnumType(TestEnum, unset_variant=TestEnum.UNKNOWN)), pb2.SimpleEnum()),
+    (pb2.SimpleEnum, dict(value=types.EnumType(TestEnum, unset_variant=TestEnum.UNKNOWN)), pb2.SimpleEnum(value=2)),
+    (
+        pb2.OneOfPrimitive,
+        dict(inner=types.OneOfType(variants_spec={'value1': IntType(), 'value2': StringType()})),
+        pb2.OneOfPrimitive(value2='foo'),
+    ),
+])
+def test_codegen_matches_generic(protobuf_message, fields, msg):
+    generic, generated = model_pair(protobuf_message, **fields)
+    msg = mimic_protobuf_wire_transfer(msg)
+
+    assert generated.protobuf_options.load_values is not generic.protobuf_options.load_values
+    assert generated.load_protobuf(msg).to_native() == generic.load_protobuf(msg).to_native()
+
+
+def test_codegen_required():
+    _, generated = model_pair(pb2.WrappedInt32, wrapped=types.IntWrapperType(required=True))
+
+    with pytest.raises(DataError) as ex:
+        generated.load_protobuf(pb2.WrappedInt32())
+
+    assert 'required' in ex.value.to_primitive()['wrapped'][0]
+
+
+def test_codegen_source():
+    class ModelSource(Model, protobuf_message=pb2.Nested, codegen=True):
+        other = StringType()
+
+    source = ModelSource.protobuf_options.load_values.source
+
+    assert "values['other'] = msg.other" in source
+    assert ModelSource.load_protobuf(pb2.Nested(other='foo')).other == 'foo'
+
+
+def test_codegen_other_message_falls_back():
+    class ModelWrapped(Model, protobuf_message=pb2.WrappedInt32, codegen=True):
+        wrapped = types.IntWrapperType()
+
+    # Message of a different type, but with compatible fields layout.
+    model = ModelWrapped.load_protobuf(pb2.WrappedInt64(wrapped=dict(value=42)))
+
+    assert model.wrapped == 42
+    assert ModelWrapped.load_protobuf(pb2.WrappedInt64()).wrapped is Unset
@@ -0,0 +1,99 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.exceptions import DataError
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.lazy import LazyValues
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.Nested()
+    msg.inner.value = 'foo'
+    msg.other = 'bar'
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType(required=True)
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel, required=True)
+    other = StringType()
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_lazy_loads_on_access(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set, lazy=True)
+    values = model._data.converted
+
+    assert isinstance(values, LazyValues)
+    # Required nested message is checked for presence only.
+    assert values.pending == {'inner', 'other'}
+
+    assert model.other == 'bar'
+    assert values.pending == {'inner'}
+
+    assert model.inner.value == 'foo'
+    assert values.pending == set()
+
+
+def test_lazy_matches_eager(msg_all_set):
+    lazy = ModelNested.load_protobuf(msg_all_set, lazy=True)
+    eager = ModelNested.load_protobuf(msg_all_set)
+
+    assert lazy.to_native() == eager.to_native()
+    assert lazy.to_protobuf() == msg_all_set
+
+
+def test_lazy_validate(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set, lazy=True)
+    model.validate()
+
+    assert model.inner.value == 'foo'
+    assert model.other == 'bar'
+
+
+def test_lazy_assignment_overrides_pending(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set, lazy=True)
+    model.other = 'baz'
+
+    assert model.other == 'baz'
+    assert model.to_protobuf().other == 'baz'
+
+
+def test_lazy_required_unsets():
+    with pytest.raises(DataError) as ex:
+        ModelNested.load_protobuf(pb2.Nested(other='bar'), lazy=True)
+
+    errors = ex.value.to_primitive()
+    assert 'required' in errors['inner'][0]
+
+
+def test_lazy_optional_unsets():
+    class ModelOptional(Model, protobuf_message=pb2.Nested):
+        inner = types.MessageType(InnerMsgModel)
+        other = StringType()
+
+    model = ModelOptional.load_protobuf(pb2.Nested(), lazy=True)
+
+    assert model.inner is Unset
+    assert model.other == ''
@@ -0,0 +1,54 @@
+# -*- coding:utf-8 -*-
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.plan import PRESENCE_MESSAGE, PRESENCE_ONEOF, PRESENCE_REPEATED, PRESENCE_SCALAR
+from schematics_proto3.utils import get_value_fallback
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+def test_plan_nested():
+    class ModelNested(Model, protobuf_message=pb2.Nested):
+        class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+            value = StringType()
+
+        inner = types.MessageType(InnerMsgModel)
+        custom_other = StringType(metadata=dict(protobuf_field='other'))
+
+    plan = ModelNested.protobuf_options.load_plan
+
+    assert isinstance(plan, tuple)
+    assert [(step.name, step.protobuf_name, step.presence) for step in plan] == [
+        ('inner', 'inner', PRESENCE_MESSAGE),
+        ('custom_other', 'other', PRESENCE_SCALAR),
+    ]
+    assert plan[0].convert == ModelNested.inner.convert_protobuf
+    assert plan[1].convert is get_value_fallback
+
+
+def test_plan_repeated_and_oneof():
+    class ModelRepeated(Model, protobuf_message=pb2.RepeatedPrimitive):
+        value = types.RepeatedType(StringType())
+
+    class ModelOneOf(Model, protobuf_message=pb2.OneOfPrimitive):
+        inner = types.OneOfType(variants_spec={
+            'value1': StringType(),
+            'value2': StringType(),
+        })
+
+    assert ModelRepeated.protobuf_options.load_plan[0].presence == PRESENCE_REPEATED
+    assert ModelOneOf.protobuf_options.load_plan[0].presence == PRESENCE_ONEOF
+
+
+def test_plan_appended_field():
+    class ModelAppended(Model, protobuf_message=pb2.Nested):
+        other = StringType()
+
+    ModelAppended._append_field('renamed', StringType(metadata=dict(protobuf_field='other')))
+
+    msg = pb2.Nested(other='foo')
+    model = ModelAppended.load_protobuf(msg)
+
+    assert [step.name for step in ModelAppended.protobuf_options.load_plan] == ['other', 'renamed']
+    assert model.renamed == 'foo'
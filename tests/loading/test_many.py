@@ -0,0 +1,87 @@
+# -*- coding:utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from schematics.exceptions import DataError
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType()
+
+
+def make_messages(count):
+    messages = []
+
+    for idx in range(count):
+        msg = pb2.Nested(other=f'other-{idx}')
+        if idx % 2:
+            msg.inner.value = f'inner-{idx}'
+        messages.append(msg)
+
+    return messages
+
+
+def expected_native(messages):
+    return [ModelNested.load_protobuf(msg).to_native() for msg in messages]
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_many_messages(trusted):
+    messages = make_messages(10)
+    models = ModelNested.load_protobuf_many(messages, trusted=trusted)
+
+    assert [model.to_native() for model in models] == expected_native(messages)
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+def test_many_serialized(wrap):
+    messages = make_messages(10)
+    models = ModelNested.load_protobuf_many(
+        (wrap(msg.SerializeToString()) for msg in messages),
+        trusted=True,
+    )
+
+    # Reused parse buffer must not leak values between items.
+    assert models[0].inner is Unset
+    assert models[1].inner.value == 'inner-1'
+    assert [model.to_native() for model in models] == expected_native(messages)
+
+
+def test_many_executor():
+    messages = make_messages(25)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        models = ModelNested.load_protobuf_many(
+            [msg.SerializeToString() for msg in messages],
+            executor=executor,
+            chunk_size=4,
+        )
+
+    assert [model.to_native() for model in models] == expected_native(messages)
+
+
+def test_many_required():
+    class ModelRequired(Model, protobuf_message=pb2.Nested):
+        inner = types.MessageType(InnerMsgModel, required=True)
+
+    with pytest.raises(DataError):
+        ModelRequired.load_protobuf_many([pb2.Nested(inner=dict(value='foo')), pb2.Nested()])
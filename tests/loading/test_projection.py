@@ -0,0 +1,117 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.exceptions import DataError, UndefinedValueError
+
+from schematics_proto3.projection import get_projection
+from tests.utils.envelope import Envelope, make_envelope_models, msg_all_set  # pylint: disable=unused-import
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+HeaderModel, ItemModel, EnvelopeModel = make_envelope_models()
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_unsets():
+    return mimic_protobuf_wire_transfer(Envelope())
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_fields(msg_all_set, trusted):
+    model = EnvelopeModel.load_protobuf(msg_all_set, trusted=trusted, fields=['kind'])
+    model.validate()
+
+    assert model.kind == 'kind'
+
+    with pytest.raises(UndefinedValueError):
+        model.header  # pylint: disable=pointless-statement
+
+    assert model.to_native() == {'kind': 'kind'}
+    assert model.to_protobuf() == Envelope(kind='kind')
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_nested_fields(msg_all_set, trusted):
+    model = EnvelopeModel.load_protobuf(msg_all_set, trusted=trusted, fields=['kind', 'header.tenant'])
+    model.validate()
+
+    assert model.to_native() == {'kind': 'kind', 'header': {'tenant': 'tenant'}}
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_repeated_nested_fields(msg_all_set, trusted):
+    model = EnvelopeModel.load_protobuf(msg_all_set, trusted=trusted, fields=['items.name'])
+    model.validate()
+
+    assert model.to_native() == {'items': [{'name': 'a'}, {'name': 'b'}]}
+
+
+def test_whole_field_wins(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set, fields=['header.tenant', 'header'])
+
+    assert model.to_native() == {'header': {'tenant': 'tenant', 'trace_id': 'trace'}}
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_required_loaded(msg_unsets, trusted):
+    with pytest.raises(DataError) as ex:
+        EnvelopeModel.load_protobuf(msg_unsets, trusted=trusted, fields=['header'])
+
+    assert set(ex.value.to_primitive()) == {'header'}
+
+
+def test_set_after_load(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set, fields=['header'])
+    model.kind = None
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    assert set(ex.value.to_primitive()) == {'kind'}
+
+    model.kind = 'other'
+    model.validate()
+
+    assert model.to_native()['kind'] == 'other'
+
+
+def test_from_bytes(msg_all_set):
+    model = EnvelopeModel.from_bytes(msg_all_set.SerializeToString(), fields=['kind'])
+
+    assert model.to_native() == {'kind': 'kind'}
+
+
+def test_projection_cached():
+    assert get_projection(EnvelopeModel, ['kind', 'header']) is get_projection(EnvelopeModel, ('header', 'kind'))
+
+
+@pytest.mark.parametrize('fields, exception', [
+    (['unknown'], ValueError),
+    (['kind.nested'], ValueError),
+    ('kind', TypeError),
+])
+def test_invalid_fields(msg_all_set, fields, exception):
+    with pytest.raises(exception):
+        EnvelopeModel.load_protobuf(msg_all_set, fields=fields)
+
+
+def test_lazy(msg_all_set):
+    with pytest.raises(ValueError):
+        EnvelopeModel.load_protobuf(msg_all_set, lazy=True, fields=['kind'])
+
+
+def test_nested_validated(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set, fields=['items.size'])
+    model.items[0].size = None
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    assert ex.value.to_primitive() == {'items': {0: {'size': ['This field is required.']}}}
@@ -0,0 +1,86 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import SPARSE_FIELDS_THRESHOLD, Model
+from schematics_proto3.plan import make_load_values
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+class TestEnum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+class InnerModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+@pytest.mark.parametrize('protobuf_message,fields,msg', [
+    (pb2.Nested, dict(inner=types.MessageType(InnerModel), other=StringType()), pb2.Nested(other='foo')),
+    (pb2.Nested, dict(inner=types.MessageType(InnerModel), other=StringType()), pb2.Nested(inner=dict(value='f'))),
+    (pb2.Nested, dict(inner=types.MessageType(InnerModel), other=StringType()), pb2.Nested()),
+    (pb2.Nested, dict(other=StringType(), custom=StringType(metadata=dict(protobuf_field='other'))), pb2.Nested(other='f')),
+    (pb2.WrappedInt32, dict(wrapped=types.IntWrapperType()), pb2.WrappedInt32(wrapped=dict(value=0))),
+    (pb2.RepeatedPrimitive, dict(value=types.RepeatedType(StringType())), pb2.RepeatedPrimitive(value=['a', 'b'])),
+    (pb2.SimpleEnum, dict(value=types.EnumType(TestEnum)), pb2.SimpleEnum()),
+    (pb2.SimpleEnum, dict(value=types.EnumType(TestEnum, unset_variant=TestEnum.UNKNOWN)), pb2.SimpleEnum()),
+    (
+        pb2.OneOfPrimitive,
+        dict(inner=types.OneOfType(variants_spec={'value1': IntType(), 'value2': StringType()})),
+        pb2.OneOfPrimitive(value1=0),
+    ),
+    (
+        pb2.OneOfPrimitive,
+        dict(inner=types.OneOfType(variants_spec={'value1': IntType(), 'value2': StringType()})),
+        pb2.OneOfPrimitive(),
+    ),
+])
+def test_sparse_matches_dense(protobuf_message, fields, msg):
+    model_cls = type('ModelSparse', (Model,), dict(fields), protobuf_message=protobuf_message, sparse=True)
+    msg = mimic_protobuf_wire_transfer(msg)
+
+    load_values_dense = make_load_values(model_cls.protobuf_options.load_plan)
+
+    assert model_cls.protobuf_options.load_values(msg) == load_values_dense(msg)
+
+
+def test_sparse_unset_defaults_are_not_shared():
+    class ModelSparse(Model, protobuf_message=pb2.Nested, sparse=True):
+        inner = types.MessageType(InnerModel)
+        other = StringType()
+
+    first = ModelSparse.protobuf_options.load_values(pb2.Nested(other='foo'))
+    second = ModelSparse.protobuf_options.load_values(pb2.Nested())
+
+    assert first == {'inner': Unset, 'other': 'foo'}
+    assert second == {'inner': Unset, 'other': ''}
+
+
+def test_sparse_selected_for_wide_models():
+    fields = {f'field_{idx}': StringType(metadata=dict(protobuf_field='other')) for idx in range(SPARSE_FIELDS_THRESHOLD)}
+
+    wide = type('ModelWide', (Model,), dict(fields), protobuf_message=pb2.Nested)
+    dense = type('ModelDense', (Model,), dict(fields), protobuf_message=pb2.Nested, sparse=False)
+
+    assert wide.protobuf_options.load_values.__qualname__.startswith('make_sparse_load_values')
+    assert dense.protobuf_options.load_values.__qualname__.startswith('make_load_values')
+    assert wide.load_protobuf(pb2.Nested(other='foo')).field_0 == 'foo'
+
+
+def test_sparse_and_codegen_exclusive():
+    with pytest.raises(RuntimeError):
+        class ModelBoth(Model, protobuf_message=pb2.Nested, codegen=True, sparse=True):  # pylint: disable=unused-variable
+            other = StringType()
+
+
+def test_sparse_unknown_field():
+    # Fields missing in the message fail when the class is declared,
+    # whichever loader it uses.
+    with pytest.raises(RuntimeError):
+        class ModelExtra(Model, protobuf_message=pb2.Nested, sparse=True):  # pylint: disable=unused-variable
+            other = StringType()
+            extra = StringType()
@@ -0,0 +1,88 @@
+# -*- coding:utf-8 -*-
+from decimal import Decimal
+
+import pytest
+from schematics.exceptions import DataError, ValidationError
+from schematics.types import DecimalType, ListType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.Nested()
+    msg.inner.value = 'foo'
+    msg.other = '12.5'
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+def validate_not_foo(value):
+    if value == 'foo':
+        raise ValidationError('Foo is not allowed.')
+
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType(required=True, validators=[validate_not_foo])
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel, required=True)
+    other = DecimalType()
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_trusted_matches_untrusted(msg_all_set):
+    trusted = ModelNested.load_protobuf(msg_all_set, trusted=True)
+    untrusted = ModelNested.load_protobuf(msg_all_set)
+
+    assert trusted == untrusted
+    assert trusted.to_native() == untrusted.to_native()
+    assert trusted.inner.value == 'foo'
+    # Non-protobuf types still get their values converted.
+    assert trusted.other == Decimal('12.5')
+
+
+def test_trusted_required():
+    with pytest.raises(DataError) as ex:
+        ModelNested.load_protobuf(pb2.Nested(), trusted=True)
+
+    errors = ex.value.to_primitive()
+    assert 'required' in errors['inner'][0]
+
+
+def test_trusted_validate(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set, trusted=True)
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    errors = ex.value.to_primitive()
+    assert errors['inner']['value'] == ['Foo is not allowed.']
+
+
+def test_trusted_plain_list_type():
+    class ModelRepeated(Model, protobuf_message=pb2.RepeatedPrimitive):
+        value = ListType(StringType())
+
+    model = ModelRepeated.load_protobuf(pb2.RepeatedPrimitive(value=['a', 'b']), trusted=True)
+    assert model.value == ['a', 'b']
+    assert type(model.value) is list
+
+    model = ModelRepeated.load_protobuf(pb2.RepeatedPrimitive(), trusted=True)
+    assert model.value is Unset
@@ -0,0 +1,129 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+from google.protobuf import timestamp_pb2
+from schematics.exceptions import DataError, ValidationError
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+numpy = pytest.importorskip('numpy')
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.RepeatedTimestamp()
+    msg.value.extend([
+        timestamp_pb2.Timestamp(seconds=12324346, nanos=333222111),
+        timestamp_pb2.Timestamp(seconds=-86400, nanos=1),
+        timestamp_pb2.Timestamp(seconds=3485739840, nanos=290348),
+    ])
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+@pytest.fixture
+def msg_unsets():
+    return mimic_protobuf_wire_transfer(pb2.RepeatedTimestamp())
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_array():
+
+    class ModelArray(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType(), as_array=True)
+
+    return ModelArray
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_bulk_list(msg_all_set):
+    field = types.TimestampType()
+
+    assert field.convert_protobuf_values(msg_all_set.value[:]) == [
+        field.convert_protobuf_value(value) for value in msg_all_set.value
+    ]
+
+
+def test_array_all_set(model_class_array, msg_all_set):
+    model = model_class_array.load_protobuf(msg_all_set)
+    model.validate()
+
+    assert model.value.dtype == numpy.dtype('datetime64[ns]')
+    # Nanoseconds are kept.
+    assert model.value.view('int64').tolist() == [
+        12324346333222111,
+        -86400 * 10**9 + 1,
+        3485739840000290348,
+    ]
+    assert model.to_primitive()['value'] == [
+        datetime(1970, 5, 23, 15, 25, 46, 333222, tzinfo=timezone.utc),
+        datetime(1969, 12, 31, 0, 0, 0, tzinfo=timezone.utc),
+        datetime(2080, 6, 16, 5, 4, 0, 290, tzinfo=timezone.utc),
+    ]
+    assert model.to_native()['value'] is model.value
+
+
+def test_array_unsets(model_class_array, msg_unsets):
+    model = model_class_array.load_protobuf(msg_unsets)
+    model.validate()
+
+    assert model.value is Unset
+
+
+def test_array_assign_datetimes(model_class_array):
+    model = model_class_array()
+    model.value = [
+        datetime(2020, 4, 1, 10, 24, 5, 123456, tzinfo=timezone.utc),
+        datetime(2020, 4, 1, 10, 24, 5, 123456),
+        numpy.datetime64('2020-04-01T10:24:05.123456789'),
+        timestamp_pb2.Timestamp(seconds=1585736645, nanos=123456789),
+    ]
+    model.validate()
+
+    assert model.value.view('int64').tolist() == [
+        1585736645123456000,
+        1585736645123456000,
+        1585736645123456789,
+        1585736645123456789,
+    ]
+
+
+def test_array_assign_invalid(model_class_array):
+    model = model_class_array()
+    model.value = ['not a timestamp']
+
+    with pytest.raises(DataError):
+        model.validate()
+
+
+def test_array_validation_error__inner(msg_all_set):
+    validator_func = Mock(side_effect=ValidationError('Please speak up!'))
+
+    class ModelValidated(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType(validators=[validator_func]), as_array=True)
+
+    model = ModelValidated.load_protobuf(msg_all_set)
+
+    with pytest.raises(DataError) as ex:
+        model.validate()
+
+    errors = ex.value.to_primitive()
+    assert len(errors['value']) == 3
+    validator_func.assert_any_call(datetime(1970, 5, 23, 15, 25, 46, 333222, tzinfo=timezone.utc))
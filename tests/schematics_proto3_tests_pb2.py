@@ -1,1446 +1,104 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: tests/schematics_proto3_tests.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='tests/schematics_proto3_tests.proto',
-  package='schematics_proto3.tests',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n#tests/schematics_proto3_tests.proto\x12\x17schematics_proto3.tests\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\"e\n\x06Nested\x12\x34\n\x05inner\x18\x01 \x01(\x0b\x32%.schematics_proto3.tests.Nested.Inner\x12\r\n\x05other\x18\x02 \x01(\t\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\t\">\n\rWrappedDouble\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.DoubleValue\"<\n\x0cWrappedFloat\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\"<\n\x0cWrappedInt64\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.Int64Value\">\n\rWrappedUInt64\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\"<\n\x0cWrappedInt32\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\">\n\rWrappedUInt32\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\":\n\x0bWrappedBool\x12+\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\">\n\rWrappedString\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"<\n\x0cWrappedBytes\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.BytesValue\"6\n\tTimestamp\x12)\n\x05value\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\">\n\x11RepeatedTimestamp\x12)\n\x05value\x18\x01 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"w\n\x0eOneOfTimestamp\x12.\n\x06value1\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x12,\n\x06value2\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x42\x07\n\x05inner\"\x17\n\x06\x44ouble\x12\r\n\x05value\x18\x01 \x01(\x01\"\x16\n\x05\x46loat\x12\r\n\x05value\x18\x01 \x01(\x02\"\x16\n\x05Int64\x12\r\n\x05value\x18\x01 \x01(\x03\"\x17\n\x06UInt64\x12\r\n\x05value\x18\x01 \x01(\x04\"\x16\n\x05Int32\x12\r\n\x05value\x18\x01 \x01(\x05\"\x17\n\x06UInt32\x12\r\n\x05value\x18\x01 \x01(\r\"\x15\n\x04\x42ool\x12\r\n\x05value\x18\x01 \x01(\x08\"\x17\n\x06String\x12\r\n\x05value\x18\x01 \x01(\t\"\x16\n\x05\x42ytes\x12\r\n\x05value\x18\x01 \x01(\x0c\"\"\n\x11RepeatedPrimitive\x12\r\n\x05value\x18\x01 \x03(\t\"f\n\x0eRepeatedNested\x12<\n\x05inner\x18\x01 \x03(\x0b\x32-.schematics_proto3.tests.RepeatedNested.Inner\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\t\"=\n\x0fRepeatedWrapped\x12*\n\x05value\x18\x01 \x03(\x0b\x32\x1b.google.protobuf.Int32Value\"=\n\x0eOneOfPrimitive\x12\x10\n\x06value1\x18\x01 \x01(\x04H\x00\x12\x10\n\x06value2\x18\x02 \x01(\tH\x00\x42\x07\n\x05inner\"\x9c\x01\n\x0bOneOfNested\x12<\n\x06value1\x18\x01 \x01(\x0b\x32*.schematics_proto3.tests.OneOfNested.InnerH\x00\x12.\n\x06value2\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\tB\x07\n\x05inner\":\n\nSimpleEnum\x12,\n\x05value\x18\x01 \x01(\x0e\x32\x1d.schematics_proto3.tests.Enum\"<\n\x0cRepeatedEnum\x12,\n\x05value\x18\x01 \x03(\x0e\x32\x1d.schematics_proto3.tests.Enum\"u\n\tOneOfEnum\x12.\n\x06value1\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x12/\n\x06value2\x18\x02 \x01(\x0e\x32\x1d.schematics_proto3.tests.EnumH\x00\x42\x07\n\x05inner**\n\x04\x45num\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x46IRST\x10\x01\x12\n\n\x06SECOND\x10\x02\x62\x06proto3')
-  ,
-  dependencies=[google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,google_dot_protobuf_dot_wrappers__pb2.DESCRIPTOR,])
-
-_ENUM = _descriptor.EnumDescriptor(
-  name='Enum',
-  full_name='schematics_proto3.tests.Enum',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FIRST', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SECOND', index=2, number=2,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1922,
-  serialized_end=1964,
-)
-_sym_db.RegisterEnumDescriptor(_ENUM)
-
-Enum = enum_type_wrapper.EnumTypeWrapper(_ENUM)
-UNKNOWN = 0
-FIRST = 1
-SECOND = 2
-
-
-
-_NESTED_INNER = _descriptor.Descriptor(
-  name='Inner',
-  full_name='schematics_proto3.tests.Nested.Inner',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Nested.Inner.value', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=208,
-  serialized_end=230,
-)
-
-_NESTED = _descriptor.Descriptor(
-  name='Nested',
-  full_name='schematics_proto3.tests.Nested',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='inner', full_name='schematics_proto3.tests.Nested.inner', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='other', full_name='schematics_proto3.tests.Nested.other', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_NESTED_INNER, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=129,
-  serialized_end=230,
-)
-
-
-_WRAPPEDDOUBLE = _descriptor.Descriptor(
-  name='WrappedDouble',
-  full_name='schematics_proto3.tests.WrappedDouble',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedDouble.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=232,
-  serialized_end=294,
-)
-
-
-_WRAPPEDFLOAT = _descriptor.Descriptor(
-  name='WrappedFloat',
-  full_name='schematics_proto3.tests.WrappedFloat',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedFloat.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=296,
-  serialized_end=356,
-)
-
-
-_WRAPPEDINT64 = _descriptor.Descriptor(
-  name='WrappedInt64',
-  full_name='schematics_proto3.tests.WrappedInt64',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedInt64.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=358,
-  serialized_end=418,
-)
-
-
-_WRAPPEDUINT64 = _descriptor.Descriptor(
-  name='WrappedUInt64',
-  full_name='schematics_proto3.tests.WrappedUInt64',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedUInt64.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=420,
-  serialized_end=482,
-)
-
-
-_WRAPPEDINT32 = _descriptor.Descriptor(
-  name='WrappedInt32',
-  full_name='schematics_proto3.tests.WrappedInt32',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedInt32.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=484,
-  serialized_end=544,
-)
-
-
-_WRAPPEDUINT32 = _descriptor.Descriptor(
-  name='WrappedUInt32',
-  full_name='schematics_proto3.tests.WrappedUInt32',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedUInt32.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=546,
-  serialized_end=608,
-)
-
-
-_WRAPPEDBOOL = _descriptor.Descriptor(
-  name='WrappedBool',
-  full_name='schematics_proto3.tests.WrappedBool',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedBool.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=610,
-  serialized_end=668,
-)
-
-
-_WRAPPEDSTRING = _descriptor.Descriptor(
-  name='WrappedString',
-  full_name='schematics_proto3.tests.WrappedString',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedString.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=670,
-  serialized_end=732,
-)
-
-
-_WRAPPEDBYTES = _descriptor.Descriptor(
-  name='WrappedBytes',
-  full_name='schematics_proto3.tests.WrappedBytes',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='wrapped', full_name='schematics_proto3.tests.WrappedBytes.wrapped', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=734,
-  serialized_end=794,
-)
-
-
-_TIMESTAMP = _descriptor.Descriptor(
-  name='Timestamp',
-  full_name='schematics_proto3.tests.Timestamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Timestamp.value', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=796,
-  serialized_end=850,
-)
-
-
-_REPEATEDTIMESTAMP = _descriptor.Descriptor(
-  name='RepeatedTimestamp',
-  full_name='schematics_proto3.tests.RepeatedTimestamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.RepeatedTimestamp.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=852,
-  serialized_end=914,
-)
-
-
-_ONEOFTIMESTAMP = _descriptor.Descriptor(
-  name='OneOfTimestamp',
-  full_name='schematics_proto3.tests.OneOfTimestamp',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value1', full_name='schematics_proto3.tests.OneOfTimestamp.value1', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value2', full_name='schematics_proto3.tests.OneOfTimestamp.value2', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='inner', full_name='schematics_proto3.tests.OneOfTimestamp.inner',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=916,
-  serialized_end=1035,
-)
-
-
-_DOUBLE = _descriptor.Descriptor(
-  name='Double',
-  full_name='schematics_proto3.tests.Double',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Double.value', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1037,
-  serialized_end=1060,
-)
-
-
-_FLOAT = _descriptor.Descriptor(
-  name='Float',
-  full_name='schematics_proto3.tests.Float',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Float.value', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1062,
-  serialized_end=1084,
-)
-
-
-_INT64 = _descriptor.Descriptor(
-  name='Int64',
-  full_name='schematics_proto3.tests.Int64',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Int64.value', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1086,
-  serialized_end=1108,
-)
-
-
-_UINT64 = _descriptor.Descriptor(
-  name='UInt64',
-  full_name='schematics_proto3.tests.UInt64',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.UInt64.value', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1110,
-  serialized_end=1133,
-)
-
-
-_INT32 = _descriptor.Descriptor(
-  name='Int32',
-  full_name='schematics_proto3.tests.Int32',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Int32.value', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1135,
-  serialized_end=1157,
-)
-
-
-_UINT32 = _descriptor.Descriptor(
-  name='UInt32',
-  full_name='schematics_proto3.tests.UInt32',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.UInt32.value', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1159,
-  serialized_end=1182,
-)
-
-
-_BOOL = _descriptor.Descriptor(
-  name='Bool',
-  full_name='schematics_proto3.tests.Bool',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Bool.value', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1184,
-  serialized_end=1205,
-)
-
-
-_STRING = _descriptor.Descriptor(
-  name='String',
-  full_name='schematics_proto3.tests.String',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.String.value', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1207,
-  serialized_end=1230,
-)
-
-
-_BYTES = _descriptor.Descriptor(
-  name='Bytes',
-  full_name='schematics_proto3.tests.Bytes',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.Bytes.value', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1232,
-  serialized_end=1254,
-)
-
-
-_REPEATEDPRIMITIVE = _descriptor.Descriptor(
-  name='RepeatedPrimitive',
-  full_name='schematics_proto3.tests.RepeatedPrimitive',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.RepeatedPrimitive.value', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1256,
-  serialized_end=1290,
-)
-
-
-_REPEATEDNESTED_INNER = _descriptor.Descriptor(
-  name='Inner',
-  full_name='schematics_proto3.tests.RepeatedNested.Inner',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.RepeatedNested.Inner.value', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=208,
-  serialized_end=230,
-)
-
-_REPEATEDNESTED = _descriptor.Descriptor(
-  name='RepeatedNested',
-  full_name='schematics_proto3.tests.RepeatedNested',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='inner', full_name='schematics_proto3.tests.RepeatedNested.inner', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_REPEATEDNESTED_INNER, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1292,
-  serialized_end=1394,
-)
-
-
-_REPEATEDWRAPPED = _descriptor.Descriptor(
-  name='RepeatedWrapped',
-  full_name='schematics_proto3.tests.RepeatedWrapped',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.RepeatedWrapped.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1396,
-  serialized_end=1457,
-)
-
-
-_ONEOFPRIMITIVE = _descriptor.Descriptor(
-  name='OneOfPrimitive',
-  full_name='schematics_proto3.tests.OneOfPrimitive',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value1', full_name='schematics_proto3.tests.OneOfPrimitive.value1', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value2', full_name='schematics_proto3.tests.OneOfPrimitive.value2', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='inner', full_name='schematics_proto3.tests.OneOfPrimitive.inner',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=1459,
-  serialized_end=1520,
-)
-
-
-_ONEOFNESTED_INNER = _descriptor.Descriptor(
-  name='Inner',
-  full_name='schematics_proto3.tests.OneOfNested.Inner',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.OneOfNested.Inner.value', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=208,
-  serialized_end=230,
-)
-
-_ONEOFNESTED = _descriptor.Descriptor(
-  name='OneOfNested',
-  full_name='schematics_proto3.tests.OneOfNested',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value1', full_name='schematics_proto3.tests.OneOfNested.value1', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value2', full_name='schematics_proto3.tests.OneOfNested.value2', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_ONEOFNESTED_INNER, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='inner', full_name='schematics_proto3.tests.OneOfNested.inner',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=1523,
-  serialized_end=1679,
-)
-
-
-_SIMPLEENUM = _descriptor.Descriptor(
-  name='SimpleEnum',
-  full_name='schematics_proto3.tests.SimpleEnum',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.SimpleEnum.value', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1681,
-  serialized_end=1739,
-)
-
-
-_REPEATEDENUM = _descriptor.Descriptor(
-  name='RepeatedEnum',
-  full_name='schematics_proto3.tests.RepeatedEnum',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='schematics_proto3.tests.RepeatedEnum.value', index=0,
-      number=1, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1741,
-  serialized_end=1801,
-)
-
-
-_ONEOFENUM = _descriptor.Descriptor(
-  name='OneOfEnum',
-  full_name='schematics_proto3.tests.OneOfEnum',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value1', full_name='schematics_proto3.tests.OneOfEnum.value1', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value2', full_name='schematics_proto3.tests.OneOfEnum.value2', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='inner', full_name='schematics_proto3.tests.OneOfEnum.inner',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=1803,
-  serialized_end=1920,
-)
-
-_NESTED_INNER.containing_type = _NESTED
-_NESTED.fields_by_name['inner'].message_type = _NESTED_INNER
-_WRAPPEDDOUBLE.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._DOUBLEVALUE
-_WRAPPEDFLOAT.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._FLOATVALUE
-_WRAPPEDINT64.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._INT64VALUE
-_WRAPPEDUINT64.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._UINT64VALUE
-_WRAPPEDINT32.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._INT32VALUE
-_WRAPPEDUINT32.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._UINT32VALUE
-_WRAPPEDBOOL.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._BOOLVALUE
-_WRAPPEDSTRING.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
-_WRAPPEDBYTES.fields_by_name['wrapped'].message_type = google_dot_protobuf_dot_wrappers__pb2._BYTESVALUE
-_TIMESTAMP.fields_by_name['value'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_REPEATEDTIMESTAMP.fields_by_name['value'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_ONEOFTIMESTAMP.fields_by_name['value1'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
-_ONEOFTIMESTAMP.fields_by_name['value2'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_ONEOFTIMESTAMP.oneofs_by_name['inner'].fields.append(
-  _ONEOFTIMESTAMP.fields_by_name['value1'])
-_ONEOFTIMESTAMP.fields_by_name['value1'].containing_oneof = _ONEOFTIMESTAMP.oneofs_by_name['inner']
-_ONEOFTIMESTAMP.oneofs_by_name['inner'].fields.append(
-  _ONEOFTIMESTAMP.fields_by_name['value2'])
-_ONEOFTIMESTAMP.fields_by_name['value2'].containing_oneof = _ONEOFTIMESTAMP.oneofs_by_name['inner']
-_REPEATEDNESTED_INNER.containing_type = _REPEATEDNESTED
-_REPEATEDNESTED.fields_by_name['inner'].message_type = _REPEATEDNESTED_INNER
-_REPEATEDWRAPPED.fields_by_name['value'].message_type = google_dot_protobuf_dot_wrappers__pb2._INT32VALUE
-_ONEOFPRIMITIVE.oneofs_by_name['inner'].fields.append(
-  _ONEOFPRIMITIVE.fields_by_name['value1'])
-_ONEOFPRIMITIVE.fields_by_name['value1'].containing_oneof = _ONEOFPRIMITIVE.oneofs_by_name['inner']
-_ONEOFPRIMITIVE.oneofs_by_name['inner'].fields.append(
-  _ONEOFPRIMITIVE.fields_by_name['value2'])
-_ONEOFPRIMITIVE.fields_by_name['value2'].containing_oneof = _ONEOFPRIMITIVE.oneofs_by_name['inner']
-_ONEOFNESTED_INNER.containing_type = _ONEOFNESTED
-_ONEOFNESTED.fields_by_name['value1'].message_type = _ONEOFNESTED_INNER
-_ONEOFNESTED.fields_by_name['value2'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
-_ONEOFNESTED.oneofs_by_name['inner'].fields.append(
-  _ONEOFNESTED.fields_by_name['value1'])
-_ONEOFNESTED.fields_by_name['value1'].containing_oneof = _ONEOFNESTED.oneofs_by_name['inner']
-_ONEOFNESTED.oneofs_by_name['inner'].fields.append(
-  _ONEOFNESTED.fields_by_name['value2'])
-_ONEOFNESTED.fields_by_name['value2'].containing_oneof = _ONEOFNESTED.oneofs_by_name['inner']
-_SIMPLEENUM.fields_by_name['value'].enum_type = _ENUM
-_REPEATEDENUM.fields_by_name['value'].enum_type = _ENUM
-_ONEOFENUM.fields_by_name['value1'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
-_ONEOFENUM.fields_by_name['value2'].enum_type = _ENUM
-_ONEOFENUM.oneofs_by_name['inner'].fields.append(
-  _ONEOFENUM.fields_by_name['value1'])
-_ONEOFENUM.fields_by_name['value1'].containing_oneof = _ONEOFENUM.oneofs_by_name['inner']
-_ONEOFENUM.oneofs_by_name['inner'].fields.append(
-  _ONEOFENUM.fields_by_name['value2'])
-_ONEOFENUM.fields_by_name['value2'].containing_oneof = _ONEOFENUM.oneofs_by_name['inner']
-DESCRIPTOR.message_types_by_name['Nested'] = _NESTED
-DESCRIPTOR.message_types_by_name['WrappedDouble'] = _WRAPPEDDOUBLE
-DESCRIPTOR.message_types_by_name['WrappedFloat'] = _WRAPPEDFLOAT
-DESCRIPTOR.message_types_by_name['WrappedInt64'] = _WRAPPEDINT64
-DESCRIPTOR.message_types_by_name['WrappedUInt64'] = _WRAPPEDUINT64
-DESCRIPTOR.message_types_by_name['WrappedInt32'] = _WRAPPEDINT32
-DESCRIPTOR.message_types_by_name['WrappedUInt32'] = _WRAPPEDUINT32
-DESCRIPTOR.message_types_by_name['WrappedBool'] = _WRAPPEDBOOL
-DESCRIPTOR.message_types_by_name['WrappedString'] = _WRAPPEDSTRING
-DESCRIPTOR.message_types_by_name['WrappedBytes'] = _WRAPPEDBYTES
-DESCRIPTOR.message_types_by_name['Timestamp'] = _TIMESTAMP
-DESCRIPTOR.message_types_by_name['RepeatedTimestamp'] = _REPEATEDTIMESTAMP
-DESCRIPTOR.message_types_by_name['OneOfTimestamp'] = _ONEOFTIMESTAMP
-DESCRIPTOR.message_types_by_name['Double'] = _DOUBLE
-DESCRIPTOR.message_types_by_name['Float'] = _FLOAT
-DESCRIPTOR.message_types_by_name['Int64'] = _INT64
-DESCRIPTOR.message_types_by_name['UInt64'] = _UINT64
-DESCRIPTOR.message_types_by_name['Int32'] = _INT32
-DESCRIPTOR.message_types_by_name['UInt32'] = _UINT32
-DESCRIPTOR.message_types_by_name['Bool'] = _BOOL
-DESCRIPTOR.message_types_by_name['String'] = _STRING
-DESCRIPTOR.message_types_by_name['Bytes'] = _BYTES
-DESCRIPTOR.message_types_by_name['RepeatedPrimitive'] = _REPEATEDPRIMITIVE
-DESCRIPTOR.message_types_by_name['RepeatedNested'] = _REPEATEDNESTED
-DESCRIPTOR.message_types_by_name['RepeatedWrapped'] = _REPEATEDWRAPPED
-DESCRIPTOR.message_types_by_name['OneOfPrimitive'] = _ONEOFPRIMITIVE
-DESCRIPTOR.message_types_by_name['OneOfNested'] = _ONEOFNESTED
-DESCRIPTOR.message_types_by_name['SimpleEnum'] = _SIMPLEENUM
-DESCRIPTOR.message_types_by_name['RepeatedEnum'] = _REPEATEDENUM
-DESCRIPTOR.message_types_by_name['OneOfEnum'] = _ONEOFENUM
-DESCRIPTOR.enum_types_by_name['Enum'] = _ENUM
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Nested = _reflection.GeneratedProtocolMessageType('Nested', (_message.Message,), dict(
-
-  Inner = _reflection.GeneratedProtocolMessageType('Inner', (_message.Message,), dict(
-    DESCRIPTOR = _NESTED_INNER,
-    __module__ = 'tests.schematics_proto3_tests_pb2'
-    # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Nested.Inner)
-    ))
-  ,
-  DESCRIPTOR = _NESTED,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Nested)
-  ))
-_sym_db.RegisterMessage(Nested)
-_sym_db.RegisterMessage(Nested.Inner)
-
-WrappedDouble = _reflection.GeneratedProtocolMessageType('WrappedDouble', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDDOUBLE,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedDouble)
-  ))
-_sym_db.RegisterMessage(WrappedDouble)
-
-WrappedFloat = _reflection.GeneratedProtocolMessageType('WrappedFloat', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDFLOAT,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedFloat)
-  ))
-_sym_db.RegisterMessage(WrappedFloat)
-
-WrappedInt64 = _reflection.GeneratedProtocolMessageType('WrappedInt64', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDINT64,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedInt64)
-  ))
-_sym_db.RegisterMessage(WrappedInt64)
-
-WrappedUInt64 = _reflection.GeneratedProtocolMessageType('WrappedUInt64', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDUINT64,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedUInt64)
-  ))
-_sym_db.RegisterMessage(WrappedUInt64)
-
-WrappedInt32 = _reflection.GeneratedProtocolMessageType('WrappedInt32', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDINT32,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedInt32)
-  ))
-_sym_db.RegisterMessage(WrappedInt32)
-
-WrappedUInt32 = _reflection.GeneratedProtocolMessageType('WrappedUInt32', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDUINT32,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedUInt32)
-  ))
-_sym_db.RegisterMessage(WrappedUInt32)
-
-WrappedBool = _reflection.GeneratedProtocolMessageType('WrappedBool', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDBOOL,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedBool)
-  ))
-_sym_db.RegisterMessage(WrappedBool)
-
-WrappedString = _reflection.GeneratedProtocolMessageType('WrappedString', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDSTRING,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedString)
-  ))
-_sym_db.RegisterMessage(WrappedString)
-
-WrappedBytes = _reflection.GeneratedProtocolMessageType('WrappedBytes', (_message.Message,), dict(
-  DESCRIPTOR = _WRAPPEDBYTES,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.WrappedBytes)
-  ))
-_sym_db.RegisterMessage(WrappedBytes)
-
-Timestamp = _reflection.GeneratedProtocolMessageType('Timestamp', (_message.Message,), dict(
-  DESCRIPTOR = _TIMESTAMP,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Timestamp)
-  ))
-_sym_db.RegisterMessage(Timestamp)
-
-RepeatedTimestamp = _reflection.GeneratedProtocolMessageType('RepeatedTimestamp', (_message.Message,), dict(
-  DESCRIPTOR = _REPEATEDTIMESTAMP,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedTimestamp)
-  ))
-_sym_db.RegisterMessage(RepeatedTimestamp)
-
-OneOfTimestamp = _reflection.GeneratedProtocolMessageType('OneOfTimestamp', (_message.Message,), dict(
-  DESCRIPTOR = _ONEOFTIMESTAMP,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.OneOfTimestamp)
-  ))
-_sym_db.RegisterMessage(OneOfTimestamp)
-
-Double = _reflection.GeneratedProtocolMessageType('Double', (_message.Message,), dict(
-  DESCRIPTOR = _DOUBLE,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Double)
-  ))
-_sym_db.RegisterMessage(Double)
-
-Float = _reflection.GeneratedProtocolMessageType('Float', (_message.Message,), dict(
-  DESCRIPTOR = _FLOAT,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Float)
-  ))
-_sym_db.RegisterMessage(Float)
-
-Int64 = _reflection.GeneratedProtocolMessageType('Int64', (_message.Message,), dict(
-  DESCRIPTOR = _INT64,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Int64)
-  ))
-_sym_db.RegisterMessage(Int64)
-
-UInt64 = _reflection.GeneratedProtocolMessageType('UInt64', (_message.Message,), dict(
-  DESCRIPTOR = _UINT64,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.UInt64)
-  ))
-_sym_db.RegisterMessage(UInt64)
-
-Int32 = _reflection.GeneratedProtocolMessageType('Int32', (_message.Message,), dict(
-  DESCRIPTOR = _INT32,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Int32)
-  ))
-_sym_db.RegisterMessage(Int32)
-
-UInt32 = _reflection.GeneratedProtocolMessageType('UInt32', (_message.Message,), dict(
-  DESCRIPTOR = _UINT32,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.UInt32)
-  ))
-_sym_db.RegisterMessage(UInt32)
-
-Bool = _reflection.GeneratedProtocolMessageType('Bool', (_message.Message,), dict(
-  DESCRIPTOR = _BOOL,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Bool)
-  ))
-_sym_db.RegisterMessage(Bool)
-
-String = _reflection.GeneratedProtocolMessageType('String', (_message.Message,), dict(
-  DESCRIPTOR = _STRING,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.String)
-  ))
-_sym_db.RegisterMessage(String)
-
-Bytes = _reflection.GeneratedProtocolMessageType('Bytes', (_message.Message,), dict(
-  DESCRIPTOR = _BYTES,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.Bytes)
-  ))
-_sym_db.RegisterMessage(Bytes)
-
-RepeatedPrimitive = _reflection.GeneratedProtocolMessageType('RepeatedPrimitive', (_message.Message,), dict(
-  DESCRIPTOR = _REPEATEDPRIMITIVE,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedPrimitive)
-  ))
-_sym_db.RegisterMessage(RepeatedPrimitive)
-
-RepeatedNested = _reflection.GeneratedProtocolMessageType('RepeatedNested', (_message.Message,), dict(
-
-  Inner = _reflection.GeneratedProtocolMessageType('Inner', (_message.Message,), dict(
-    DESCRIPTOR = _REPEATEDNESTED_INNER,
-    __module__ = 'tests.schematics_proto3_tests_pb2'
-    # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedNested.Inner)
-    ))
-  ,
-  DESCRIPTOR = _REPEATEDNESTED,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedNested)
-  ))
-_sym_db.RegisterMessage(RepeatedNested)
-_sym_db.RegisterMessage(RepeatedNested.Inner)
-
-RepeatedWrapped = _reflection.GeneratedProtocolMessageType('RepeatedWrapped', (_message.Message,), dict(
-  DESCRIPTOR = _REPEATEDWRAPPED,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedWrapped)
-  ))
-_sym_db.RegisterMessage(RepeatedWrapped)
-
-OneOfPrimitive = _reflection.GeneratedProtocolMessageType('OneOfPrimitive', (_message.Message,), dict(
-  DESCRIPTOR = _ONEOFPRIMITIVE,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.OneOfPrimitive)
-  ))
-_sym_db.RegisterMessage(OneOfPrimitive)
-
-OneOfNested = _reflection.GeneratedProtocolMessageType('OneOfNested', (_message.Message,), dict(
-
-  Inner = _reflection.GeneratedProtocolMessageType('Inner', (_message.Message,), dict(
-    DESCRIPTOR = _ONEOFNESTED_INNER,
-    __module__ = 'tests.schematics_proto3_tests_pb2'
-    # @@protoc_insertion_point(class_scope:schematics_proto3.tests.OneOfNested.Inner)
-    ))
-  ,
-  DESCRIPTOR = _ONEOFNESTED,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.OneOfNested)
-  ))
-_sym_db.RegisterMessage(OneOfNested)
-_sym_db.RegisterMessage(OneOfNested.Inner)
-
-SimpleEnum = _reflection.GeneratedProtocolMessageType('SimpleEnum', (_message.Message,), dict(
-  DESCRIPTOR = _SIMPLEENUM,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.SimpleEnum)
-  ))
-_sym_db.RegisterMessage(SimpleEnum)
-
-RepeatedEnum = _reflection.GeneratedProtocolMessageType('RepeatedEnum', (_message.Message,), dict(
-  DESCRIPTOR = _REPEATEDENUM,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.RepeatedEnum)
-  ))
-_sym_db.RegisterMessage(RepeatedEnum)
-
-OneOfEnum = _reflection.GeneratedProtocolMessageType('OneOfEnum', (_message.Message,), dict(
-  DESCRIPTOR = _ONEOFENUM,
-  __module__ = 'tests.schematics_proto3_tests_pb2'
-  # @@protoc_insertion_point(class_scope:schematics_proto3.tests.OneOfEnum)
-  ))
-_sym_db.RegisterMessage(OneOfEnum)
-
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#tests/schematics_proto3_tests.proto\x12\x17schematics_proto3.tests\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\"e\n\x06Nested\x12\x34\n\x05inner\x18\x01 \x01(\x0b\x32%.schematics_proto3.tests.Nested.Inner\x12\r\n\x05other\x18\x02 \x01(\t\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\t\">\n\rWrappedDouble\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.DoubleValue\"<\n\x0cWrappedFloat\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.FloatValue\"<\n\x0cWrappedInt64\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.Int64Value\">\n\rWrappedUInt64\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt64Value\"<\n\x0cWrappedInt32\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\">\n\rWrappedUInt32\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\":\n\x0bWrappedBool\x12+\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\">\n\rWrappedString\x12-\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"<\n\x0cWrappedBytes\x12,\n\x07wrapped\x18\x01 \x01(\x0b\x32\x1b.google.protobuf.BytesValue\"6\n\tTimestamp\x12)\n\x05value\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\">\n\x11RepeatedTimestamp\x12)\n\x05value\x18\x01 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"w\n\x0eOneOfTimestamp\x12.\n\x06value1\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x12,\n\x06value2\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x42\x07\n\x05inner\"4\n\x08\x44uration\x12(\n\x05value\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\"<\n\x10RepeatedDuration\x12(\n\x05value\x18\x01 \x03(\x0b\x32\x19.google.protobuf.Duration\"\x17\n\x06\x44ouble\x12\r\n\x05value\x18\x01 \x01(\x01\"\x16\n\x05\x46loat\x12\r\n\x05value\x18\x01 \x01(\x02\"\x16\n\x05Int64\x12\r\n\x05value\x18\x01 \x01(\x03\"\x17\n\x06UInt64\x12\r\n\x05value\x18\x01 \x01(\x04\"\x16\n\x05Int32\x12\r\n\x05value\x18\x01 \x01(\x05\"\x17\n\x06UInt32\x12\r\n\x05value\x18\x01 \x01(\r\"\x15\n\x04\x42ool\x12\r\n\x05value\x18\x01 \x01(\x08\"\x17\n\x06String\x12\r\n\x05value\x18\x01 \x01(\t\"\x16\n\x05\x42ytes\x12\r\n\x05value\x18\x01 \x01(\x0c\"\"\n\x11RepeatedPrimitive\x12\r\n\x05value\x18\x01 \x03(\t\"f\n\x0eRepeatedNested\x12<\n\x05inner\x18\x01 \x03(\x0b\x32-.schematics_proto3.tests.RepeatedNested.Inner\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\t\"=\n\x0fRepeatedWrapped\x12*\n\x05value\x18\x01 \x03(\x0b\x32\x1b.google.protobuf.Int32Value\"=\n\x0eOneOfPrimitive\x12\x10\n\x06value1\x18\x01 \x01(\x04H\x00\x12\x10\n\x06value2\x18\x02 \x01(\tH\x00\x42\x07\n\x05inner\"\x9c\x01\n\x0bOneOfNested\x12<\n\x06value1\x18\x01 \x01(\x0b\x32*.schematics_proto3.tests.OneOfNested.InnerH\x00\x12.\n\x06value2\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x1a\x16\n\x05Inner\x12\r\n\x05value\x18\x01 \x01(\tB\x07\n\x05inner\":\n\nSimpleEnum\x12,\n\x05value\x18\x01 \x01(\x0e\x32\x1d.schematics_proto3.tests.Enum\"<\n\x0cRepeatedEnum\x12,\n\x05value\x18\x01 \x03(\x0e\x32\x1d.schematics_proto3.tests.Enum\"u\n\tOneOfEnum\x12.\n\x06value1\x18\x01 \x01(\x0b\x32\x1c.google.protobuf.StringValueH\x00\x12/\n\x06value2\x18\x02 \x01(\x0e\x32\x1d.schematics_proto3.tests.EnumH\x00\x42\x07\n\x05inner\"-\n\x06Header\x12\x11\n\ttenant_id\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t\"\"\n\x04Item\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\"w\n\x08\x45nvelope\x12/\n\x06header\x18\x01 \x01(\x0b\x32\x1f.schematics_proto3.tests.Header\x12\x0c\n\x04kind\x18\x02 \x01(\t\x12,\n\x05items\x18\x03 \x03(\x0b\x32\x1d.schematics_proto3.tests.Item**\n\x04\x45num\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x46IRST\x10\x01\x12\n\n\x06SECOND\x10\x02\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'tests.schematics_proto3_tests_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ENUM._serialized_start=2274
+  _ENUM._serialized_end=2316
+  _NESTED._serialized_start=161
+  _NESTED._serialized_end=262
+  _NESTED_INNER._serialized_start=240
+  _NESTED_INNER._serialized_end=262
+  _WRAPPEDDOUBLE._serialized_start=264
+  _WRAPPEDDOUBLE._serialized_end=326
+  _WRAPPEDFLOAT._serialized_start=328
+  _WRAPPEDFLOAT._serialized_end=388
+  _WRAPPEDINT64._serialized_start=390
+  _WRAPPEDINT64._serialized_end=450
+  _WRAPPEDUINT64._serialized_start=452
+  _WRAPPEDUINT64._serialized_end=514
+  _WRAPPEDINT32._serialized_start=516
+  _WRAPPEDINT32._serialized_end=576
+  _WRAPPEDUINT32._serialized_start=578
+  _WRAPPEDUINT32._serialized_end=640
+  _WRAPPEDBOOL._serialized_start=642
+  _WRAPPEDBOOL._serialized_end=700
+  _WRAPPEDSTRING._serialized_start=702
+  _WRAPPEDSTRING._serialized_end=764
+  _WRAPPEDBYTES._serialized_start=766
+  _WRAPPEDBYTES._serialized_end=826
+  _TIMESTAMP._serialized_start=828
+  _TIMESTAMP._serialized_end=882
+  _REPEATEDTIMESTAMP._serialized_start=884
+  _REPEATEDTIMESTAMP._serialized_end=946
+  _ONEOFTIMESTAMP._serialized_start=948
+  _ONEOFTIMESTAMP._serialized_end=1067
+  _DURATION._serialized_start=1069
+  _DURATION._serialized_end=1121
+  _REPEATEDDURATION._serialized_start=1123
+  _REPEATEDDURATION._serialized_end=1183
+  _DOUBLE._serialized_start=1185
+  _DOUBLE._serialized_end=1208
+  _FLOAT._serialized_start=1210
+  _FLOAT._serialized_end=1232
+  _INT64._serialized_start=1234
+  _INT64._serialized_end=1256
+  _UINT64._serialized_start=1258
+  _UINT64._serialized_end=1281
+  _INT32._serialized_start=1283
+  _INT32._serialized_end=1305
+  _UINT32._serialized_start=1307
+  _UINT32._serialized_end=1330
+  _BOOL._serialized_start=1332
+  _BOOL._serialized_end=1353
+  _STRING._serialized_start=1355
+  _STRING._serialized_end=1378
+  _BYTES._serialized_start=1380
+  _BYTES._serialized_end=1402
+  _REPEATEDPRIMITIVE._serialized_start=1404
+  _REPEATEDPRIMITIVE._serialized_end=1438
+  _REPEATEDNESTED._serialized_start=1440
+  _REPEATEDNESTED._serialized_end=1542
+  _REPEATEDNESTED_INNER._serialized_start=240
+  _REPEATEDNESTED_INNER._serialized_end=262
+  _REPEATEDWRAPPED._serialized_start=1544
+  _REPEATEDWRAPPED._serialized_end=1605
+  _ONEOFPRIMITIVE._serialized_start=1607
+  _ONEOFPRIMITIVE._serialized_end=1668
+  _ONEOFNESTED._serialized_start=1671
+  _ONEOFNESTED._serialized_end=1827
+  _ONEOFNESTED_INNER._serialized_start=240
+  _ONEOFNESTED_INNER._serialized_end=262
+  _SIMPLEENUM._serialized_start=1829
+  _SIMPLEENUM._serialized_end=1887
+  _REPEATEDENUM._serialized_start=1889
+  _REPEATEDENUM._serialized_end=1949
+  _ONEOFENUM._serialized_start=1951
+  _ONEOFENUM._serialized_end=2068
+  _HEADER._serialized_start=2070
+  _HEADER._serialized_end=2115
+  _ITEM._serialized_start=2117
+  _ITEM._serialized_end=2151
+  _ENVELOPE._serialized_start=2153
+  _ENVELOPE._serialized_end=2272
 # @@protoc_insertion_point(module_scope)
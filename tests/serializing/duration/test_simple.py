@@ -0,0 +1,90 @@
+# -*- coding:utf-8 -*-
+from datetime import timedelta
+
+import pytest
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.Duration):
+        value = types.DurationType()
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_nanos():
+
+    class ModelNanos(Model, protobuf_message=pb2.Duration):
+        value = types.DurationType(as_nanos=True)
+
+    return ModelNanos
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('value, seconds, nanos', [
+    (timedelta(days=1, microseconds=5), 86400, 5000),
+    (timedelta(microseconds=-1), 0, -1000),
+    (-timedelta(seconds=3, microseconds=250), -3, -250000),
+    (timedelta(), 0, 0),
+])
+def test_optional_all_set(model_class_optional, value, seconds, nanos):
+    model = model_class_optional({'value': value})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.HasField('value')
+    assert (msg.value.seconds, msg.value.nanos) == (seconds, nanos)
+
+
+def test_optional_unsets(model_class_optional):
+    msg = model_class_optional().to_protobuf()
+
+    assert not msg.HasField('value')
+
+
+@pytest.mark.parametrize('value, seconds, nanos', [
+    (1000000001, 1, 1),
+    (-1, 0, -1),
+    (-1000000001, -1, -1),
+])
+def test_nanos(model_class_nanos, value, seconds, nanos):
+    msg = model_class_nanos({'value': value}).to_protobuf()
+
+    assert (msg.value.seconds, msg.value.nanos) == (seconds, nanos)
+
+
+@pytest.mark.parametrize('as_nanos', [False, True])
+@pytest.mark.parametrize('as_array', [False, True])
+def test_repeated_round_trip(as_nanos, as_array):
+    if as_array:
+        pytest.importorskip('numpy')
+
+    class ModelRepeated(Model, protobuf_message=pb2.RepeatedDuration):
+        value = types.RepeatedType(types.DurationType(as_nanos=as_nanos), as_array=as_array)
+
+    msg = pb2.RepeatedDuration()
+    msg.value.add(seconds=1, nanos=500000)
+    msg.value.add(seconds=-1, nanos=-500000)
+    msg.value.add(seconds=0, nanos=-1000)
+    msg.value.add()
+    msg = mimic_protobuf_wire_transfer(msg)
+
+    model = ModelRepeated.load_protobuf(msg)
+    model.validate()
+
+    assert model.to_protobuf() == msg
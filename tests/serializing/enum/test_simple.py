@@ -0,0 +1,65 @@
+# -*- coding:utf-8 -*-
+import pytest
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+class TestEnum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.SimpleEnum):
+        value = types.EnumType(TestEnum)
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_repeated():
+
+    class ModelRepeated(Model, protobuf_message=pb2.RepeatedEnum):
+        value = types.RepeatedType(types.EnumType(TestEnum))
+
+    return ModelRepeated
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({'value': 'SECOND'})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.value == pb2.SECOND
+
+
+def test_optional_unsets(model_class_optional):
+    model = model_class_optional({'value': Unset})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.value == pb2.UNKNOWN
+
+
+def test_repeated_all_set(model_class_repeated):
+    model = model_class_repeated({'value': ['SECOND', 'FIRST']})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert list(msg.value) == [pb2.SECOND, pb2.FIRST]
@@ -160,3 +160,42 @@ def test_none_not_dumped_unsets(model_class_none_not_dumped):
     msg = model.to_protobuf()
     assert msg.value1 == 0
     assert msg.value2 == ''
+
+
+def test_field_renamed(model_class_field_renamed):
+    model = model_class_field_renamed()
+    model.custom_inner = {'variant': 'custom_value2', 'value': 'Hello!'}
+    model.validate()
+
+    msg = model.to_protobuf()
+    assert msg.WhichOneof('inner') == 'value2'
+    assert msg.value2 == 'Hello!'
+
+    # protobuf name of a variant is accepted as well
+    model.custom_inner = ('value2', 'Hi!')
+    model.validate()
+
+    assert model.custom_inner.variant == 'custom_value2'
+    assert model.to_protobuf().value2 == 'Hi!'
+
+
+def test_unknown_variant(model_class_optional):
+    model = model_class_optional()
+
+    with pytest.raises(KeyError):
+        model.inner = ('value3', 'Hello!')
+
+
+@pytest.mark.parametrize('variants_spec', [
+    {
+        'value1': IntType(),
+        'value2': StringType(metadata=dict(protobuf_field='value1')),
+    },
+    {
+        'custom_value1': IntType(metadata=dict(protobuf_field='value2')),
+        'custom_value2': StringType(metadata=dict(protobuf_field='value2')),
+    },
+])
+def test_duplicated_variant(variants_spec):
+    with pytest.raises(RuntimeError):
+        types.OneOfType(variants_spec=variants_spec)
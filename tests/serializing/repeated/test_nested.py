@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.RepeatedNested):
+
+        class InnerMsgModel(Model, protobuf_message=pb2.RepeatedNested.Inner):
+            value = StringType()
+
+        inner = types.RepeatedType(types.MessageType(InnerMsgModel))
+
+    return ModelOptional
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({
+        'inner': [{'value': 'foo'}, {'value': 'bar'}],
+    })
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert [inner.value for inner in msg.inner] == ['foo', 'bar']
+
+
+def test_optional_unsets(model_class_optional):
+    model = model_class_optional({'inner': Unset})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert len(msg.inner) == 0
+
+
+def test_round_trip(model_class_optional):
+    msg = pb2.RepeatedNested()
+    msg.inner.add(value='foo')
+    msg.inner.add(value='bar')
+
+    assert model_class_optional.load_protobuf(msg).to_protobuf() == msg
@@ -0,0 +1,61 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.RepeatedPrimitive):
+        value = types.RepeatedType(StringType())
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_field_renamed():
+
+    class ModelFieldRenamed(Model, protobuf_message=pb2.RepeatedPrimitive):
+        custom_value = types.RepeatedType(StringType(), metadata=dict(protobuf_field='value'))
+
+    return ModelFieldRenamed
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({'value': ['foo', 'bar']})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert list(msg.value) == ['foo', 'bar']
+
+
+def test_optional_unsets(model_class_optional):
+    model = model_class_optional({'value': Unset})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert list(msg.value) == []
+
+
+def test_renamed_all_set(model_class_field_renamed):
+    model = model_class_field_renamed({'custom_value': ['foo', 'bar']})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert list(msg.value) == ['foo', 'bar']
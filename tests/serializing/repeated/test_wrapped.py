@@ -0,0 +1,40 @@
+# -*- coding:utf-8 -*-
+import pytest
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.RepeatedWrapped):
+        value = types.RepeatedType(types.IntWrapperType())
+
+    return ModelOptional
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({'value': [1, 0, 42]})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert [item.value for item in msg.value] == [1, 0, 42]
+
+
+def test_round_trip(model_class_optional):
+    msg = pb2.RepeatedWrapped()
+    msg.value.add(value=7)
+    msg.value.add(value=0)
+
+    assert model_class_optional.load_protobuf(msg).to_protobuf() == msg
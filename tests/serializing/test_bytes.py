@@ -0,0 +1,140 @@
+# -*- coding:utf-8 -*-
+import threading
+
+import pytest
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType()
+
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.Nested()
+    msg.inner.value = 'foo'
+    msg.other = 'bar'
+
+    return msg
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+@pytest.mark.parametrize('reuse_message', [False, True])
+def test_from_bytes(msg_all_set, wrap, reuse_message):
+    model = ModelNested.from_bytes(wrap(msg_all_set.SerializeToString()), reuse_message=reuse_message)
+
+    assert model.inner.value == 'foo'
+    assert model.other == 'bar'
+
+    # Scratch message must not leak values of the previous one.
+    model = ModelNested.from_bytes(pb2.Nested(other='baz').SerializeToString(), reuse_message=reuse_message)
+
+    assert model.inner is Unset
+    assert model.other == 'baz'
+
+
+def test_from_bytes_scratch_per_thread(msg_all_set):
+    models = []
+    thread = threading.Thread(
+        target=lambda: models.append(ModelNested.from_bytes(msg_all_set.SerializeToString(), reuse_message=True)),
+    )
+    thread.start()
+    thread.join()
+
+    assert models[0].other == 'bar'
+
+
+def test_from_bytes_lazy_reuse():
+    with pytest.raises(ValueError):
+        ModelNested.from_bytes(b'', lazy=True, reuse_message=True)
+
+
+def test_to_bytes(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+
+    assert model.to_bytes() == msg_all_set.SerializeToString()
+
+
+def test_to_bytes_into_bytearray(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+    out = bytearray(b'prefix')
+
+    assert model.to_bytes(out) is out
+    assert out == b'prefix' + msg_all_set.SerializeToString()
+
+
+@pytest.mark.parametrize('reuse_message', [False, True])
+def test_to_bytes_reuse_message(msg_all_set, reuse_message):
+    model = ModelNested.load_protobuf(msg_all_set)
+
+    assert model.to_bytes(reuse_message=reuse_message) == msg_all_set.SerializeToString()
+
+    # Scratch message must not leak values of the previous model.
+    model = ModelNested.load_protobuf(pb2.Nested(other='baz'))
+
+    assert model.to_bytes(reuse_message=reuse_message) == pb2.Nested(other='baz').SerializeToString()
+
+
+def test_to_protobuf_into(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+    target = pb2.Nested(other='stale')
+    target.inner.value = 'stale'
+
+    assert model.to_protobuf(into=target) is target
+    assert target == msg_all_set
+
+
+def test_to_protobuf_into_clears():
+    model = ModelNested.load_protobuf(pb2.Nested(other='baz'))
+    target = pb2.Nested()
+    target.inner.value = 'stale'
+
+    model.to_protobuf(into=target)
+
+    assert target == pb2.Nested(other='baz')
+    assert not target.HasField('inner')
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_to_protobuf_into_source(msg_all_set, lazy):
+    expected = pb2.Nested()
+    expected.CopyFrom(msg_all_set)
+    model = ModelNested.load_protobuf(msg_all_set, lazy=lazy)
+    model.other  # pylint: disable=pointless-statement
+
+    model.to_protobuf(into=msg_all_set)
+
+    assert msg_all_set == expected
+
+
+def test_to_protobuf_into_field_mask(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+    target = pb2.Nested(other='stale')
+
+    assert model.to_protobuf(field_mask=['inner'], into=target) is target
+    assert target == pb2.Nested(inner=msg_all_set.inner)
+
+
+def test_to_protobuf_into_type_mismatch(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+
+    with pytest.raises(TypeError):
+        model.to_protobuf(into=pb2.Nested.Inner())
@@ -0,0 +1,89 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.Nested):
+
+        class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+            value = StringType()
+
+        inner = types.MessageType(InnerMsgModel)
+        other = StringType()
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_field_renamed():
+
+    class ModelFieldRenamed(Model, protobuf_message=pb2.Nested):
+
+        class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+            custom_value = StringType(metadata=dict(protobuf_field='value'))
+
+        custom_inner = types.MessageType(InnerMsgModel, metadata=dict(protobuf_field='inner'))
+        custom_other = StringType(metadata=dict(protobuf_field='other'))
+
+    return ModelFieldRenamed
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({
+        'inner': {'value': 'foo'},
+        'other': 'bar',
+    })
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.HasField('inner')
+    assert msg.inner.value == 'foo'
+    assert msg.other == 'bar'
+
+
+def test_optional_unsets(model_class_optional):
+    model = model_class_optional({'inner': Unset})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert not msg.HasField('inner')
+    assert msg.other == ''
+
+
+def test_renamed_all_set(model_class_field_renamed):
+    model = model_class_field_renamed({
+        'custom_inner': {'custom_value': 'foo'},
+        'custom_other': 'bar',
+    })
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.inner.value == 'foo'
+    assert msg.other == 'bar'
+
+
+def test_round_trip(model_class_optional):
+    msg = pb2.Nested()
+    msg.inner.value = 'foo'
+    msg.other = 'bar'
+
+    assert model_class_optional.load_protobuf(msg).to_protobuf() == msg
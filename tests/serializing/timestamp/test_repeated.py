@@ -0,0 +1,75 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime, timezone
+
+import pytest
+from google.protobuf import timestamp_pb2
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.RepeatedTimestamp()
+    msg.value.extend([
+        timestamp_pb2.Timestamp(seconds=12324346, nanos=333222111),
+        timestamp_pb2.Timestamp(seconds=-86400, nanos=1),
+        timestamp_pb2.Timestamp(),
+    ])
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set():
+
+    class ModelOptional(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType())
+
+    model = ModelOptional({'value': [
+        datetime(1970, 5, 23, 15, 25, 46, 333, tzinfo=timezone.utc),
+        datetime(1970, 1, 1, tzinfo=timezone.utc),
+    ]})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert list(msg.value) == [
+        timestamp_pb2.Timestamp(seconds=12324346, nanos=333000),
+        timestamp_pb2.Timestamp(),
+    ]
+
+
+def test_nanos_round_trip(msg_all_set):
+
+    class ModelNanos(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType(as_nanos=True))
+
+    model = ModelNanos.load_protobuf(msg_all_set)
+    model.validate()
+
+    assert model.value == [12324346333222111, -86400 * 10**9 + 1, 0]
+    assert model.to_protobuf() == msg_all_set
+
+
+@pytest.mark.parametrize('as_nanos', [False, True])
+def test_array_round_trip(msg_all_set, as_nanos):
+    pytest.importorskip('numpy')
+
+    class ModelArray(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType(as_nanos=as_nanos), as_array=True)
+
+    model = ModelArray.load_protobuf(msg_all_set)
+    model.validate()
+
+    assert model.to_protobuf() == msg_all_set
+    assert model.to_primitive()['value'][2] == (0 if as_nanos else datetime(1970, 1, 1, tzinfo=timezone.utc))
@@ -0,0 +1,144 @@
+# -*- coding:utf-8 -*-
+from datetime import datetime, timezone
+
+import pytest
+from google.protobuf import timestamp_pb2
+from schematics.exceptions import DataError
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+DUMMY_DATETIME = datetime(1970, 5, 23, 15, 25, 46, 333, tzinfo=timezone.utc)
+
+
+##########################################
+#  Model fixtures                        #
+##########################################
+
+@pytest.fixture
+def model_class_optional():
+
+    class ModelOptional(Model, protobuf_message=pb2.Timestamp):
+        value = types.TimestampType()
+
+    return ModelOptional
+
+
+@pytest.fixture
+def model_class_nanos():
+
+    class ModelNanos(Model, protobuf_message=pb2.Timestamp):
+        value = types.TimestampType(as_nanos=True)
+
+    return ModelNanos
+
+
+@pytest.fixture
+def model_class_oneof():
+
+    class ModelOneOf(Model, protobuf_message=pb2.OneOfTimestamp):
+        inner = types.OneOfType(variants_spec={
+            'value1': types.StringWrapperType(),
+            'value2': types.TimestampType(),
+        })
+
+    return ModelOneOf
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_optional_all_set(model_class_optional):
+    model = model_class_optional({'value': DUMMY_DATETIME})
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert msg.HasField('value')
+    assert msg.value == timestamp_pb2.Timestamp(seconds=12324346, nanos=333000)
+
+
+def test_optional_unsets(model_class_optional):
+    model = model_class_optional()
+    model.validate()
+
+    msg = model.to_protobuf()
+
+    assert not msg.HasField('value')
+
+
+def test_epoch(model_class_optional):
+    model = model_class_optional({'value': datetime(1970, 1, 1, tzinfo=timezone.utc)})
+
+    msg = model.to_protobuf()
+
+    assert msg.HasField('value')
+    assert msg.value == timestamp_pb2.Timestamp()
+
+
+@pytest.mark.parametrize('value, seconds, nanos', [
+    (datetime(1970, 5, 23, 15, 25, 46, 333), 12324346, 333000),
+    (datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc), -1, 500000000),
+])
+def test_naive_and_negative(model_class_optional, value, seconds, nanos):
+    msg = model_class_optional({'value': value}).to_protobuf()
+
+    assert msg.value == timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
+
+
+def test_round_trip(model_class_optional):
+    msg = pb2.Timestamp()
+    msg.value.seconds = 12324346
+    msg.value.nanos = 333000
+
+    model = model_class_optional.load_protobuf(mimic_protobuf_wire_transfer(msg))
+
+    assert model.value == DUMMY_DATETIME
+    assert model.to_protobuf() == msg
+
+
+def test_nanos_round_trip(model_class_nanos):
+    msg = pb2.Timestamp()
+    msg.value.seconds = -12324346
+    msg.value.nanos = 333222111
+
+    model = model_class_nanos.load_protobuf(mimic_protobuf_wire_transfer(msg))
+    model.validate()
+
+    assert model.value == -12324346 * 10**9 + 333222111
+    assert model.to_protobuf() == msg
+
+
+def test_nanos_convert(model_class_nanos):
+    model = model_class_nanos({'value': DUMMY_DATETIME})
+    model.validate()
+
+    assert model.value == 12324346000333000
+
+    model.value = timestamp_pb2.Timestamp(seconds=1, nanos=2)
+    model.validate()
+
+    assert model.value == 1000000002
+
+
+def test_convert_invalid(model_class_optional, model_class_nanos):
+    for model_class in (model_class_optional, model_class_nanos):
+        model = model_class()
+        model.value = 'not a timestamp'
+
+        with pytest.raises(DataError):
+            model.validate()
+
+
+def test_oneof(model_class_oneof):
+    msg = pb2.OneOfTimestamp()
+    msg.value2.seconds = 12324346
+    msg.value2.nanos = 333000
+
+    model = model_class_oneof.load_protobuf(mimic_protobuf_wire_transfer(msg))
+
+    assert model.to_protobuf() == msg
@@ -0,0 +1,193 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import Model
+from tests import schematics_proto3_tests_pb2 as pb2
+
+pyarrow = pytest.importorskip('pyarrow')
+
+# pylint: disable=wrong-import-position
+from schematics_proto3.arrow import arrow_schema, to_arrow, to_pandas, to_record_batch  # noqa: E402
+
+
+class Enum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType()
+
+
+class ModelWrapped(Model, protobuf_message=pb2.WrappedInt64):
+    wrapped = types.IntWrapperType()
+
+
+class ModelInt32(Model, protobuf_message=pb2.Int32):
+    value = IntType()
+
+
+class ModelEnum(Model, protobuf_message=pb2.SimpleEnum):
+    value = types.EnumType(Enum)
+
+
+class ModelRepeatedEnum(Model, protobuf_message=pb2.RepeatedEnum):
+    value = types.RepeatedType(types.EnumType(Enum))
+
+
+class RepeatedInnerMsgModel(Model, protobuf_message=pb2.RepeatedNested.Inner):
+    value = StringType()
+
+
+class ModelRepeatedNested(Model, protobuf_message=pb2.RepeatedNested):
+    inner = types.RepeatedType(types.MessageType(RepeatedInnerMsgModel))
+
+
+class ModelOneOf(Model, protobuf_message=pb2.OneOfEnum):
+    inner = types.OneOfType(variants_spec={
+        'value1': types.StringWrapperType(),
+        'value2': types.EnumType(Enum),
+    })
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_schema():
+    assert arrow_schema(ModelWrapped).field('wrapped').type == pyarrow.int64()
+    assert arrow_schema(ModelInt32).field('value').type == pyarrow.int32()
+    assert arrow_schema(ModelEnum).field('value').type == pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    assert arrow_schema(ModelNested) == pyarrow.schema([
+        pyarrow.field('inner', pyarrow.struct([pyarrow.field('value', pyarrow.string())])),
+        pyarrow.field('other', pyarrow.string()),
+    ])
+    assert arrow_schema(ModelRepeatedNested).field('inner').type == pyarrow.list_(
+        pyarrow.struct([pyarrow.field('value', pyarrow.string())])
+    )
+    assert arrow_schema(ModelOneOf).field('inner').type == pyarrow.struct([
+        pyarrow.field('variant', pyarrow.dictionary(pyarrow.int32(), pyarrow.string())),
+        pyarrow.field('value1', pyarrow.string()),
+        pyarrow.field('value2', pyarrow.dictionary(pyarrow.int32(), pyarrow.string())),
+    ])
+
+
+def test_wrapper_unset__null():
+    models = [
+        ModelWrapped.load_protobuf(pb2.WrappedInt64(wrapped={'value': 42})),
+        ModelWrapped.load_protobuf(pb2.WrappedInt64()),
+    ]
+
+    table = to_arrow(models)
+
+    assert table.column('wrapped').to_pylist() == [42, None]
+    assert table.column('wrapped').null_count == 1
+
+
+def test_nested():
+    msg = pb2.Nested(other='other')
+    msg.inner.value = 'value'
+    models = [
+        ModelNested.load_protobuf(msg),
+        ModelNested.load_protobuf(pb2.Nested()),
+    ]
+
+    batch = to_record_batch(models)
+
+    assert isinstance(batch, pyarrow.RecordBatch)
+    assert batch.to_pylist() == [
+        {'inner': {'value': 'value'}, 'other': 'other'},
+        {'inner': None, 'other': ''},
+    ]
+
+
+def test_enum():
+    models = [
+        ModelEnum.load_protobuf(pb2.SimpleEnum(value=pb2.Enum.SECOND)),
+        ModelEnum.load_protobuf(pb2.SimpleEnum(value=pb2.Enum.FIRST)),
+        ModelEnum.load_protobuf(pb2.SimpleEnum()),
+    ]
+
+    column = to_arrow(models).column('value').combine_chunks()
+
+    assert column.dictionary.to_pylist() == ['UNKNOWN', 'FIRST', 'SECOND']
+    assert column.indices.to_pylist() == [2, 1, 0]
+    assert column.to_pylist() == ['SECOND', 'FIRST', 'UNKNOWN']
+
+
+def test_repeated():
+    models = [
+        ModelRepeatedEnum.load_protobuf(pb2.RepeatedEnum(value=[pb2.Enum.FIRST, pb2.Enum.SECOND])),
+        ModelRepeatedEnum.load_protobuf(pb2.RepeatedEnum()),
+        ModelRepeatedNested.load_protobuf(pb2.RepeatedNested(inner=[{'value': 'a'}, {'value': 'b'}])),
+    ]
+
+    assert to_arrow(models[:2]).column('value').to_pylist() == [['FIRST', 'SECOND'], None]
+    assert to_arrow(models[2:]).column('inner').to_pylist() == [[{'value': 'a'}, {'value': 'b'}]]
+
+
+def test_repeated_array():
+    pytest.importorskip('numpy')
+
+    class ModelTimestampArray(Model, protobuf_message=pb2.RepeatedTimestamp):
+        value = types.RepeatedType(types.TimestampType(), as_array=True)
+
+    msg = pb2.RepeatedTimestamp()
+    msg.value.add(seconds=5, nanos=7)
+    msg.value.add(seconds=6)
+    models = [
+        ModelTimestampArray.load_protobuf(msg),
+        ModelTimestampArray.load_protobuf(pb2.RepeatedTimestamp()),
+    ]
+
+    column = to_arrow(models).column('value')
+
+    assert column.type == pyarrow.list_(pyarrow.timestamp('ns', tz='UTC'))
+    assert column.chunk(0).offsets.to_pylist() == [0, 2, 2]
+    assert column.chunk(0).values.cast(pyarrow.int64()).to_pylist() == [5000000007, 6000000000]
+    assert column.null_count == 1
+
+
+def test_oneof():
+    models = [
+        ModelOneOf.load_protobuf(pb2.OneOfEnum(value1={'value': 'text'})),
+        ModelOneOf.load_protobuf(pb2.OneOfEnum(value2=pb2.Enum.FIRST)),
+        ModelOneOf.load_protobuf(pb2.OneOfEnum()),
+    ]
+
+    assert to_arrow(models).column('inner').to_pylist() == [
+        {'variant': 'value1', 'value1': 'text', 'value2': None},
+        {'variant': 'value2', 'value1': None, 'value2': 'FIRST'},
+        None,
+    ]
+
+
+def test_empty():
+    with pytest.raises(ValueError):
+        to_arrow([])
+
+    table = to_arrow([], ModelNested)
+
+    assert table.num_rows == 0
+    assert table.schema == arrow_schema(ModelNested)
+
+
+def test_to_pandas():
+    pytest.importorskip('pandas')
+    models = [
+        ModelWrapped.load_protobuf(pb2.WrappedInt64(wrapped={'value': 42})),
+        ModelWrapped.load_protobuf(pb2.WrappedInt64()),
+    ]
+
+    frame = to_pandas(models)
+
+    assert list(frame.columns) == ['wrapped']
+    assert frame['wrapped'].iloc[0] == 42
+    assert frame['wrapped'].isna().tolist() == [False, True]
@@ -0,0 +1,67 @@
+# -*- coding:utf-8 -*-
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.cases import get_cases, make_depth_case
+from benchmarks.compare import compare
+from benchmarks.memory import run_memory
+from benchmarks.runner import OPERATIONS, run
+from benchmarks.startup import run_startup
+
+
+def test_depth_case():
+    case = make_depth_case(3)
+    model = case.model_class.load_protobuf(case.make_message(0))
+
+    assert model.to_native() == {
+        'value': 'level 3',
+        'child': {'value': 'level 2', 'child': {'value': 'level 1', 'child': {'value': 'level 0'}}},
+    }
+
+
+def test_cases_load():
+    for case in get_cases(depth=2):
+        msg = case.make_message(3)
+        model = case.model_class.load_protobuf(msg)
+        model.validate()
+
+
+def test_run_and_compare():
+    cases = get_cases(names=['nested', 'repeated_primitive'])
+    old_run = run(cases, size=2, repeat=1, number=1)
+    new_run = run(cases[:1], operations=['parse'], size=2, repeat=1, number=1)
+
+    assert len(old_run['results']) == 2 * len(OPERATIONS)
+    assert all('error' not in result for result in old_run['results'])
+    json.dumps(old_run)
+
+    differences = compare(old_run, new_run)
+
+    assert (differences[0].case, differences[0].operation) == ('nested', 'parse')
+    assert differences[0].ratio is not None
+    assert all(diff.new is None for diff in differences[1:])
+
+
+def test_cli(tmp_path, capsys):
+    output = tmp_path / 'run.json'
+    args = ['run', '--case', 'simple_enum', '--size', '1', '--repeat', '1', '--number', '1', '-o', str(output)]
+
+    assert main(args) == 0
+    assert main(['compare', str(output), str(output), '--fail-on-regression']) == 0
+    assert 'simple_enum' in capsys.readouterr().out
+
+
+def test_startup():
+    results = run_startup(enum_sizes=(3, 200), repeat=1, number=1)
+
+    assert [result['case'] for result in results['results']] == ['enum_3', 'enum_200']
+    assert all('error' not in result for result in results['results'])
+
+
+def test_memory(capsys):
+    results = run_memory(get_cases(names=['nested', 'repeated_nested']), size=2, count=10)
+
+    assert [result['operation'] for result in results['results']] == ['message', 'model', 'compact'] * 2
+    assert all('error' not in result for result in results['results'])
+    assert main(['memory', '--case', 'simple_enum', '--count', '10']) == 0
+    assert 'simple_enum' in capsys.readouterr().out
@@ -0,0 +1,156 @@
+# -*- coding:utf-8 -*-
+import pickle
+
+import pytest
+from schematics.exceptions import DataError
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.compact import CompactRecord, get_compact_class
+from schematics_proto3.models import Model
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner, compact=True):
+    value = StringType()
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested, compact=True):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType(required=True)
+
+
+class RepeatedInnerMsgModel(Model, protobuf_message=pb2.RepeatedNested.Inner, compact=True):
+    value = StringType(max_length=3)
+
+
+class ModelRepeatedNested(Model, protobuf_message=pb2.RepeatedNested, compact=True):
+    inner = types.RepeatedType(types.MessageType(RepeatedInnerMsgModel))
+
+
+class ModelRegular(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType()
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_all_set():
+    msg = pb2.Nested(other='other')
+    msg.inner.value = 'value'
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+@pytest.fixture
+def msg_repeated():
+    msg = pb2.RepeatedNested()
+    msg.inner.add(value='a')
+    msg.inner.add(value='b')
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_load(msg_all_set, trusted):
+    record = ModelNested.load_compact(msg_all_set, trusted=trusted)
+
+    assert isinstance(record, CompactRecord)
+    assert not hasattr(record, '__dict__')
+    assert isinstance(record.inner, get_compact_class(InnerMsgModel))
+    assert record.inner.value == 'value'
+    assert record.other == 'other'
+
+
+def test_api_matches_model(msg_all_set):
+    model = ModelNested.load_protobuf(msg_all_set)
+    record = ModelNested.load_compact(msg_all_set)
+
+    assert record.to_native() == model.to_native()
+    assert record.to_primitive() == model.to_primitive()
+    assert record.to_protobuf() == model.to_protobuf() == msg_all_set
+    assert record.to_bytes() == model.to_bytes()
+    assert model.to_compact() == record
+
+
+def test_unsets():
+    record = ModelNested.load_compact(pb2.Nested(other='other'))
+
+    assert record.inner is Unset
+    assert not record.to_protobuf().HasField('inner')
+
+
+def test_required(msg_all_set):
+    record = ModelNested.load_compact(msg_all_set)
+    record.other = None
+
+    with pytest.raises(DataError):
+        record.validate()
+
+
+def test_repeated(msg_repeated):
+    record = ModelRepeatedNested.load_compact(msg_repeated)
+    record.validate()
+
+    assert [item.value for item in record.inner] == ['a', 'b']
+    assert all(isinstance(item, CompactRecord) for item in record.inner)
+    assert record.to_protobuf() == msg_repeated
+
+    record.inner[0].value = 'too long'
+
+    with pytest.raises(DataError):
+        record.validate()
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_to_protobuf_into_source(msg_repeated, trusted):
+    expected = pb2.RepeatedNested()
+    expected.CopyFrom(msg_repeated)
+    record = ModelRepeatedNested.load_compact(msg_repeated, trusted=trusted)
+
+    assert record.to_protobuf(into=msg_repeated) is msg_repeated
+    assert msg_repeated == expected
+
+
+def test_to_model(msg_all_set):
+    model = ModelNested.load_compact(msg_all_set).to_model()
+
+    assert isinstance(model, ModelNested)
+    assert isinstance(model.inner, InnerMsgModel)
+    assert model.to_protobuf() == msg_all_set
+
+
+def test_pickle(msg_all_set):
+    record = ModelNested.load_compact(msg_all_set)
+
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_not_compact(msg_all_set):
+    with pytest.raises(RuntimeError):
+        get_compact_class(ModelRegular)
+
+    with pytest.raises(RuntimeError):
+        ModelRegular.load_compact(msg_all_set)
+
+    with pytest.raises(RuntimeError):
+        ModelRegular.load_protobuf(msg_all_set).to_compact()
+
+
+def test_append_field(msg_all_set):
+
+    class ModelExtended(Model, protobuf_message=pb2.Nested, compact=True):
+        other = StringType()
+
+    ModelExtended._append_field('inner', types.MessageType(InnerMsgModel))  # pylint: disable=protected-access
+
+    assert ModelExtended.load_compact(msg_all_set).inner.value == 'value'
@@ -0,0 +1,136 @@
+# -*- coding:utf-8 -*-
+import pytest
+from google.protobuf.message import DecodeError
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.enum import ProtobufEnum
+from schematics_proto3.models import Model
+from schematics_proto3.oneof import OneOfVariant
+from schematics_proto3.types.base import ProtobufTypeMixin
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+class DecoderEnum(ProtobufEnum, protobuf_enum=pb2.Enum):
+    pass
+
+
+class InnerModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+class NestedModel(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerModel)
+    other = StringType()
+
+
+class RepeatedEnumModel(Model, protobuf_message=pb2.RepeatedEnum):
+    value = types.RepeatedType(types.EnumType(DecoderEnum))
+
+
+class OneOfModel(Model, protobuf_message=pb2.OneOfPrimitive):
+    inner = types.OneOfType(variants_spec={
+        'value1': IntType(),
+        'value2': StringType(),
+    })
+
+
+class CustomStringType(ProtobufTypeMixin, StringType):
+
+    def convert_protobuf(self, msg, field_name, field_names):
+        return getattr(msg, field_name).upper()
+
+
+class CustomModel(Model, protobuf_message=pb2.String):
+    value = CustomStringType()
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_nested(trusted):
+    msg = pb2.Nested(other='other')
+    msg.inner.value = 'value'
+
+    model = NestedModel.decode(msg.SerializeToString(), trusted=trusted)
+
+    assert model.to_native() == {'inner': {'value': 'value'}, 'other': 'other'}
+    assert model.to_protobuf() == msg
+
+
+@pytest.mark.parametrize('buf_type', [bytearray, memoryview])
+def test_bytes_like(buf_type):
+    msg = pb2.Nested(other='other')
+
+    assert NestedModel.decode(buf_type(msg.SerializeToString())).other == 'other'
+
+
+def test_packed_and_unpacked():
+    packed = pb2.RepeatedEnum(value=[pb2.Enum.FIRST, pb2.Enum.SECOND]).SerializeToString()
+    unpacked = b'\x08\x02'
+
+    model = RepeatedEnumModel.decode(packed + unpacked)
+
+    assert model.value == [DecoderEnum.FIRST, DecoderEnum.SECOND, DecoderEnum.SECOND]
+
+
+def test_unknown_fields_skipped():
+    msg = pb2.Nested(other='other')
+    # varint, 64-bit, length delimited and 32-bit fields of unknown numbers.
+    unknown = b'\x78\x96\x01' + b'\x81\x01' + b'\x00' * 8 + b'\x8a\x01\x02ab' + b'\x95\x01' + b'\x00' * 4
+
+    model = NestedModel.decode(unknown + msg.SerializeToString() + unknown)
+
+    assert model.other == 'other'
+    assert model.inner is Unset
+
+
+def test_singular_message_merged():
+    first = pb2.Nested()
+    first.inner.value = 'first'
+    second = pb2.Nested(other='second')
+    second.inner.SetInParent()
+
+    model = NestedModel.decode(first.SerializeToString() + second.SerializeToString())
+
+    assert model.inner.value == 'first'
+    assert model.other == 'second'
+
+
+def test_oneof_last_wins():
+    buf = pb2.OneOfPrimitive(value1=1).SerializeToString() + pb2.OneOfPrimitive(value2='two').SerializeToString()
+
+    assert OneOfModel.decode(buf).inner == OneOfVariant('value2', 'two')
+    assert OneOfModel.decode(pb2.OneOfPrimitive(value1=0).SerializeToString()).inner == OneOfVariant('value1', 0)
+
+
+def test_truncated():
+    msg = pb2.Nested(other='other')
+    msg.inner.value = 'value'
+
+    with pytest.raises(DecodeError):
+        NestedModel.decode(msg.SerializeToString()[:-1])
+
+
+@pytest.mark.parametrize('buf', [
+    # Field number 0, on its own and inside a group.
+    b'\x00\x01',
+    b'\x1b\x00\x01\x1c',
+    # Group of field 3 ended by end-group tag of field 4.
+    b'\x1b\x24',
+])
+def test_invalid_tags(buf):
+    with pytest.raises(DecodeError):
+        NestedModel.decode(buf)
+
+
+def test_invalid_utf8():
+    with pytest.raises(DecodeError):
+        NestedModel.decode(b'\x12\x01\xff')
+
+
+def test_custom_type_fallback():
+    assert CustomModel.decode(pb2.String(value='value').SerializeToString()).value == 'VALUE'
@@ -0,0 +1,81 @@
+# -*- coding:utf-8 -*-
+
+import pytest
+from google.protobuf import descriptor_pb2, descriptor_pool
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+
+from schematics_proto3 import enum as enum_module
+from schematics_proto3.enum import ProtobufEnum
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+def make_protobuf_enum(size):
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f'tests/large_enum_{size}.proto',
+        package=f'schematics_proto3.tests.large{size}',
+        syntax='proto3',
+    )
+    enum_proto = file_proto.enum_type.add(name='Large')
+    enum_proto.options.allow_alias = True
+
+    for number in range(size):
+        enum_proto.value.add(name=f'VALUE_{number}', number=number)
+    enum_proto.value.add(name='ALIAS', number=5)
+    enum_proto.value.add(name='NEGATIVE', number=-1)
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    return EnumTypeWrapper(pool.FindEnumTypeByName(f'schematics_proto3.tests.large{size}.Large'))
+
+
+def describe(enum_cls):
+    return {
+        'members': [(member.name, member.value) for member in enum_cls],
+        'names': list(enum_cls.__members__),
+        'len': len(enum_cls),
+        'by_value': enum_cls(7).name,
+        'alias': enum_cls['ALIAS'] is enum_cls.VALUE_5,
+        'negative': enum_cls(-1).name,
+        'by_number': enum_cls.members_by_number[3].name,
+    }
+
+
+@pytest.mark.parametrize('threshold', [1, 10 ** 9])
+def test_large_enum(monkeypatch, threshold):
+    protobuf_enum = make_protobuf_enum(300)
+    monkeypatch.setattr(enum_module, 'LARGE_ENUM_THRESHOLD', 10 ** 9)
+
+    class Regular(ProtobufEnum, protobuf_enum=protobuf_enum):
+        pass
+
+    monkeypatch.setattr(enum_module, 'LARGE_ENUM_THRESHOLD', threshold)
+
+    class Large(ProtobufEnum, protobuf_enum=protobuf_enum):
+        pass
+
+    assert describe(Large) == describe(Regular)
+    assert Large.VALUE_5 is Large.ALIAS
+    assert Large.VALUE_5 == 5
+    assert Large.VALUE_5 in Large
+
+    with pytest.raises(AttributeError):
+        Large.VALUE_1 = 3
+
+    with pytest.raises(TypeError):
+        class Sub(Large):  # pylint: disable=unused-variable
+            pass
+
+
+def test_excess_members():
+    with pytest.raises(RuntimeError) as ex:
+        class Excess(ProtobufEnum, protobuf_enum=pb2.Enum):  # pylint: disable=unused-variable
+            THIRD = 3
+
+    assert 'THIRD' in str(ex.value)
+
+
+def test_not_protobuf_enum():
+    with pytest.raises(RuntimeError):
+        class Excess(ProtobufEnum, protobuf_enum=object()):  # pylint: disable=unused-variable
+            pass
@@ -0,0 +1,143 @@
+# -*- coding:utf-8 -*-
+import pytest
+from google.protobuf.field_mask_pb2 import FieldMask
+from schematics.exceptions import DataError
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.oneof import OneOfVariant
+from schematics_proto3.unset import Unset
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.envelope import Envelope, Header, make_envelope_models, msg_all_set  # pylint: disable=unused-import
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+
+HeaderModel, ItemModel, EnvelopeModel = make_envelope_models()
+
+
+class OneOfModel(Model, protobuf_message=pb2.OneOfPrimitive):
+    inner = types.OneOfType(variants_spec={
+        'value1': IntType(),
+        'value2': StringType(),
+    })
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def msg_patch():
+    msg = Envelope(kind='patched')
+    msg.header.trace_id = 'patched'
+    msg.items.add(name='b', size=2)
+
+    return mimic_protobuf_wire_transfer(msg)
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_export(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf(field_mask=FieldMask(paths=['kind', 'header.tenant_id']))
+
+    expected = Envelope(kind='kind')
+    expected.header.tenant_id = 'tenant'
+
+    assert msg == expected
+
+
+def test_export_paths(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+
+    assert model.to_protobuf(field_mask=['items']) == Envelope(items=msg_all_set.items)
+    assert model.to_protobuf(field_mask=['header.tenant_id', 'header']).header == msg_all_set.header
+    assert model.to_protobuf(field_mask=[]) == Envelope()
+
+
+def test_export_nested_presence():
+    model = EnvelopeModel.load_protobuf(Envelope(header=Header(trace_id='trace')))
+    msg = model.to_protobuf(field_mask=['header.tenant_id'])
+
+    assert msg.HasField('header')
+    assert msg.header == Header()
+
+
+def test_apply(msg_all_set, msg_patch):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    model.apply_protobuf(msg_patch, FieldMask(paths=['kind', 'header.trace_id', 'items']))
+    model.validate()
+
+    assert model.to_native() == {
+        'header': {'tenant': 'tenant', 'trace_id': 'patched'},
+        'kind': 'patched',
+        'items': [{'name': 'b', 'size': 2}],
+    }
+
+
+def test_apply_clears(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    model.apply_protobuf(Envelope(), ['kind', 'header.trace_id', 'items'])
+    model.validate()
+
+    assert model.kind == ''
+    assert model.header.trace_id == ''
+    assert model.header.tenant == 'tenant'
+    assert model.items is Unset
+
+
+def test_apply_creates_nested(msg_patch):
+    model = EnvelopeModel()
+    model.apply_protobuf(msg_patch, ['kind', 'header.trace_id'])
+
+    model.validate()
+
+    # Nested model is created with defaults of fields outside of the mask.
+    assert model.header.trace_id == 'patched'
+    assert model.header.tenant == ''
+
+
+def test_apply_validated(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    model.apply_protobuf(Envelope(header=Header(trace_id='too long trace')), ['header.trace_id'])
+
+    with pytest.raises(DataError):
+        model.validate()
+
+
+def test_oneof():
+    model = OneOfModel.load_protobuf(pb2.OneOfPrimitive(value1=1))
+
+    assert model.to_protobuf(field_mask=['value2']) == pb2.OneOfPrimitive()
+    assert model.to_protobuf(field_mask=['value1']) == pb2.OneOfPrimitive(value1=1)
+    assert model.to_protobuf(field_mask=['inner']) == pb2.OneOfPrimitive(value1=1)
+
+    # Variant outside of the mask is kept.
+    model.apply_protobuf(pb2.OneOfPrimitive(), ['value2'])
+    assert model.inner == OneOfVariant('value1', 1)
+
+    model.apply_protobuf(pb2.OneOfPrimitive(value2='two'), ['value2'])
+    assert model.inner == OneOfVariant('value2', 'two')
+
+    model.apply_protobuf(pb2.OneOfPrimitive(), ['value2'])
+    assert model.inner is Unset
+
+
+@pytest.mark.parametrize('paths, exception', [
+    (['unknown'], ValueError),
+    (['header.tenant'], ValueError),
+    (['kind.nested'], ValueError),
+    (['items.name'], ValueError),
+    ('kind', TypeError),
+])
+def test_invalid_paths(msg_all_set, paths, exception):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+
+    with pytest.raises(exception):
+        model.to_protobuf(field_mask=paths)
+
+    with pytest.raises(exception):
+        model.apply_protobuf(msg_all_set, paths)
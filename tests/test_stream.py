@@ -0,0 +1,152 @@
+# -*- coding:utf-8 -*-
+import io
+import mmap
+
+import pytest
+from google.protobuf.message import DecodeError
+from schematics.types import StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.stream import iter_delimited, read_delimited, write_delimited
+from tests import schematics_proto3_tests_pb2 as pb2
+
+
+class InnerMsgModel(Model, protobuf_message=pb2.Nested.Inner):
+    value = StringType()
+
+
+class ModelNested(Model, protobuf_message=pb2.Nested):
+    inner = types.MessageType(InnerMsgModel)
+    other = StringType()
+
+
+def make_models(count):
+    models = []
+
+    for idx in range(count):
+        msg = pb2.Nested(other='x' * idx)
+        if idx % 2:
+            msg.inner.value = f'inner-{idx}'
+        models.append(ModelNested.load_protobuf(msg))
+
+    return models
+
+
+@pytest.fixture
+def stream_data():
+    # Messages longer than 127 bytes need multi-byte length prefix.
+    models = make_models(200)
+    out = io.BytesIO()
+
+    assert write_delimited(out, models) == len(models)
+
+    return models, out.getvalue()
+
+
+class ShortReader(io.RawIOBase):
+    """
+    File object returning at most 7 bytes per read.
+    """
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._data.read(min(len(b), 7))
+        b[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class NonBlockingReader(io.RawIOBase):
+    """
+    Non-blocking file object without any data available.
+    """
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return None
+
+
+@pytest.mark.parametrize('chunk_size', [1, 16, 64 * 1024])
+def test_read_file(stream_data, chunk_size):
+    models, data = stream_data
+
+    loaded = list(read_delimited(ModelNested, io.BytesIO(data), chunk_size=chunk_size))
+
+    assert [model.to_native() for model in loaded] == [model.to_native() for model in models]
+
+
+def test_read_short_reads(stream_data):
+    models, data = stream_data
+
+    loaded = list(read_delimited(ModelNested, ShortReader(data), trusted=True, chunk_size=5))
+
+    assert [model.to_native() for model in loaded] == [model.to_native() for model in models]
+
+
+def test_read_non_blocking():
+    with pytest.raises(ValueError):
+        list(iter_delimited(NonBlockingReader()))
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+def test_read_buffer(stream_data, wrap):
+    models, data = stream_data
+
+    loaded = list(read_delimited(ModelNested, wrap(data), lazy=True))
+
+    assert [model.to_native() for model in loaded] == [model.to_native() for model in models]
+
+
+def test_read_mmap(stream_data, tmp_path):
+    models, data = stream_data
+    path = tmp_path / 'stream.bin'
+    path.write_bytes(data)
+
+    with open(path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        loaded = [model.to_native() for model in read_delimited(ModelNested, mapped)]
+
+    assert loaded == [model.to_native() for model in models]
+
+
+def test_write_messages():
+    out = io.BytesIO()
+    write_delimited(out, [pb2.Nested(other='foo'), pb2.Nested()])
+
+    assert [bytes(frame) for frame in iter_delimited(out.getvalue())] == [
+        pb2.Nested(other='foo').SerializeToString(),
+        b'',
+    ]
+
+
+@pytest.mark.parametrize('source_type', [bytes, io.BytesIO])
+def test_truncated(stream_data, source_type):
+    _, data = stream_data
+
+    with pytest.raises(DecodeError):
+        list(iter_delimited(source_type(data[:-3])))
+
+
+@pytest.mark.parametrize('source_type', [bytes, io.BytesIO])
+def test_max_message_size(stream_data, source_type):
+    models, data = stream_data
+
+    with pytest.raises(DecodeError):
+        list(iter_delimited(source_type(data), max_message_size=100))
+
+    assert len(list(read_delimited(ModelNested, source_type(data), max_message_size=1000))) == len(models)
+
+
+@pytest.mark.parametrize('source_type', [bytes, io.BytesIO])
+def test_hostile_length_prefix(source_type):
+    # Length prefix of 2^63 bytes must not be allocated.
+    data = b'\xff' * 8 + b'\x7f' + b'payload'
+
+    with pytest.raises(DecodeError):
+        list(iter_delimited(source_type(data)))
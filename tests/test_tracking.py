@@ -0,0 +1,144 @@
+# -*- coding:utf-8 -*-
+from unittest.mock import patch
+
+import pytest
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from schematics_proto3.oneof import OneOfVariant
+from tests import schematics_proto3_tests_pb2 as pb2
+from tests.utils.envelope import Envelope, make_envelope_models, msg_all_set  # pylint: disable=unused-import
+
+
+HeaderModel, ItemModel, EnvelopeModel = make_envelope_models(track_changes=True)
+_, _, UntrackedEnvelopeModel = make_envelope_models()
+
+
+class OneOfModel(Model, protobuf_message=pb2.OneOfPrimitive, track_changes=True):
+    inner = types.OneOfType(variants_spec={
+        'value1': IntType(),
+        'value2': StringType(),
+    })
+
+
+##########################################
+#  Message fixtures                      #
+##########################################
+
+@pytest.fixture
+def header_exports():
+    with patch.object(HeaderModel, 'to_protobuf', autospec=True, side_effect=Model.to_protobuf) as to_protobuf:
+        yield to_protobuf
+
+
+##########################################
+#  Tests                                 #
+##########################################
+
+def test_retained(msg_all_set, header_exports):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+
+    assert msg == msg_all_set
+    assert model.to_protobuf() is msg
+    assert header_exports.call_count == 1
+
+
+def test_changed_field(msg_all_set, header_exports):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.kind = 'other'
+
+    assert model.to_protobuf() is msg
+    assert msg.kind == 'other'
+    assert msg.header == msg_all_set.header
+    # Unchanged nested message is not exported again.
+    assert header_exports.call_count == 1
+
+
+def test_cleared_field(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.header = None
+    model['items'] = None
+
+    model.to_protobuf()
+
+    assert not msg.HasField('header')
+    assert not msg.items
+
+
+def test_nested_changed(msg_all_set, header_exports):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.header.trace_id = 'other'
+
+    model.to_protobuf()
+
+    assert msg.header.trace_id == 'other'
+    assert header_exports.call_count == 2
+
+
+def test_nested_exported_elsewhere(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.header.trace_id = 'other'
+    model.header.to_protobuf()
+
+    model.to_protobuf()
+
+    assert msg.header.trace_id == 'other'
+
+
+def test_list_changed_in_place(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.items.append(ItemModel({'name': 'c', 'size': 3}))
+    model.to_protobuf()
+
+    assert [item.name for item in msg.items] == ['a', 'b', 'c']
+
+    model.items[0].size = 10
+    model.to_protobuf()
+
+    assert [item.size for item in msg.items] == [10, 2, 3]
+
+
+def test_validate_keeps_nested(msg_all_set, header_exports):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    model.to_protobuf()
+    model.validate()
+    model.to_protobuf()
+
+    assert header_exports.call_count == 1
+
+
+def test_apply_protobuf(msg_all_set):
+    model = EnvelopeModel.load_protobuf(msg_all_set)
+    msg = model.to_protobuf()
+    model.apply_protobuf(Envelope(kind='patched'), ['kind'])
+
+    model.to_protobuf()
+
+    assert msg.kind == 'patched'
+
+
+def test_oneof():
+    model = OneOfModel.load_protobuf(pb2.OneOfPrimitive(value1=1))
+    msg = model.to_protobuf()
+    model.inner = OneOfVariant('value2', 'two')
+    model.to_protobuf()
+
+    assert msg == pb2.OneOfPrimitive(value2='two')
+
+    model.inner.value = 'three'
+    model.to_protobuf()
+
+    assert msg == pb2.OneOfPrimitive(value2='three')
+
+
+def test_untracked(msg_all_set):
+    model = UntrackedEnvelopeModel.load_protobuf(msg_all_set)
+
+    assert model.to_protobuf() is not model.to_protobuf()
@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+import pytest
+from schematics.types import IntType, StringType
+
+from schematics_proto3 import types
+from schematics_proto3.models import Model
+from tests.schematics_proto3_tests_pb2 import Envelope, Header, Item
+from tests.utils.wire import mimic_protobuf_wire_transfer
+
+__all__ = ['Envelope', 'Header', 'Item', 'make_envelope_models', 'msg_all_set']
+
+
+def make_envelope_models(**options):
+    """
+    Declare `Header`, `Item` and `Envelope` Models with class `options`
+    (e.g. `track_changes=True`). Tenant of the header is exposed under
+    a different name than in the message.
+    """
+
+    class HeaderModel(Model, protobuf_message=Header, **options):
+        tenant = StringType(required=True, metadata={'protobuf_field': 'tenant_id'})
+        trace_id = StringType(required=True, max_length=8)
+
+    class ItemModel(Model, protobuf_message=Item, **options):
+        name = StringType()
+        size = IntType(required=True)
+
+    class EnvelopeModel(Model, protobuf_message=Envelope, **options):
+        header = types.MessageType(HeaderModel, required=True)
+        kind = StringType(required=True)
+        items = types.RepeatedType(types.MessageType(ItemModel))
+
+    return HeaderModel, ItemModel, EnvelopeModel
+
+
+@pytest.fixture
+def msg_all_set():
+    msg = Envelope(kind='kind')
+    msg.header.tenant_id = 'tenant'
+    msg.header.trace_id = 'trace'
+    msg.items.add(name='a', size=1)
+    msg.items.add(name='b', size=2)
+
+    return mimic_protobuf_wire_transfer(msg)